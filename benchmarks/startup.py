@@ -0,0 +1,67 @@
+"""
+Hwp() 시작시간을 단계별로 측정하는 벤치마크 스크립트.
+
+Hwp.startup_timings에 기록된 단계(com_init, rot_lookup, standby, dispatch, visible, register_module, total)의
+중앙값을 아래 세 가지 경우로 나눠 출력한다.
+
+- cold: 대기 인스턴스 없이 매번 새 한/글을 띄우는 경우(new=True)
+- standby: Hwp.warm_standby()로 미리 띄워둔 인스턴스를 넘겨받는 경우(new=True)
+- attach: 실행 중인 한/글에 연결하는 경우(new=False, cache_moniker 사용/미사용)
+
+사용법:
+    python benchmarks/startup.py --repeat 5
+"""
+import argparse
+import statistics
+import time
+
+from pyhwpx import Hwp
+
+PHASES = ["com_init", "rot_lookup", "standby", "dispatch", "visible", "register_module", "total"]
+
+
+def run(label: str, repeat: int, make, cleanup) -> None:
+    samples = []
+    for _ in range(repeat):
+        hwp = make()
+        samples.append(hwp.startup_timings)
+        cleanup(hwp)
+    row = [label]
+    for phase in PHASES:
+        values = [timing[phase] for timing in samples if phase in timing]
+        row.append(f"{statistics.median(values) * 1000:9.1f}" if values else f"{'-':>9}")
+    print(" ".join(f"{cell:>15}" if i == 0 else cell for i, cell in enumerate(row)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hwp() 시작시간 단계별 측정(단위: ms, 중앙값)")
+    parser.add_argument("--repeat", type=int, default=5, help="경우별 반복 횟수")
+    parser.add_argument("--standby-wait", type=float, default=10.0, help="대기 인스턴스가 뜰 때까지 기다릴 시간(초)")
+    args = parser.parse_args()
+
+    print(" ".join([f"{'case':>15}"] + [f"{phase[:9]:>9}" for phase in PHASES]))
+
+    run("cold", args.repeat, lambda: Hwp(new=True, visible=False), lambda hwp: hwp.quit())
+
+    Hwp.warm_standby()
+
+    def from_standby() -> Hwp:
+        time.sleep(args.standby_wait)  # 다음 대기 인스턴스가 뜰 시간을 준다
+        return Hwp(new=True, visible=False)
+
+    run("standby", args.repeat, from_standby, lambda hwp: hwp.quit())
+    Hwp.warm_standby(False)
+
+    target = Hwp(new=True, visible=False)
+    try:
+        for cached in [False, True]:
+            Hwp.cache_moniker = cached
+            run(f"attach(cache={cached})", args.repeat,
+                lambda: Hwp(new=False, register_module=False), lambda hwp: None)
+    finally:
+        Hwp.cache_moniker = False
+        target.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,18 @@
 #
 #     sys.modules[__name__].Hwp = _get_Hwp()
 
-from .core import *
+import sys
+
+if sys.platform == "win32":  # 한/글 자동화(core)는 윈도우 전용. hml 등 오프라인 모듈은 어디서나 import 가능
+    from .core import *
+from .pool import HwpPool
+from .async_hwp import AsyncHwp
+from .convert import convert_tree
+from .corpus import extract_corpus, find_duplicates
+from .docdiff import diff
+from .download_cache import DownloadCache, get_download_cache, set_download_cache
+from .hwpx import HwpxWriter
+from .template import render_template
 from .version import __version__
 
 
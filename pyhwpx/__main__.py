@@ -0,0 +1,38 @@
+"""
+커맨드라인 도구. 한/글 없이 실행할 수 있는 기능만 제공한다.
+
+    python -m pyhwpx extract <폴더> --out corpus.jsonl --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .corpus import EXTRACT_PATTERNS, extract_corpus
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pyhwpx", description="pyhwpx 커맨드라인 도구")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    extract = commands.add_parser("extract", help="문서 보관함의 본문, 표, 필드 값을 JSON Lines/Parquet 파일로 뽑기")
+    extract.add_argument("src", help="문서 폴더(하위폴더 포함) 또는 파일 경로")
+    extract.add_argument("--out", required=True, help="출력 파일(.jsonl 또는 .parquet)")
+    extract.add_argument("--workers", type=int, default=None, help="프로세스 수(기본값: CPU 코어 수)")
+    extract.add_argument("--patterns", nargs="+", default=list(EXTRACT_PATTERNS), help="대상 파일의 glob 패턴")
+    extract.add_argument("--manifest", default=None, help="처리 기록 경로(기본값: 출력 파일 + .manifest.jsonl)")
+    extract.add_argument("-v", "--verbose", action="store_true", help="파일마다 처리시간 출력")
+
+    args = parser.parse_args(argv)
+    if args.command == "extract":
+        summary = extract_corpus(args.src, args.out, workers=args.workers, patterns=args.patterns,
+                                 manifest=args.manifest, verbose=args.verbose)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 1 if summary["failed"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
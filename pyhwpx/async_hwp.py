@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+if sys.platform == "win32":
+    import pythoncom
+else:
+    pythoncom = None
+
+__all__ = ["AsyncHwp"]
+
+
+def _default_factory(**kwargs):
+    from .core import Hwp
+
+    return Hwp(**kwargs)
+
+
+class AsyncHwp:
+    """
+    asyncio 환경에서 Hwp를 사용하기 위한 래퍼 클래스.
+
+    전용 스레드 하나가 CoInitialize를 실행하고 Hwp 인스턴스를 소유한다.
+    모든 메서드 호출은 큐를 통해 그 스레드로 순서대로 전달되고,
+    이벤트루프는 결과를 기다리는 동안 다른 작업을 계속 처리한다.
+
+    Hwp의 메서드는 이름 그대로 코루틴처럼 호출하면 되고(`await ahwp.table_to_df(0)`),
+    속성은 `await ahwp.get("PageCount")`처럼 읽는다.
+    여러 메서드를 한 번에 실행할 때는 run 메서드에 함수를 넘긴다.
+
+    생성자는 전용 스레드를 시작만 하고 바로 리턴하므로 이벤트루프를 막지 않는다.
+    한/글이 뜰 때까지 기다리려면 `await AsyncHwp.create(...)` 또는 `async with AsyncHwp(...)`를 사용한다.
+    (그냥 생성한 경우에도 요청은 큐에 쌓였다가 한/글이 뜨는 즉시 실행된다.)
+
+    타임아웃이 지나거나 호출한 태스크가 취소되면 await는 즉시 끝난다.
+    아직 시작하지 않은 요청은 실행되지 않고 버려지지만,
+    이미 한/글에서 실행 중인 호출은 중간에 멈출 수 없으므로 끝날 때까지 다음 요청이 대기한다.
+
+    Args:
+        new: Hwp 클래스의 new 인자
+        visible: Hwp 클래스의 visible 인자
+        register_module: Hwp 클래스의 register_module 인자
+        on_quit: Hwp 클래스의 on_quit 인자
+        timeout: 호출마다 적용할 기본 타임아웃(초). None이면 무한정 기다린다.
+        factory: Hwp 인스턴스를 만드는 함수(시험용 가짜 백엔드 등). 위의 Hwp 인자들을 키워드로 받는다.
+        quit: 닫을 때(close) 한/글을 종료(`hwp.quit(save=False)`)할지 여부.
+            None(기본값)이면 new=True로 새로 띄운 경우에만 종료하고, 기존 한/글 창에 연결한 경우에는 그대로 둔다.
+
+    Examples:
+        >>> import asyncio
+        >>> from pyhwpx import AsyncHwp
+        >>> async def main():
+        ...     async with AsyncHwp(new=True, visible=False) as ahwp:
+        ...         await ahwp.open("./example.hwp")
+        ...         df = await ahwp.table_to_df(0)
+        ...         pages = await ahwp.get("PageCount")
+        ...         title = await ahwp.run(lambda hwp: hwp.get_title(), timeout=5)
+        ...     return df, pages, title
+        >>> asyncio.run(main())
+    """
+
+    def __init__(
+            self,
+            new: bool = False,
+            visible: bool = True,
+            register_module: bool = True,
+            on_quit: bool = False,
+            timeout: Optional[float] = None,
+            factory: Optional[Callable[..., Any]] = None,
+            quit: Optional[bool] = None,
+    ):
+        self.timeout = timeout
+        self.quit_on_close = new if quit is None else quit
+        self._queue: "queue.Queue" = queue.Queue()
+        self._started: Future = Future()  # 한/글 생성이 끝나면 Hwp 클래스(또는 예외)가 담긴다.
+        self._cls = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._worker,
+            args=(factory or _default_factory, dict(new=new, visible=visible, register_module=register_module, on_quit=on_quit)),
+            name="AsyncHwp",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __repr__(self):
+        return f"<AsyncHwp: pending={self.pending}, closed={self._closed}>"
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncHwp":
+        """
+        AsyncHwp를 만들고, 전용 스레드에서 한/글이 뜰 때까지 이벤트루프를 막지 않고 기다리는 코루틴.
+        인자는 생성자와 같다. 한/글 생성에 실패하면 그 예외가 그대로 발생한다.
+
+        Examples:
+            >>> ahwp = await AsyncHwp.create(new=True, visible=False)
+        """
+        self = cls(*args, **kwargs)
+        await self.wait_ready()
+        return self
+
+    async def wait_ready(self) -> "AsyncHwp":
+        """
+        전용 스레드에서 한/글 생성이 끝날 때까지 기다리는 코루틴.
+        생성에 실패했다면 그 예외를 발생시키고 전용 스레드를 닫는다.
+        """
+        try:
+            # 기다리던 태스크가 취소되어도 생성 결과(_started)는 취소되지 않도록 shield
+            await asyncio.shield(asyncio.wrap_future(self._started))
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            await self.aclose()
+            raise
+        return self
+
+    def _worker(self, factory: Callable[..., Any], kwargs: dict) -> None:
+        if pythoncom is not None:
+            from .core import ensure_com_initialized
+
+            ensure_com_initialized()  # CoUninitialize는 스레드 종료시 한 번만 실행된다.
+        try:
+            hwp = factory(**kwargs)
+        except BaseException as e:
+            hwp, error = None, e
+            self._started.set_exception(e)
+        else:
+            error = None
+            self._cls = type(hwp)
+            self._started.set_result(self._cls)
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, func = item
+            if not future.set_running_or_notify_cancel():
+                continue  # 시작 전에 취소된 요청
+            if error is not None:  # 한/글 생성에 실패한 경우 모든 요청에 같은 예외 전달
+                future.set_exception(error)
+                continue
+            try:
+                future.set_result(func(hwp))
+            except BaseException as e:
+                future.set_exception(e)
+        if hwp is not None and self.quit_on_close:
+            try:
+                hwp.quit(save=False)
+            except Exception:
+                pass
+        del hwp
+
+    @property
+    def pending(self) -> int:
+        """
+        아직 실행되지 않고 큐에서 기다리는 요청 수
+        """
+        return self._queue.qsize()
+
+    def submit(self, func: Callable[[Any], Any]) -> Future:
+        """
+        전용 스레드에서 func(hwp)를 실행하도록 큐에 넣고 concurrent.futures.Future를 리턴한다.
+        (이벤트루프 밖의 동기 코드에서 사용할 때)
+        """
+        if self._closed:
+            raise RuntimeError("이미 닫힌 AsyncHwp입니다.")
+        if self._started.done() and self._started.exception() is not None:
+            raise self._started.exception()
+        future = Future()
+        self._queue.put((future, func))
+        return future
+
+    async def run(self, func: Callable[[Any], Any], timeout: Optional[float] = None) -> Any:
+        """
+        전용 스레드에서 func(hwp)를 실행하고 결과를 리턴하는 코루틴.
+
+        Args:
+            func: Hwp 인스턴스 하나를 인자로 받는 함수
+            timeout: 타임아웃(초). 생략하면 생성자의 timeout을 사용한다.
+
+        Returns:
+            func의 리턴값
+
+        Raises:
+            asyncio.TimeoutError: 타임아웃이 지난 경우
+        """
+        future = asyncio.wrap_future(self.submit(func))
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is None:
+            return await future
+        return await asyncio.wait_for(future, timeout)
+
+    async def call(self, name: str, *args, **kwargs) -> Any:
+        """
+        Hwp의 name 메서드를 전용 스레드에서 실행하는 코루틴.
+        `await ahwp.call("open", path)`는 `await ahwp.open(path)`와 같다.
+        """
+        return await self.run(lambda hwp: getattr(hwp, name)(*args, **kwargs))
+
+    async def get(self, name: str) -> Any:
+        """
+        Hwp의 속성값(예: "PageCount", "Path")을 전용 스레드에서 읽어오는 코루틴.
+        """
+        return await self.run(lambda hwp: getattr(hwp, name))
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._cls is not None and not callable(getattr(self._cls, name, None)):
+            raise AttributeError(
+                f"'{name}'은(는) Hwp의 메서드가 아닙니다. 속성은 await ahwp.get('{name}')으로 읽으세요."
+            )
+
+        async def method(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+    def close(self, wait: bool = True) -> None:
+        """
+        큐에 남은 요청을 모두 처리한 후 전용 스레드를 종료한다.
+        quit_on_close가 True이면(new=True로 띄운 경우 기본값) 한/글도 종료한다.
+
+        Args:
+            wait: True인 경우 스레드가 끝날 때까지 기다린다.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+        if wait:
+            self._thread.join()
+
+    async def aclose(self) -> None:
+        """
+        이벤트루프를 막지 않고 close를 실행하는 코루틴.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return await self.wait_ready()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
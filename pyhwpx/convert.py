@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import queue
+import shutil
+import threading
+from pathlib import Path
+from time import perf_counter, strftime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from .pool import HwpPool
+
+__all__ = ["convert_tree"]
+
+# 변환 포맷: (save_as에 넘길 format, 확장자)
+_FORMATS = {
+    "pdf": ("PDF", "pdf"),
+    "hwpx": ("HWPX", "hwpx"),
+    "docx": ("OOXML", "docx"),
+    "hwp": ("HWP", "hwp"),
+    "odt": ("ODT", "odt"),
+    "html": ("HTML", "html"),
+    "txt": ("TEXT", "txt"),
+}
+
+MANIFEST_NAME = ".pyhwpx_manifest.jsonl"
+
+
+def file_hash(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    파일 내용의 sha256 해시를 리턴하는 헬퍼함수.
+
+    Args:
+        path: 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path: Union[str, Path]) -> Dict[Tuple[str, str], dict]:
+    """
+    변환 기록(JSON Lines)을 읽어서 {(입력 해시, 출력 확장자): 마지막 기록} 사전으로 리턴하는 헬퍼함수.
+    같은 기록파일로 여러 포맷을 변환해도 서로의 결과물을 재사용하지 않도록 포맷별로 구분한다.
+    (format 항목이 없는 예전 기록은 출력경로의 확장자로 구분)
+    중간에 잘린 줄은 무시한다.
+    """
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            fmt = record.get("format") or os.path.splitext(record.get("output") or "")[1][1:].lower()
+            records[(record["hash"], fmt)] = record
+    return records
+
+
+def _default_convert(hwp, src: str, out: str, fmt: str) -> None:
+    if not hwp.open(src, arg="forceopen:true;suspendpassword:true;versionwarning:false"):
+        raise RuntimeError(f"파일을 열 수 없습니다: {src}")
+    try:
+        if not hwp.save_as(out, fmt):
+            raise RuntimeError(f"파일을 저장할 수 없습니다: {out}")
+    finally:
+        hwp.clear(option=1)
+
+
+def convert_tree(
+        src: Union[str, Path],
+        dst: Union[str, Path],
+        format: str = "pdf",
+        workers: int = 1,
+        patterns: Iterable[str] = ("*.hwp", "*.hwpx"),
+        retries: int = 1,
+        max_jobs: int = 50,
+        manifest: Optional[Union[str, Path]] = None,
+        factory: Optional[Callable[[], Any]] = None,
+        convert: Optional[Callable[[Any, str, str, str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    폴더 안의 한/글 문서를 모두 다른 포맷(pdf, hwpx, docx 등)으로 변환하는 함수.
+
+    src 폴더 구조를 그대로 dst 폴더에 만들면서 변환하며,
+    workers 개수만큼의 스레드가 각자 숨겨진 한/글 인스턴스(HwpPool)를 하나씩 사용한다.
+    변환 결과는 dst 폴더의 기록파일(manifest, JSON Lines)에
+    입력파일 해시, 포맷, 출력경로, 상태, 소요시간 순으로 한 줄씩 즉시 기록되므로,
+    중간에 멈추더라도 다시 실행하면 이어서 변환한다.
+
+    - 내용(해시)이 같은 파일이 같은 포맷으로 이미 변환되어 있으면 건너뛴다.
+      (경로만 다른 동일 파일은 기존 결과물을 복사한다.)
+    - 변환에 실패한 파일은 인스턴스를 새로 띄워서 retries번까지 다시 시도한다.
+
+    Args:
+        src: 원본 폴더
+        dst: 결과 폴더
+        format: 변환 포맷. "pdf", "hwpx", "docx", "hwp", "odt", "html", "txt" 중 하나
+        workers: 동시에 사용할 한/글 인스턴스 개수
+        patterns: 변환할 파일의 glob 패턴(하위폴더 포함)
+        retries: 실패시 재시도 횟수
+        max_jobs: 인스턴스 하나로 변환할 최대 파일 수(이후 새 인스턴스로 교체)
+        manifest: 기록파일 경로. 기본값은 dst 폴더의 ".pyhwpx_manifest.jsonl"
+        factory: 인스턴스를 만드는 함수(HwpPool의 factory 인자)
+        convert: 파일 하나를 변환하는 함수 convert(hwp, src, out, format). 시험용 가짜 백엔드 등에 사용
+
+    Returns:
+        {"done", "skipped", "copied", "failed", "elapsed"} 키를 갖는 요약 사전
+
+    Examples:
+        >>> import pyhwpx
+        >>> pyhwpx.convert_tree("./archive", "./pdf", "pdf", workers=4)
+        {'done': 1200, 'skipped': 0, 'copied': 3, 'failed': 2, 'elapsed': 1830.5}
+        >>> # 중간에 멈췄거나 파일이 추가된 경우 다시 실행하면 나머지만 변환
+        >>> pyhwpx.convert_tree("./archive", "./pdf", "pdf", workers=4)
+        {'done': 15, 'skipped': 1203, 'copied': 0, 'failed': 0, 'elapsed': 24.1}
+    """
+    if format.lower() not in _FORMATS:
+        raise ValueError(f"지원하지 않는 포맷입니다: {format} ({', '.join(_FORMATS)} 중 하나)")
+    hwp_format, ext = _FORMATS[format.lower()]
+    src, dst = Path(src).resolve(), Path(dst).resolve()
+    manifest = Path(manifest) if manifest else dst / MANIFEST_NAME
+    dst.mkdir(parents=True, exist_ok=True)
+    convert = convert or _default_convert
+
+    records = load_manifest(manifest)
+    summary = {"done": 0, "skipped": 0, "copied": 0, "failed": 0}
+    lock = threading.Lock()
+    started = perf_counter()
+
+    def write(record: dict) -> None:
+        record = {"hash": record.pop("hash"), "format": ext, **record, "time": strftime("%Y-%m-%d %H:%M:%S")}
+        with lock:
+            records[(record["hash"], ext)] = record
+            summary[record["status"]] += 1
+            with open(manifest, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def copy(path: Path, out: Path, digest: str) -> bool:
+        previous = records.get((digest, ext))
+        if not previous or previous["status"] not in ("done", "copied") or not os.path.exists(previous["output"]):
+            return False
+        if os.path.normcase(previous["output"]) == os.path.normcase(str(out)) or out.exists():
+            with lock:
+                summary["skipped"] += 1
+            return True
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tic = perf_counter()
+        shutil.copy2(previous["output"], out)
+        write({"hash": digest, "src": str(path), "output": str(out), "status": "copied",
+               "duration": round(perf_counter() - tic, 3), "attempts": 0, "error": None})
+        return True
+
+    files = sorted({p for pattern in patterns for p in src.rglob(pattern) if p.is_file()})
+    tasks: "queue.Queue" = queue.Queue()
+    duplicates = []  # 이번 실행에서 내용이 같은 파일은 한 번만 변환하고 나중에 복사
+    queued = set()
+    for path in files:
+        out = dst / path.relative_to(src).with_suffix("." + ext)
+        digest = file_hash(path)
+        if digest in queued:
+            duplicates.append((path, out, digest))
+        elif not copy(path, out, digest):
+            queued.add(digest)
+            tasks.put((path, out, digest, 1))
+
+    def worker() -> None:
+        with HwpPool(size=1, max_jobs=max_jobs, factory=factory) as pool:
+            while True:
+                try:
+                    path, out, digest, attempt = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                out.parent.mkdir(parents=True, exist_ok=True)
+                tic = perf_counter()
+                try:
+                    with pool.lease() as hwp:  # 예외가 나면 인스턴스를 교체한다.
+                        convert(hwp, str(path), str(out), hwp_format)
+                except Exception as e:
+                    if out.exists():
+                        out.unlink()
+                    if attempt <= retries:
+                        tasks.put((path, out, digest, attempt + 1))
+                        continue
+                    write({"hash": digest, "src": str(path), "output": str(out), "status": "failed",
+                           "duration": round(perf_counter() - tic, 3), "attempts": attempt, "error": repr(e)})
+                else:
+                    write({"hash": digest, "src": str(path), "output": str(out), "status": "done",
+                           "duration": round(perf_counter() - tic, 3), "attempts": attempt, "error": None})
+
+    threads = [
+        threading.Thread(target=worker, name=f"convert_tree_{i}", daemon=True)
+        for i in range(max(1, min(workers, tasks.qsize())))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    originals = {}  # 해시별 원본 기록(중복 파일의 실패 기록이 덮어쓰기 전)
+    for path, out, digest in duplicates:
+        original = originals.setdefault(digest, records.get((digest, ext)) or {})
+        if not copy(path, out, digest):  # 원본 변환에 실패한 경우
+            write({"hash": digest, "src": str(path), "output": str(out), "status": "failed",
+                   "duration": 0.0, "attempts": 0,
+                   "error": f"같은 내용의 원본 변환 실패({original.get('src')}): {original.get('error')}"})
+    summary["elapsed"] = round(perf_counter() - started, 3)
+    return summary
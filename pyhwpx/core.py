@@ -1,9 +1,16 @@
 from __future__ import annotations
 from .param_helpers import ParamHelpers
 from .run_methods import RunMethods
+from . import hml, table_xml
+from .docdiff import DocDiff
+from .download_cache import get_download_cache
+from .template import render_template
+from .text_index import TextIndex
+from .writer import HwpWriter
 from .fonts import fonts
 from importlib.resources import files
 import copy
+import atexit
 import ctypes
 import json
 import os
@@ -13,12 +20,15 @@ import sys
 import tempfile
 import threading
 import urllib.error
+import warnings
+import weakref
 import xml.etree.ElementTree as ET
 import zipfile
+from bisect import bisect_right
 from functools import wraps
 from collections import defaultdict
 from io import StringIO
-from time import sleep
+from time import sleep, perf_counter
 from typing import Literal, Union, Any, Optional, Tuple, List, Dict
 from urllib import request, parse
 from winreg import QueryValueEx
@@ -65,29 +75,313 @@ except FileNotFoundError as e:
 # Type Library 파일 재생성
 win32.gencache.EnsureModule("{7D2B6F3C-1D95-4E0C-BF5A-5EE564186FBC}", 0, 1, 0)
 
-__all__ = ["Hwp", "com_initialized"]
+__all__ = ["Hwp", "HwpHandle", "com_initialized", "ensure_com_initialized"]
+
+# 스레드별 COM 아파트먼트 초기화 상태
+_com_apartment = threading.local()
+
+
+class _ComApartment:
+    """
+    스레드가 끝날 때 CoUninitialize를 한 번 실행하기 위한 표식 객체.
+    ensure_com_initialized가 스레드 로컬 저장소에 넣어둔다.
+    """
+
+    def __del__(self):
+        try:
+            pythoncom.CoUninitialize()
+        except Exception:
+            pass
+
+
+def ensure_com_initialized() -> bool:
+    """
+    현재 스레드의 COM 라이브러리를 한 번만 초기화하는 헬퍼함수.
+
+    스레드마다 최초 호출시에만 CoInitialize를 실행하고,
+    CoUninitialize는 해당 스레드가 종료될 때 한 번만 실행된다.
+    Hwp 클래스와 com_initialized 데코레이터가 내부적으로 사용한다.
+
+    Returns:
+        이번 호출에서 새로 초기화했으면 True, 이미 초기화되어 있었으면 False
+
+    Examples:
+        >>> import threading
+        >>> from pyhwpx import ensure_com_initialized
+        >>> def worker():
+        ...     ensure_com_initialized()  # 몇 번을 호출해도 초기화는 한 번만
+        ...     ...
+        >>> threading.Thread(target=worker).start()
+    """
+    if getattr(_com_apartment, "token", None) is not None:
+        return False
+    pythoncom.CoInitialize()
+    _com_apartment.token = _ComApartment()
+    return True
 
 
 def com_initialized(func):
     """
     이용준님께서 기여해주셨습니다. (https://github.com/YongJun-Lee-98)
-    이 데코레이터는 함수 실행 전에 COM 라이브러리를 초기화하고,
-    실행 후에 COM 라이브러리를 해제합니다.
+    이 데코레이터는 함수 실행 전에 현재 스레드의 COM 라이브러리가 초기화되어 있도록 보장합니다.
 
-    Python의 GC가 COM 객체를 자동으로 제거하더라도,
-    CoUninitialize()를 호출하지 않으면
-    COM 라이브러리가 해당 스레드에서 완전히 해제되지 않을 수 있기 때문입니다.
+    초기화는 스레드마다 한 번만 실행되고(ensure_com_initialized),
+    CoUninitialize()는 해당 스레드가 종료될 때 한 번만 호출됩니다.
+    함수를 호출할 때마다 초기화/해제를 반복하면 같은 스레드의 다른 COM 개체가
+    해제된 아파트먼트에 남을 수 있기 때문입니다.
     """
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        pythoncom.CoInitialize()
+        ensure_com_initialized()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+# Hwp() 시작시간 단축용: 프로세스에서 마지막으로 연결한 ROT 이름을 기억해둔다.(Hwp.cache_moniker = True인 경우)
+# 모니커 개체는 아파트먼트(스레드)에 묶여 있으므로 이름만 저장하고, 연결할 때 아이템 모니커를 다시 만든다.
+_attach_lock = threading.Lock()
+_attach_name = None
+
+
+def _cached_hwp_object(running_coms) -> Any:
+    """
+    직전에 연결했던 한/글 인스턴스를 ROT에서 찾아 리턴하는 헬퍼함수. 없거나 종료되었으면 None
+    """
+    global _attach_name
+    with _attach_lock:
+        name = _attach_name
+    if name is None:
+        return None
+    try:
+        return running_coms.GetObject(pythoncom.CreateItemMoniker("!", name[1:]))
+    except pythoncom.com_error:
+        with _attach_lock:
+            if _attach_name == name:
+                _attach_name = None
+        return None
+
+
+def _remember_hwp_name(name: str) -> None:
+    global _attach_name
+    with _attach_lock:
+        _attach_name = name
+
+
+# 실행해도 문서 내용이 바뀌지 않는 액션(이름의 앞부분). 그 외의 액션은 모두 문서를 바꿀 수 있는 것으로 본다.
+_READ_ONLY_ACTIONS = (
+    "Move", "Select", "Cancel", "Copy", "Goto", "FindDlg", "RepeatFind", "ForwardFind", "BackwardFind",
+    "FileSave", "Print", "View",
+)
+# 문서 내용을 바꿀 수 있는 한/글 오토메이션 메서드
+_MUTATING_METHODS = {
+    "Clear", "CreateAction", "CreateField", "DeleteCtrl", "Insert", "InsertBackgroundPicture", "InsertCtrl",
+    "InsertPicture", "Open", "PutFieldText", "PutMetatagNameText", "Run", "RunScriptMacro", "SetTextFile",
+}
+
+
+class _TrackedAction:
+    """
+    HAction 개체를 감싸서, 문서를 바꿀 수 있는 액션을 실행하기 직전에 on_change를 호출하는 헬퍼클래스.
+    """
+
+    __slots__ = ("_action", "_on_change")
+
+    def __init__(self, action: Any, on_change) -> None:
+        self._action = action
+        self._on_change = on_change
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._action, name)
+
+    def Run(self, act_id: str) -> bool:
+        if not act_id.startswith(_READ_ONLY_ACTIONS):
+            self._on_change()
+        return self._action.Run(act_id)
+
+    def Execute(self, act_id: str, hset: Any) -> bool:
+        if not act_id.startswith(_READ_ONLY_ACTIONS):
+            self._on_change()
+        return self._action.Execute(act_id, hset)
+
+
+class _TrackedDispatch:
+    """
+    한/글 COM 개체(Hwp.hwp)를 감싸서, 문서를 바꿀 수 있는 호출
+    (읽기 전용이 아닌 액션, PutFieldText 등의 메서드, 속성 설정)이 있으면 on_change를 호출하는 헬퍼클래스.
+    get_text_snapshot 캐시와 search 색인을 초기화하는 데 사용하며, 그 외에는 원래 개체와 똑같이 동작한다.
+    (win32com의 Dispatch/EnsureDispatch에 넘겨도 _oleobj_로 원래 개체를 찾는다.)
+    """
+
+    __slots__ = ("_dispatch", "_on_change")
+
+    def __init__(self, dispatch: Any, on_change) -> None:
+        object.__setattr__(self, "_dispatch", dispatch)
+        object.__setattr__(self, "_on_change", on_change)
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._dispatch, name)
+        if name == "HAction":
+            return _TrackedAction(value, self._on_change)
+        if name in _MUTATING_METHODS:
+            @wraps(value)
+            def method(*args, **kwargs):
+                self._on_change()
+                return value(*args, **kwargs)
+
+            return method
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._on_change()
+        setattr(self._dispatch, name, value)
+
+    def __repr__(self) -> str:
+        return repr(self._dispatch)
+
+
+def _running_hwp_monikers() -> List[Tuple[str, Any]]:
+    """
+    실행 중인 개체 테이블(ROT)에 등록된 한/글 인스턴스의 (이름, 모니커) 리스트를 리턴하는 헬퍼함수.
+    """
+    context = pythoncom.CreateBindCtx(0)
+    result = []
+    for moniker in pythoncom.GetRunningObjectTable().EnumRunning():
+        name = moniker.GetDisplayName(context, moniker)
+        if name.startswith("!HwpObject."):
+            result.append((name, moniker))
+    return result
+
+
+class _WarmStandby:
+    """
+    다음 Hwp() 호출에 바로 넘겨줄 숨겨진 한/글 인스턴스를 백그라운드 스레드에서 미리 띄워두는 헬퍼클래스.
+    Hwp.warm_standby 메서드로 사용한다.
+
+    대기 인스턴스는 ROT 이름을 실행 전후로 비교하지 않고, ROT의 각 개체를 대기 인스턴스와 같은 개체인지(IUnknown) 비교해서 찾는다.
+    (그 사이에 사용자가 띄운 한/글 창을 대기 인스턴스로 오인하지 않도록)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stream = None
+        self.names = set()  # 대기 인스턴스의 ROT 이름(다른 Hwp()가 연결하지 않도록 제외)
+        self.thread = None
+        self.consumed = threading.Event()
+        self.discard = threading.Event()
+        self.identified = threading.Event()  # 대기 인스턴스의 ROT 이름을 확인했거나 실패함
+        self.identified.set()
+        self.keep = False
+        self.error = None
+
+    def start(self) -> bool:
+        with self.lock:
+            # 넘겨준(consumed) 인스턴스의 스레드는 곧 끝나므로 새로 띄운다.
+            if self.stream is not None or (
+                    self.thread is not None and self.thread.is_alive() and not self.consumed.is_set()):
+                return False
+            self.consumed = threading.Event()
+            self.discard = threading.Event()
+            self.identified = threading.Event()
+            self.thread = threading.Thread(
+                target=self._spawn, args=(self.consumed, self.discard, self.identified),
+                name="hwp_standby", daemon=True,
+            )
+            self.thread.start()
+        return True
+
+    def _spawn(self, consumed: threading.Event, discard: threading.Event, identified: threading.Event) -> None:
+        ensure_com_initialized()
+        hwp = None
         try:
-            return func(*args, **kwargs)
+            hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
+            hwp.XHwpWindows.Active_XHwpWindow.Visible = False
+            unknown = hwp._oleobj_.QueryInterface(pythoncom.IID_IUnknown)
+            running_coms = pythoncom.GetRunningObjectTable()
+            names = set()
+            for name, moniker in _running_hwp_monikers():
+                try:
+                    if running_coms.GetObject(moniker).QueryInterface(pythoncom.IID_IUnknown) == unknown:
+                        names.add(name)
+                except pythoncom.com_error:
+                    pass
+            stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+                pythoncom.IID_IDispatch, hwp._oleobj_
+            )
+            with self.lock:
+                if not discard.is_set():  # 띄우는 중에 shutdown된 경우 넘겨주지 않고 종료
+                    self.stream = stream
+                    self.names = names
+                self.error = None
+        except Exception as e:
+            with self.lock:
+                self.error = e
+            if hwp is not None:  # 띄운 뒤에 실패했으면 숨겨진 채로 남지 않도록 종료
+                try:
+                    hwp.Quit()
+                except Exception:
+                    pass
+                hwp = None
+            consumed.set()
         finally:
-            pythoncom.CoUninitialize()
+            identified.set()
+        consumed.wait()  # 넘겨줄 때까지 아파트먼트를 유지
+        if discard.is_set() and hwp is not None:
+            try:
+                hwp.Quit()
+            except Exception:
+                pass
 
-    return wrapper
+    def spawning(self) -> bool:
+        """
+        대기 인스턴스를 띄우는 중이라 아직 ROT 이름을 확인하지 못했으면 True
+        """
+        thread = self.thread
+        return thread is not None and thread.is_alive() and not self.identified.is_set()
+
+    def wait_identified(self, timeout: float = 30.0) -> None:
+        """
+        대기 인스턴스를 띄우는 중이면, ROT 이름을 확인할 때까지 기다린다.
+        (그 전에 new=False인 Hwp()가 숨겨진 대기 인스턴스에 연결하지 않도록)
+        """
+        if self.spawning():
+            self.identified.wait(timeout)
+
+    def take(self) -> Any:
+        with self.lock:
+            stream, self.stream = self.stream, None
+            self.names = set()
+            consumed = self.consumed
+            error, self.error = self.error, None
+        if error is not None:
+            warnings.warn(f"대기 한/글 인스턴스를 띄우지 못했습니다: {error!r}", RuntimeWarning, stacklevel=3)
+        if stream is None:
+            return None
+        try:
+            return pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+        finally:
+            consumed.set()
+            if self.keep:
+                self.start()
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        대기모드를 끄고, 아무도 가져가지 않은 대기 인스턴스를 종료한다.(프로그램 종료시 atexit으로도 실행)
+        """
+        with self.lock:
+            self.keep = False
+            self.stream = None
+            self.names = set()
+            thread = self.thread
+            self.discard.set()
+            self.consumed.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+_standby = _WarmStandby()
+atexit.register(_standby.shutdown)
 
 
 def log_error(method):
@@ -214,37 +508,33 @@ def _refresh_eq(hwnd: int, delay: int = 0.1) -> None:
     sleep(delay)
 
 
-def _eq_create(visible: bool) -> bool:
+def _eq_create(handle: "HwpHandle") -> bool:
     """
     멀티스레드 형태로 새 수식편집기를 실행하는 헬퍼함수. 직접 사용하지 말 것.
 
     Args:
-        visible: 아래아한글을 백그라운드에서 실행할지(False), 혹은 화면에 보이게 할지(True) 결정하는 파라미터
+        handle: hwp.marshal()로 만든 현재 한/글 인스턴스의 핸들
 
     Returns:
         무조건 True를 리턴함
     """
-    pythoncom.CoInitialize()
-    hwp = Hwp(visible=visible)
+    hwp = handle.unmarshal()
     hwp.HAction.Run("EquationCreate")
-    pythoncom.CoUninitialize()
     return True
 
 
-def _eq_modify(visible) -> bool:
+def _eq_modify(handle: "HwpHandle") -> bool:
     """
     멀티스레드 형태로 기존 수식에 대한 수식편집기를 실행하는 헬퍼함수. 직접 사용하지 말 것.
 
     Args:
-        visible: 아래아한글을 백그라운드에서 실행할지(False), 혹은 화면에 보이게 할지(True) 결정하는 파라미터
+        handle: hwp.marshal()로 만든 현재 한/글 인스턴스의 핸들
 
     Returns:
         무조건 True를 리턴
     """
-    pythoncom.CoInitialize()
-    hwp = Hwp(visible=visible)
+    hwp = handle.unmarshal()
     hwp.hwp.HAction.Run("EquationModify")
-    pythoncom.CoUninitialize()
     return True
 
 
@@ -394,6 +684,157 @@ def excel_address_to_tuple_zero_based(address: str) -> Tuple[Union[int, Any], Un
     return row - 1, column
 
 
+# {{name:direction:memo}} 누름틀 또는 [[name]] 셀필드 자리표시자
+_BRACKET_FIELD_PATTERN = re.compile(r"\{\{([^{}\r\n]+)\}\}|\[\[([^\[\]\r\n]+)\]\]")
+_OPEN_BRACKET_PATTERN = re.compile(r"\{\{|\[\[")
+
+
+def split_field_spec(spec: str) -> Tuple[str, str, str]:
+    """
+    "name:direction:memo" 형식의 문자열을 (name, direction, memo) 튜플로 나누는 헬퍼함수
+
+    direction을 생략하면 name을 안내문으로 사용하고, memo를 생략하면 빈 문자열이 된다.
+    `hwp.set_field_by_bracket` 메서드 내부에서 사용됩니다.
+
+    Args:
+        spec: 중괄호(또는 대괄호) 안쪽의 문자열
+
+    Returns:
+        (필드이름, 안내문, 메모) 튜플
+
+    Examples:
+        >>> from pyhwpx.core import split_field_spec
+        >>> split_field_spec("name")
+        ('name', 'name', '')
+        >>> split_field_spec("name:이름을 입력하세요:메모")
+        ('name', '이름을 입력하세요', '메모')
+    """
+    if ":" not in spec:
+        return spec, spec, ""
+    name, direction = spec.split(":", maxsplit=1)
+    if ":" in direction:
+        direction, memo = direction.split(":", maxsplit=1)
+    else:
+        memo = ""
+    return name, direction, memo
+
+
+def find_bracket_fields(text: str) -> List[dict]:
+    """
+    문자열 안의 모든 {{name:direction:memo}}, [[name]] 자리표시자를 찾아 리스트로 리턴하는 헬퍼함수
+
+    닫히지 않은 "{{", "[["(예: "{{a}", "[[b")는 예외를 일으키지 않고 kind="unclosed"인 항목으로 리턴한다.
+
+    Args:
+        text: get_text 등으로 추출한 문자열
+
+    Returns:
+        각 자리표시자의 정보를 담은 사전의 리스트(문자열 순서).
+        kind("field", "cell" 또는 "unclosed"), name, direction, memo, start(문자열 내 시작 인덱스), length를 키로 갖는다.
+        "unclosed" 항목의 name, direction, memo는 빈 문자열이고, length는 여는 괄호의 길이(2)이다.
+
+    Examples:
+        >>> from pyhwpx.core import find_bracket_fields
+        >>> [(i["kind"], i["name"], i["start"]) for i in find_bracket_fields("{{a}} 와 [[b]]")]
+        [('field', 'a', 0), ('cell', 'b', 8)]
+        >>> [(i["kind"], i["start"]) for i in find_bracket_fields("{{a} {{b}}")]
+        [('unclosed', 0), ('field', 5)]
+    """
+    result = []
+    matched = []
+    for match in _BRACKET_FIELD_PATTERN.finditer(text):
+        kind = "field" if match.group(1) is not None else "cell"
+        name, direction, memo = split_field_spec(match.group(1) or match.group(2))
+        matched.append((match.start(), match.end()))
+        result.append(
+            {
+                "kind": kind,
+                "name": name,
+                "direction": direction,
+                "memo": memo,
+                "start": match.start(),
+                "length": match.end() - match.start(),
+            }
+        )
+    if len(matched) < text.count("{{") + text.count("[["):
+        # 자리표시자가 아닌 곳에 남은 여는 괄호는 닫히지 않은 것이다.
+        masked = list(text)
+        for start, end in matched:
+            masked[start:end] = " " * (end - start)
+        for match in _OPEN_BRACKET_PATTERN.finditer("".join(masked)):
+            result.append({"kind": "unclosed", "name": "", "direction": "", "memo": "",
+                           "start": match.start(), "length": 2})
+        result.sort(key=lambda i: i["start"])
+    return result
+
+
+def count_terms(
+        text: str, terms: List[str], positions: bool = False
+) -> Dict[str, Union[int, List[int]]]:
+    """
+    Aho-Corasick 오토마톤으로 여러 단어의 출현횟수를 한 번의 순회로 세는 헬퍼함수
+
+    단어별 결과는 `text.count(term)`과 같다(같은 단어끼리는 겹치지 않게 센다).
+    `hwp.count_many` 메서드 내부에서 사용됩니다.
+
+    Args:
+        text: 검색 대상 문자열
+        terms: 셀 단어 리스트
+        positions: True인 경우 횟수 대신 시작 인덱스의 리스트를 리턴
+
+    Returns:
+        {단어: 출현횟수} 또는 {단어: [시작 인덱스, ...]} 형식의 사전
+
+    Examples:
+        >>> from pyhwpx.core import count_terms
+        >>> count_terms("가나다 가나 나다", ["가나", "나다", "다"])
+        {'가나': 2, '나다': 2, '다': 2}
+        >>> count_terms("aaaa", ["aa"], positions=True)
+        {'aa': [0, 2]}
+    """
+    terms = list(dict.fromkeys(t for t in terms if t))
+    goto = [{}]
+    fail = [0]
+    out = [[]]
+    for idx, term in enumerate(terms):
+        node = 0
+        for ch in term:
+            if ch not in goto[node]:
+                goto.append({})
+                fail.append(0)
+                out.append([])
+                goto[node][ch] = len(goto) - 1
+            node = goto[node][ch]
+        out[node].append(idx)
+
+    # BFS로 실패링크 구성
+    queue = list(goto[0].values())
+    for node in queue:
+        for ch, child in goto[node].items():
+            queue.append(child)
+            f = fail[node]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[child] = goto[f][ch] if ch in goto[f] and goto[f][ch] != child else 0
+            out[child] = out[child] + out[fail[child]]
+
+    found = [[] for _ in terms]
+    next_free = [0] * len(terms)
+    node = 0
+    for i, ch in enumerate(text):
+        while node and ch not in goto[node]:
+            node = fail[node]
+        node = goto[node].get(ch, 0)
+        for idx in out[node]:
+            start = i - len(terms[idx]) + 1
+            if start >= next_free[idx]:  # str.count처럼 겹치지 않게
+                found[idx].append(start)
+                next_free[idx] = i + 1
+    if positions:
+        return {term: found[idx] for idx, term in enumerate(terms)}
+    return {term: len(found[idx]) for idx, term in enumerate(terms)}
+
+
 # 아래아한글의 ctrl 래퍼 클래스 정의
 class Ctrl:
     """
@@ -930,6 +1371,40 @@ class XHwpDocument:
 
 
 # 아래아한글 오토메이션 클래스 정의
+class HwpHandle:
+    """
+    다른 스레드로 넘기기 위해 마샬링한 한/글 인스턴스 핸들.
+
+    `hwp.marshal()`로 만들고, 작업 스레드에서 `handle.unmarshal()`을 실행하면
+    같은 한/글 인스턴스에 연결된 Hwp 인스턴스를 얻는다. 핸들 하나는 한 번만 사용할 수 있다.
+    on_quit은 unmarshal()로 얻은 인스턴스가 삭제될 때 한/글을 종료할지 여부다.
+    """
+
+    def __init__(self, stream, on_quit: bool = False):
+        self._stream = stream
+        self._on_quit = on_quit
+
+    def __repr__(self):
+        return f"<HwpHandle: used={self._stream is None}>"
+
+    def unmarshal(self) -> "Hwp":
+        """
+        현재 스레드에서 마샬링된 인스턴스에 연결한다.
+
+        Returns:
+            Hwp 인스턴스(원래 인스턴스와 같은 한/글 창을 가리킴)
+
+        Raises:
+            RuntimeError: 이미 사용한 핸들인 경우
+        """
+        if self._stream is None:
+            raise RuntimeError("이미 사용한 HwpHandle입니다. marshal()로 새 핸들을 만드세요.")
+        ensure_com_initialized()
+        stream, self._stream = self._stream, None
+        dispatch = pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch)
+        return Hwp.from_dispatch(dispatch, on_quit=self._on_quit)
+
+
 class Hwp(ParamHelpers, RunMethods):
     """
     아래아한글 인스턴스를 실행합니다.
@@ -950,6 +1425,18 @@ class Hwp(ParamHelpers, RunMethods):
             보안모듈을 Hwp 클래스에서 직접 실행하게 허용합니다. 기본값은 `True` 입니다.
             hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule") 메서드를 직접 실행하는 것과 동일합니다.
 
+    Attributes:
+        startup_timings (dict):
+            인스턴스 생성에 걸린 시간(초)을 단계별로 기록한 사전입니다.
+            (com_init, rot_lookup, standby, dispatch, visible, register_module, total)
+            시작시간을 줄이려면 `Hwp.warm_standby()`를 참고하세요.
+        from_standby (bool):
+            `Hwp.warm_standby()`로 미리 띄워둔 인스턴스를 넘겨받았으면 True
+        cache_moniker (bool):
+            클래스 속성. `Hwp.cache_moniker = True`로 설정하면 같은 프로세스에서 다시 `Hwp()`를 실행할 때
+            직전에 연결했던 인스턴스의 ROT 이름으로 바로 연결하므로 ROT 전체를 검색하지 않습니다.
+            단, 그 사이에 새로 띄운 한/글 창이 아니라 처음 연결한 창에 계속 연결됩니다. 기본값은 False
+
     Examples:
         >>> from pyhwpx import Hwp
         >>> hwp = Hwp()
@@ -964,6 +1451,8 @@ class Hwp(ParamHelpers, RunMethods):
     def __repr__(self):
         return f'<Hwp: DocumentID={self.XHwpDocuments.Active_XHwpDocument.DocumentID}, Title="{self.get_title()}", FullName="{self.XHwpDocuments.Active_XHwpDocument.FullName or None}">'
 
+    cache_moniker = False
+
     def __init__(
             self,
             new: bool = False,
@@ -971,24 +1460,43 @@ class Hwp(ParamHelpers, RunMethods):
             register_module: bool = True,
             on_quit: bool = False,
     ):
-        self.hwp = 0
-        self.on_quit = on_quit
-        self.htf_fonts = fonts
-        context = pythoncom.CreateBindCtx(0)
-        pythoncom.CoInitialize()  # 이걸 꼭 실행해야 하는가? 왜 Pycharm이나 주피터에서는 괜찮고, vscode에서는 CoInitialize 오류가 나는지?
-        running_coms = pythoncom.GetRunningObjectTable()
-        monikers = running_coms.EnumRunning()
+        self._init_state(on_quit)
+        timings = {}
+        started = tic = perf_counter()
+        ensure_com_initialized()  # vscode 등 COM이 초기화되지 않은 스레드에서 실행하는 경우를 위해
+        timings["com_init"], tic = perf_counter() - tic, perf_counter()
 
         if not new:
-            for moniker in monikers:
-                name = moniker.GetDisplayName(context, moniker)
-                if name.startswith("!HwpObject."):
-                    obj = running_coms.GetObject(moniker)
-                    self.hwp = win32.gencache.EnsureDispatch(
-                        obj.QueryInterface(pythoncom.IID_IDispatch)
-                    )
+            running_coms = pythoncom.GetRunningObjectTable()
+            obj = None
+            if self.cache_moniker:
+                obj = _cached_hwp_object(running_coms)
+            if obj is None:
+                monikers = _running_hwp_monikers()
+                if monikers and _standby.spawning():
+                    # ROT에 있는 인스턴스가 띄우는 중인 대기 인스턴스일 수 있으므로 이름을 확인할 때까지 기다린다.
+                    # (실행 중인 한/글이 없으면 기다리지 않는다.)
+                    _standby.wait_identified()
+                    monikers = _running_hwp_monikers()
+                last = None
+                for name, moniker in monikers:
+                    if name not in _standby.names:
+                        last = name, moniker  # 마지막으로 찾은 인스턴스에 연결
+                if last is not None:
+                    obj = running_coms.GetObject(last[1])
+                    _remember_hwp_name(last[0])
+            if obj is not None:
+                self.hwp = win32.gencache.EnsureDispatch(
+                    obj.QueryInterface(pythoncom.IID_IDispatch)
+                )
+        timings["rot_lookup"], tic = perf_counter() - tic, perf_counter()
+
         if not self.hwp:
-            self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
+            dispatch = _standby.take()
+            self.from_standby = dispatch is not None
+            timings["standby"], tic = perf_counter() - tic, perf_counter()
+            self.hwp = win32.gencache.EnsureDispatch(dispatch or "HWPFrame.HwpObject")
+        timings["dispatch"], tic = perf_counter() - tic, perf_counter()
         try:
             self.hwp.XHwpWindows.Active_XHwpWindow.Visible = visible
         except Exception as e:
@@ -996,6 +1504,7 @@ class Hwp(ParamHelpers, RunMethods):
             sleep(0.01)
             self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
             self.hwp.XHwpWindows.Active_XHwpWindow.Visible = visible
+        timings["visible"], tic = perf_counter() - tic, perf_counter()
 
         if register_module:  # and not check_registry_key():
             try:
@@ -1004,14 +1513,141 @@ class Hwp(ParamHelpers, RunMethods):
                 print(
                     e, "RegisterModule 액션을 실행할 수 없음. 개발자에게 문의해주세요."
                 )
+        timings["register_module"] = perf_counter() - tic
+        timings["total"] = perf_counter() - started
+        self.startup_timings = timings
+
+    @staticmethod
+    def warm_standby(enable: bool = True) -> bool:
+        """
+        숨겨진 한/글 인스턴스를 백그라운드에서 미리 실행해두는 대기모드를 켜거나 끈다.
+
+        대기모드를 켜면 새 인스턴스가 필요한 다음 Hwp() 호출(new=True 이거나, 연결할 한/글 창이 없는 경우)이
+        미리 띄워둔 인스턴스를 바로 넘겨받으므로 한/글 실행을 기다리지 않는다.
+        넘겨준 후에는 다음 호출을 위해 다시 새 인스턴스를 백그라운드에서 띄운다.
+        대기 중인 인스턴스는 new=False인 Hwp()가 연결대상으로 잡지 않는다.
+        (대기 인스턴스를 띄우는 중에 new=False로 Hwp()를 실행하면, 대기 인스턴스를 확인할 때까지 기다린다.)
+        대기 인스턴스를 띄우지 못한 경우에는 다음 Hwp() 호출에서 RuntimeWarning으로 알려주고 평소처럼 새 인스턴스를 실행한다.
+        아무도 가져가지 않은 대기 인스턴스는 warm_standby(False) 또는 프로그램 종료시 자동으로 종료된다.
+
+        Args:
+            enable: True이면 대기모드 시작, False이면 대기모드를 끄고 대기 중인 인스턴스를 종료한다.
+
+        Returns:
+            새로 대기 인스턴스를 띄우기 시작했으면 True
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> Hwp.warm_standby()  # 프로그램 시작시 한 번 실행
+            True
+            >>> # ...다른 초기화 작업...
+            >>> hwp = Hwp(new=True, visible=False)  # 미리 띄워둔 인스턴스를 즉시 받음
+            >>> hwp.from_standby
+            True
+            >>> hwp.startup_timings
+            {'com_init': 1e-05, 'rot_lookup': 1e-06, 'standby': 2e-05, 'dispatch': 0.004, 'visible': 0.002, 'register_module': 0.03, 'total': 0.036}
+        """
+        if enable:
+            _standby.keep = True
+            return _standby.start()
+        _standby.shutdown()
+        return False
+
+    @property
+    def hwp(self) -> Any:
+        """
+        한/글 오토메이션 개체. 문서를 바꾸는 호출은 get_text_snapshot 캐시를 자동으로 초기화한다(_TrackedDispatch 참고).
+        """
+        return self._hwp
+
+    @hwp.setter
+    def hwp(self, dispatch: Any) -> None:
+        if dispatch and not isinstance(dispatch, _TrackedDispatch):
+            # Hwp -> 개체 -> Hwp 순환참조가 생기지 않도록 약한참조로 연결한다.(__del__의 on_quit 처리용)
+            owner = weakref.ref(self)
+
+            def on_change() -> None:
+                hwp = owner()
+                if hwp is not None:
+                    hwp.invalidate_text_snapshot()
+
+            dispatch = _TrackedDispatch(dispatch, on_change)
+        self._hwp = dispatch
+
+    def _init_state(self, on_quit: bool = False) -> None:
+        self.hwp = 0
+        self.on_quit = on_quit
+        self.htf_fonts = fonts
+        self._text_snapshot = None  # (문서 지문, 텍스트) 캐시. get_text_snapshot 참고
+        self._text_index = None  # search 메서드용 위치 색인
+        self._text_index_key = None
+        self._search_hits = []
+        self._search_query = ""
+        self.startup_timings = {}
+        self.from_standby = False
+        self._download_dir = None  # (open(url)용 임시폴더, 삭제 finalizer)
 
     def __del__(self):
+        # CoUninitialize는 스레드 종료시 한 번만 실행된다(ensure_com_initialized 참고).
         if self.on_quit:
             try:
                 self.quit(save=False)
             except:
                 pass
-        pythoncom.CoUninitialize()
+
+    @classmethod
+    def from_dispatch(cls, dispatch: Any, on_quit: bool = False) -> "Hwp":
+        """
+        이미 얻어둔 한/글 COM 개체(IDispatch)로 Hwp 인스턴스를 만드는 대체 생성자.
+
+        실행 중인 개체 테이블(ROT)을 검색하거나 새 인스턴스를 실행하지 않으며,
+        보안모듈 등록 등 초기화 작업도 생략한다.
+        다른 스레드로 넘긴 핸들은 HwpHandle.unmarshal()을 사용할 것.
+
+        Args:
+            dispatch: 한/글 오토메이션 개체(IDispatch 또는 win32com Dispatch 래퍼)
+            on_quit: 인스턴스가 삭제될 때 한/글을 종료할지 여부
+
+        Returns:
+            Hwp 인스턴스
+        """
+        self = cls.__new__(cls)
+        self._init_state(on_quit)
+        ensure_com_initialized()
+        self.hwp = win32.gencache.EnsureDispatch(dispatch)
+        return self
+
+    def marshal(self, on_quit: bool = False) -> "HwpHandle":
+        """
+        현재 한/글 인스턴스를 다른 스레드에서 사용할 수 있도록 마샬링한 핸들을 리턴한다.
+
+        COM 개체는 만든 스레드(아파트먼트)에서만 직접 사용할 수 있으므로,
+        작업 스레드에서 새 Hwp 인스턴스를 만드는 대신 이 핸들을 넘겨서
+        `handle.unmarshal()`로 같은 한/글 인스턴스에 연결한다.
+        (CoMarshalInterThreadInterfaceInStream 방식이며, 핸들 하나는 한 번만 unmarshal할 수 있다.)
+
+        Args:
+            on_quit: 작업 스레드에서 unmarshal()로 얻은 인스턴스가 삭제될 때 한/글을 종료할지 여부.
+                기본값 False(원래 인스턴스가 계속 사용할 수 있도록 종료하지 않음)
+
+        Returns:
+            HwpHandle 인스턴스
+
+        Examples:
+            >>> import threading
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> def worker(handle):
+            ...     hwp2 = handle.unmarshal()  # 작업 스레드에서 같은 한/글 인스턴스에 연결
+            ...     hwp2.insert_text("다른 스레드에서 입력")
+            >>> t = threading.Thread(target=worker, args=(hwp.marshal(),))
+            >>> t.start()
+            >>> t.join()
+        """
+        stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+            pythoncom.IID_IDispatch, self.hwp._oleobj_
+        )
+        return HwpHandle(stream, on_quit)
 
     @property
     def Application(self) -> "Hwp.Application":
@@ -2046,36 +2682,127 @@ class Hwp(ParamHelpers, RunMethods):
             pset.LineSpacing = value * 200  # HwpUnit 단위로 변환 후
         return self.hwp.HAction.Execute(act, pset.HSet)
 
-    def is_empty_page(self, pgno: int = -1, ignore_space: bool = True, ignore_fwspace: bool = True):
+    def is_empty_page(self, pgno: int = -1, ignore_space: bool = True, ignore_fwspace: bool = True) -> bool:
         """
-        <테스트중> 비어있는 페이지인지 확인하는 메서드. 보완이 필요할 듯. (오류발생시 제보 바람)
+        비어있는 페이지인지 확인하는 메서드.
+
+        내부적으로 empty_pages 메서드를 사용하므로 문서를 수정하거나 실행취소(Undo)하지 않는다.
+        여러 페이지를 확인할 때는 empty_pages를 한 번 실행하는 것이 훨씬 빠르다.
+
+        Args:
+            pgno: 확인할 페이지(시작페이지는 1). 기본값 -1은 현재 페이지
+            ignore_space: 공백은 글자로 치지 않음(기본값 True)
+            ignore_fwspace: 고정폭 빈칸/묶음 빈칸은 글자로 치지 않음(기본값 True)
+
+        Returns:
+            빈 페이지이면 True, 아니면 False
         """
-        undo_count = 0
-        if pgno != -1:
-            self.goto_page(pgno)
-        init_pos = self.get_pos()
-        self.MovePageEnd()
-        e_pos = self.get_pos()
-        self.MovePageBegin()
-        s_pos = self.get_pos()
-        self.select_text_by_get_pos(s_pos, e_pos)
+        if pgno == -1:
+            pgno = self.current_page
+        return pgno in self.empty_pages([pgno], ignore_space, ignore_fwspace)
+
+    def empty_pages(
+            self,
+            pages: Optional[List[int]] = None,
+            ignore_space: bool = True,
+            ignore_fwspace: bool = True,
+    ) -> List[int]:
+        """
+        문서 내 모든 빈 페이지의 번호를 리턴하는 메서드.
+
+        페이지마다 get_page_text를 한 번씩만 실행하고,
+        글자가 없는 페이지에 한해 표/그림/수식 등의 개체가 놓인 페이지인지 확인한다.
+        여러 페이지에 걸친 표는 걸쳐있는 모든 페이지를 차지한 것으로 본다.
+        캐럿 위치 외에는 문서를 건드리지 않으므로 실행취소(Undo) 목록도 그대로다.
+        (머리말/꼬리말, 바탕쪽의 내용은 무시한다.)
+
+        Args:
+            pages: 확인할 페이지 번호의 리스트(시작페이지는 1). 기본값 None은 모든 페이지
+            ignore_space: 공백은 글자로 치지 않음(기본값 True)
+            ignore_fwspace: 고정폭 빈칸/묶음 빈칸은 글자로 치지 않음(기본값 True)
+
+        Returns:
+            빈 페이지 번호(시작페이지는 1)의 리스트
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.empty_pages()
+            [3, 7]
+            >>> for pgno in hwp.empty_pages()[::-1]:  # 뒤쪽 페이지부터 지워야 번호가 밀리지 않음
+            ...     hwp.goto_page(pgno)
+            ...     hwp.DeletePage()
+        """
+        blanks = "\r\n\t"
         if ignore_space:
-            if self.find_replace_all(" ", ""):
-                undo_count += 1
+            blanks += " \u3000"
         if ignore_fwspace:
-            if self.find_replace_all("^s", ""):
-                undo_count += 1
-        content = self.get_text_file("HWPML2X", )
-        if content is None:
-            for _ in range(undo_count):
-                self.Undo()
-            return True
-        for _ in range(undo_count):
-            self.Undo()
-        self.set_pos(*init_pos)
-        if "<CHAR>" in content or "<SHAPEOBJECT" in content:
-            return False
-        return True
+            blanks += "\u2007\xa0"
+        table = str.maketrans("", "", blanks)
+        page_count = self.hwp.PageCount
+        if pages is None:
+            pages = range(1, page_count + 1)
+        empty = [
+            pgno
+            for pgno in pages
+            if 1 <= pgno <= page_count
+               and not self.get_page_text(pgno - 1, 0x07).translate(table)
+        ]
+        if not empty:
+            return empty
+
+        # 글자가 없어도 표, 그림, 수식 등의 개체가 있으면 빈 페이지가 아님.
+        # 빈 페이지마다 시작/끝 문단(본문 기준)을 구해두고, 개체의 조판부호 위치(GetAnchorPos, 이동 없음)가
+        # 그 사이에 있으면 해당 페이지에 놓인 것으로 본다. 경계 문단에 있는 개체만 캐럿을 옮겨서
+        # 개체 앞/뒤 위치의 페이지(여러 페이지에 걸친 표 등의 페이지 범위)를 확인한다.
+        cur_pos = self.get_pos()
+        occupied = set()
+        bounds = {}  # 페이지: (시작 문단, 끝 문단)
+
+        def body_para() -> int:
+            # 셀 안 등 본문이 아닌 위치라면 바깥 개체의 조판부호가 있는 본문 문단
+            list_, para, pos = self.get_pos()
+            while list_ != 0:
+                anchor = self.hwp.ParentCtrl.GetAnchorPos(0)
+                list_, para, pos = anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos")
+                self.set_pos(list_, para, pos)
+            return para
+
+        try:
+            for pgno in empty:
+                self.goto_page(pgno)
+                if self.get_pos()[0] != 0:  # 앞 페이지에서 이어지는 표 등의 안에서 시작하는 페이지
+                    occupied.add(pgno)
+                    continue
+                first = self.get_pos()[1]
+                last = float("inf")
+                if pgno < page_count:
+                    self.goto_page(pgno + 1)
+                    last = body_para()
+                bounds[pgno] = (first, last)
+
+            boundary = set()
+            ctrl = self.hwp.HeadCtrl
+            while ctrl:
+                if ctrl.CtrlID in ("tbl", "gso", "eqed"):
+                    anchor = ctrl.GetAnchorPos(0)
+                    if anchor.Item("List") == 0:  # 머리말/꼬리말, 셀 안의 개체는 제외
+                        para = anchor.Item("Para")
+                        for pgno, (first, last) in bounds.items():
+                            if first < para < last:
+                                occupied.add(pgno)
+                            elif para in (first, last):
+                                boundary.add((para, anchor.Item("Pos")))
+                ctrl = ctrl.Next
+
+            for para, pos in boundary:
+                self.set_pos(0, para, pos)
+                start = self.current_page
+                self.set_pos(0, para, pos + 1)
+                occupied.update(range(start, self.current_page + 1))
+        finally:
+            self.set_pos(*cur_pos)
+        return [pgno for pgno in empty if pgno not in occupied]
 
     def is_empty_para(self) -> bool:
         """
@@ -3621,24 +4348,63 @@ class Hwp(ParamHelpers, RunMethods):
             finally:
                 self.set_pos(*cur_pos)
         else:
+            return self.set_col_widths(width, as_=as_)
+
+    def set_col_widths(
+            self,
+            widths: Union[list, tuple, np.ndarray],
+            as_: Literal["mm", "ratio", "hwpunit"] = "ratio",
+            n: Union[int, str, Any] = "",
+    ) -> bool:
+        """
+        표의 모든 열 너비를 한 번에 변경하는 메서드.
+
+        열마다 셀블록을 잡고 TablePropertyDialog를 실행하는 대신,
+        표를 HWPML2X로 한 번 저장해서 모든 셀의 Width를 계산해 바꾼 후 표를 한 번에 다시 붙여넣는다.
+        (열 개수와 관계없이 표 하나당 한 번의 구조 변경)
+        set_col_width, adjust_cellwidth에 리스트를 넣은 경우에도 이 메서드가 사용된다.
+
+        Args:
+            widths: 열 너비 리스트. 열 개수와 같아야 한다.
+            as_: widths의 단위
+
+                - "ratio": 열 너비의 비율. 표 전체 너비는 유지된다(기본값)
+                - "mm": 밀리미터
+                - "hwpunit": HwpUnit
+            n: 표 인덱스(또는 표 컨트롤). 생략하면 캐럿이 들어있는 표, 표 밖이면 첫 번째 표
+
+        Returns:
+            성공시 True
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.create_table(3, 30)
+            True
+            >>> hwp.set_col_widths(range(1, 31), n=0)  # 1:2:...:30 비율로
+            True
+            >>> hwp.set_col_widths([20, 40, 60], as_="mm", n=1)
+            True
+        """
+        widths = np.asarray(list(widths), dtype=np.float64)
+
+        def transform(root):
             if as_ == "ratio":
-                table_width = self.get_table_width()
-                width = [i / sum(width) * table_width for i in width]
-            self.TableColBegin()
-            for i in width:
-                self.TableColPageUp()
-                self.TableCellBlock()
-                self.TableCellBlockExtend()
-                self.TableColPageDown()
-                pset = self.HParameterSet.HShapeObject
-                self.HAction.GetDefault("TablePropertyDialog", pset.HSet)
-                pset.HSet.SetItem("ShapeType", 3)
-                pset.HSet.SetItem("ShapeCellSize", 1)
-                pset.ShapeTableCell.Width = self.MiliToHwpUnit(i)
-                self.HAction.Execute("TablePropertyDialog", pset.HSet)
-                self.Cancel()
-                self.TableRightCell()
-            return self.set_pos(*cur_pos)
+                table = table_xml.top_table(root)
+                total = sum(
+                    int(cell.get("Width", 0))
+                    for cell in table.find("ROW").findall("CELL")
+                )
+                target = widths / widths.sum() * total
+            elif as_ == "mm":
+                target = widths * 7200 / 25.4
+            elif as_.lower() in ("hwpunit", "hu"):
+                target = widths
+            else:
+                raise KeyError("ratio, mm, hwpunit 중 하나를 입력하셔야 합니다.")
+            table_xml.set_col_widths(root, target)
+
+        return self._rewrite_table(n, transform)
 
     def adjust_cellwidth(
             self, width: Union[int, float, list, tuple], as_: Literal["mm", "ratio"] = "ratio"
@@ -3669,43 +4435,7 @@ class Hwp(ParamHelpers, RunMethods):
             >>> hwp.get_into_nth_table(0)
             >>> hwp.adjust_cellwidth([1,2,3])
         """
-        cur_pos = self.get_pos()
-        if type(width) in (int, float):
-            if as_ == "ratio":
-                raise TypeError(
-                    'width에 int나 float 입력시 as_ 파라미터는 "mm"로 설정해주세요.'
-                )
-            self.TableColPageUp()
-            self.TableCellBlock()
-            self.TableCellBlockExtend()
-            self.TableColPageDown()
-            pset = self.HParameterSet.HShapeObject
-            self.HAction.GetDefault("TablePropertyDialog", pset.HSet)
-            pset.HSet.SetItem("ShapeType", 3)
-            pset.HSet.SetItem("ShapeCellSize", 1)
-            pset.ShapeTableCell.Width = self.MiliToHwpUnit(width)
-            try:
-                return self.HAction.Execute("TablePropertyDialog", pset.HSet)
-            finally:
-                self.set_pos(*cur_pos)
-        else:
-            if as_ == "ratio":
-                table_width = self.get_table_width()
-                width = [i / sum(width) * table_width for i in width]
-            self.TableColBegin()
-            for i in width:
-                self.TableColPageUp()
-                self.TableCellBlock()
-                self.TableCellBlockExtend()
-                self.TableColPageDown()
-                pset = self.HParameterSet.HShapeObject
-                self.HAction.GetDefault("TablePropertyDialog", pset.HSet)
-                pset.HSet.SetItem("ShapeType", 3)
-                pset.HSet.SetItem("ShapeCellSize", 1)
-                pset.ShapeTableCell.Width = self.MiliToHwpUnit(i)
-                self.HAction.Execute("TablePropertyDialog", pset.HSet)
-                self.TableRightCell()
-            return self.set_pos(*cur_pos)
+        return self.set_col_width(width, as_=as_)
 
     def get_table_width(
             self, as_: Literal["mm", "hwpunit", "point", "inch"] = "mm"
@@ -4368,6 +5098,51 @@ class Hwp(ParamHelpers, RunMethods):
         finally:
             self.hwp.HAction.Run("Cancel")
 
+    def fill_cells(
+            self,
+            color_matrix: Any,
+            n: Union[int, str, Any] = "",
+            cmap: Any = None,
+            vmin: Optional[float] = None,
+            vmax: Optional[float] = None,
+            startrow: int = 0,
+            startcol: int = 0,
+    ) -> bool:
+        """
+        표의 여러 셀에 각각 다른 배경색을 한 번에 채우는 메서드(히트맵 표 등).
+
+        셀마다 이동해서 cell_fill을 실행하는 대신, 표를 HWPML2X로 한 번 저장해서
+        서로 다른 (기존 테두리, 색) 조합마다 BORDERFILL을 하나씩만 만들고
+        모든 셀에 적용한 후 표를 한 번에 다시 붙여넣는다.
+
+        Args:
+            color_matrix: 셀 색상 행렬(numpy 배열, DataFrame, 중첩 리스트)
+
+                - (행, 열, 3) 모양의 RGB 값
+                - (행, 열) 모양의 (r, g, b) 튜플 또는 "#RRGGBB" 문자열. None인 칸은 칠하지 않는다.
+                - (행, 열) 모양의 숫자(cmap과 함께 사용). nan인 칸은 칠하지 않는다.
+            n: 표 인덱스(또는 표 컨트롤). 생략하면 캐럿이 들어있는 표, 표 밖이면 첫 번째 표
+            cmap: 숫자 행렬에 적용할 컬러맵. RGB 튜플의 리스트(선형보간) 또는 matplotlib 컬러맵 이름/객체
+            vmin, vmax: 컬러맵의 최소/최대값. 생략하면 행렬의 최소/최대값
+            startrow, startcol: color_matrix[0][0]을 적용할 셀의 행/열 인덱스(제목행 등을 건너뛸 때)
+
+        Returns:
+            성공시 True
+
+        Examples:
+            >>> import numpy as np
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> data = np.random.rand(40, 20)
+            >>> hwp.table_from_data(data)
+            >>> hwp.fill_cells(data, n=-1, cmap=[(255, 255, 255), (248, 105, 107)], startrow=1)
+            True
+        """
+        colors = table_xml.color_matrix_to_colorref(color_matrix, cmap=cmap, vmin=vmin, vmax=vmax)
+        return self._rewrite_table(
+            n, lambda root: table_xml.fill_cells(root, colors, startrow=startrow, startcol=startcol)
+        )
+
     def fields_to_dict(self):
         """
         현재 문서에 저장된 필드명과 필드값을
@@ -5164,9 +5939,204 @@ class Hwp(ParamHelpers, RunMethods):
         self.TableColBegin()
         self.Cancel()
 
-    def count(self, word):
+    def render_table(
+            self,
+            data: Union[pd.DataFrame, dict, list],
+            formats: Union[Dict[str, Any], str, None] = None,
+            align: Optional[Dict[str, str]] = None,
+            fills: Any = None,
+            header_fill: Union[Tuple[int, int, int], str, None] = (217, 217, 217),
+            header_bold: bool = True,
+            col_widths: Optional[List[float]] = None,
+            index: bool = False,
+            header0: str = "",
+            na_rep: str = "",
+            treat_as_char: bool = False,
+            header: bool = True,
+    ) -> bool:
+        """
+        데이터프레임을 서식(숫자형식, 열 정렬, 조건부 배경색, 열 너비)이 적용된 표로 한 번에 삽입하는 메서드.
+
+        table_from_data처럼 셀마다 insert_text를 실행하고 나중에 set_font, cell_fill, set_col_width로
+        서식을 입히는 대신, 파이썬에서 열 단위로 모든 셀의 문자열과 서식을 계산한 후
+        빈 표를 만들어 HWPML2X로 한 번에 채워넣는다.(표 생성 1회 + 구조 변경 1회)
+
+        Args:
+            data: 데이터프레임(또는 데이터프레임으로 변환 가능한 dict, list)
+            formats: 열 서식. {열이름: "{:,.0f}" 같은 format 문자열 또는 함수} 사전, 또는 모든 숫자 열에 적용할 format 문자열
+            align: {열이름: "left"/"center"/"right"/"justify"/"distribute"} 사전. 지정하지 않은 열은 숫자면 오른쪽, 아니면 가운데 정렬
+            fills: 조건부 배경색. {열이름: 열(Series)을 받아 셀별 색(RGB 튜플, "#RRGGBB", None)의 리스트를 리턴하는 함수} 사전, 또는 데이터와 같은 모양의 색 행렬
+            header_fill: 제목행 배경색. None이면 칠하지 않음
+            header_bold: 제목행을 진하게 할지 여부
+            col_widths: 열 너비의 비율(표 전체 너비는 유지)
+            index: 인덱스를 첫 번째 열로 넣을지 여부
+            header0: index=True일 때 첫 번째 셀의 문자열
+            na_rep: 빈 값(NaN, None)의 표시 문자열
+            treat_as_char: 글자처럼 취급 여부
+            header: 1행을 "제목행"으로 선택할지 여부
+
+        Returns:
+            성공시 True. 삽입 후 캐럿은 표의 첫 번째 셀에 위치한다.
+
+        Examples:
+            >>> import pandas as pd
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> df = pd.DataFrame({"지역": ["서울", "부산"], "매출": [1234567, 890123], "증감률": [0.052, -0.013]})
+            >>> hwp.render_table(
+            ...     df,
+            ...     formats={"매출": "{:,.0f}", "증감률": "{:+.1%}"},
+            ...     align={"지역": "left"},
+            ...     fills={"증감률": lambda s: [(255, 199, 206) if v < 0 else None for v in s]},
+            ...     col_widths=[2, 3, 2],
+            ... )
+            True
+        """
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        spec = table_xml.styled_table_spec(
+            df, formats=formats, align=align, fills=fills, header_fill=header_fill,
+            header_bold=header_bold, index=index, header0=header0, na_rep=na_rep,
+        )
+
+        def transform(root):
+            table_xml.fill_texts(root, spec["texts"], spec["aligns"], spec["bold"])
+            table_xml.fill_cells(root, spec["colors"])
+            if col_widths:
+                total = sum(int(cell.get("Width", 0)) for cell in table_xml.top_table(root).find("ROW").findall("CELL"))
+                widths = np.asarray(col_widths, dtype=np.float64)
+                table_xml.set_col_widths(root, widths / widths.sum() * total)
+
+        self.create_table(rows=spec["rows"], cols=spec["cols"], treat_as_char=treat_as_char, header=header)
+        return self._rewrite_table("", transform)
+
+    def _document_key(self) -> tuple:
+        """
+        문서 변경 여부를 판단하기 위한 지문(문서ID, 파일경로, 쪽수, 수정여부)을 리턴하는 헬퍼메서드.
+        """
+        doc = self.hwp.XHwpDocuments.Active_XHwpDocument
+        return doc.DocumentID, doc.FullName, self.hwp.PageCount, self.hwp.IsModified
+
+    def get_text_snapshot(self, refresh: bool = False) -> str:
+        """
+        문서 전체의 텍스트(UNICODE)를 캐시해두었다가 리턴하는 메서드.
+
+        문서가 바뀌지 않았다면 get_text_file을 다시 실행하지 않는다.
+        이 Hwp 인스턴스를 통해 문서를 바꿀 수 있는 호출(Move/Select 등 읽기 전용이 아닌 모든 액션,
+        PutFieldText 등의 메서드, hwp.hwp.HAction.Run 포함)을 하면 캐시가 자동으로 초기화되고,
+        문서ID, 파일경로, 쪽수, 수정여부(IsModified)가 바뀐 경우에도 다시 추출한다.
+        단, 사용자가 한/글 창에서 직접 고치거나 다른 Hwp 인스턴스(다른 스레드의 HwpHandle 등)로 고친 경우는
+        알아채지 못할 수 있으므로 refresh=True로 실행하거나 invalidate_text_snapshot()을 먼저 실행할 것.
+        count, count_many, count_regex는 기본적으로 이 캐시를 사용한다(cached=False로 끌 수 있음).
+
+        Args:
+            refresh: True인 경우 캐시를 무시하고 텍스트를 다시 추출한다.
+
+        Returns:
+            문서 전체의 텍스트
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> text = hwp.get_text_snapshot()  # 최초 1회만 추출
+            >>> text is hwp.get_text_snapshot()
+            True
+        """
+        key = self._document_key()
+        if refresh or self._text_snapshot is None or self._text_snapshot[0] != key:
+            self._text_snapshot = (key, self.get_text_file(option=""))
+        return self._text_snapshot[1]
+
+    def invalidate_text_snapshot(self) -> None:
+        """
+        get_text_snapshot의 캐시를 초기화하고, search 메서드의 색인을 갱신대상으로 표시한다.
+        """
+        self._text_snapshot = None
+        self._text_index_key = None
+
+    def count(self, word: str, cached: bool = True) -> int:
+        """
+        문서 안에서 특정 단어의 출현횟수를 리턴한다.
+
+        여러 단어를 셀 때는 count_many를 사용할 것.
+
+        Args:
+            word: 셀 단어
+            cached: True(기본값)인 경우 get_text_snapshot으로 캐시한 문서 텍스트를 사용한다.
+                블록을 선택한 상태에서는 캐시 없이 선택영역 안에서만 센다.
+
+        Returns:
+            출현횟수
+        """
+        if cached and not self.SelectionMode:
+            return self.get_text_snapshot().count(word)
         return self.get_text_file().count(word)
 
+    def _count_text(self, cached: bool) -> str:
+        # count_many, count_regex에서 사용할 문서 텍스트
+        return self.get_text_snapshot() if cached else self.get_text_file(option="")
+
+    def count_many(
+            self, terms: List[str], positions: bool = False, cached: bool = True
+    ) -> Dict[str, Union[int, List[int]]]:
+        """
+        여러 단어의 출현횟수를 한 번에 세는 메서드.
+
+        문서 텍스트는 한 번만 추출하고,
+        Aho-Corasick 방식으로 모든 단어를 한 번의 순회로 센다.
+        단어별 결과는 (선택영역이 없을 때) hwp.count(word)와 같다.
+
+        Args:
+            terms: 셀 단어의 리스트
+            positions: True인 경우 출현횟수 대신 텍스트 내 시작 인덱스의 리스트를 리턴한다.
+            cached: True(기본값)인 경우 get_text_snapshot으로 캐시한 문서 텍스트를 사용한다.
+
+        Returns:
+            {단어: 출현횟수} 또는 {단어: [시작 인덱스, ...]} 형식의 사전
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.count_many(["예산", "집행", "결산"])
+            {'예산': 12, '집행': 5, '결산': 0}
+        """
+        return count_terms(self._count_text(cached), terms, positions)
+
+    def count_regex(
+            self,
+            patterns: Union[str, List[str]],
+            positions: bool = False,
+            flags: int = 0,
+            cached: bool = True,
+    ) -> Dict[str, Union[int, List[Tuple[int, int]]]]:
+        """
+        여러 정규식 패턴의 매치 개수를 한 번에 세는 메서드.
+
+        문서 텍스트는 한 번만 추출하고, 각 패턴을 컴파일해서 순회한다.
+
+        Args:
+            patterns: 정규식 패턴 문자열 또는 패턴의 리스트
+            positions: True인 경우 매치 개수 대신 (시작, 끝) 인덱스 튜플의 리스트를 리턴한다.
+            flags: re.compile에 전달할 플래그
+            cached: True(기본값)인 경우 get_text_snapshot으로 캐시한 문서 텍스트를 사용한다.
+
+        Returns:
+            {패턴: 매치 개수} 또는 {패턴: [(시작, 끝), ...]} 형식의 사전
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.count_regex([r"\\d{4}년", r"제\\d+조"])
+            {'\\\\d{4}년': 3, '제\\\\d+조': 17}
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        text = self._count_text(cached)
+        result = {}
+        for pattern in patterns:
+            spans = [m.span() for m in re.finditer(pattern, text, flags)]
+            result[pattern] = spans if positions else len(spans)
+        return result
+
     def delete_all_fields(self):
         start_pos = self.get_pos()
         ctrl = self.hwp.HeadCtrl
@@ -5201,6 +6171,145 @@ class Hwp(ParamHelpers, RunMethods):
         pset.Color = self.rgb_color(r, g, b)
         return self.hwp.HAction.Execute("MarkPenShape", pset.HSet)
 
+    def highlight_diff(self, result: "DocDiff", r: int = 255, g: int = 255, b: int = 0, side: str = "b") -> int:
+        """
+        pyhwpx.diff 결과에서 바뀐 문단과 표 셀에 한꺼번에 형광펜을 칠한다.
+
+        보통 새 문서(b)를 열어둔 상태에서 삽입/변경된 블록을 칠하고,
+        옛 문서(a)를 열어둔 경우에는 side="a"로 삭제/변경된 블록을 칠한다.
+        작업이 끝나면 원래 캐럿 위치로 돌아온다.
+
+        Args:
+            result: pyhwpx.diff의 리턴값(DocDiff)
+            r, g, b: 형광펜 색(기본값은 노랑)
+            side: 현재 열린 문서가 새 문서면 "b", 옛 문서면 "a"
+
+        Returns:
+            형광펜을 칠한 선택영역 수(연속된 문단, 인접한 셀은 하나로 묶어서 칠한다)
+
+        Examples:
+            >>> import pyhwpx
+            >>> from pyhwpx import Hwp
+            >>> result = pyhwpx.diff("v1.hwpx", "v2.hwpx")
+            >>> hwp = Hwp()
+            >>> hwp.open("v2.hwpx")
+            >>> hwp.highlight_diff(result)
+            15
+        """
+        cur_pos = self.get_pos()
+        count = 0
+        paras, cells = set(), defaultdict(set)
+        for kind, para, table, row, col in result.positions(side):
+            if kind == "para":
+                paras.add(para)
+            elif table >= 0:
+                cells[table].add((row, col))
+        try:
+            # 연속된 문단은 한 번에 선택해서 칠한다.
+            for start, end in self._consecutive_runs(sorted(paras)):
+                if self.select_text(start, 0, end, -1, 0):
+                    count += bool(self.markpen_on_selection(r, g, b))
+                    self.Cancel()
+            tables = self._tables_in_document_order() if cells else []
+            for table, addrs in sorted(cells.items()):
+                if table >= len(tables):
+                    continue
+                self.set_pos_by_set(tables[table].GetAnchorPos(0))  # 표마다 한 번만 들어간다.
+                self.hwp.FindCtrl()
+                self.ShapeObjTableSelCell()
+                self.Cancel()
+                # 인접한 셀은 직사각형 셀 블록으로 묶어서 한 번에 칠한다.
+                for top, left, bottom, right in self._cell_rectangles(addrs):
+                    if not self.goto_addr(top + 1, left + 1):
+                        continue
+                    self.TableCellBlock()
+                    self.TableCellBlockExtend()
+                    for _ in range(right - left):
+                        self.TableRightCell()
+                    for _ in range(bottom - top):
+                        self.TableLowerCell()
+                    count += bool(self.markpen_on_selection(r, g, b))
+                    self.Cancel()
+        finally:
+            self.set_pos(*cur_pos)
+        return count
+
+    @staticmethod
+    def _consecutive_runs(numbers: List[int]) -> List[Tuple[int, int]]:
+        """
+        정렬된 정수 리스트를 연속된 구간 (시작, 끝)의 리스트로 묶는 헬퍼메서드.
+        """
+        runs = []
+        for number in numbers:
+            if runs and number == runs[-1][1] + 1:
+                runs[-1][1] = number
+            else:
+                runs.append([number, number])
+        return [tuple(run) for run in runs]
+
+    @classmethod
+    def _cell_rectangles(cls, addrs) -> List[Tuple[int, int, int, int]]:
+        """
+        (행, 열) 셀 주소들을 (top, left, bottom, right) 직사각형 블록의 리스트로 묶는 헬퍼메서드.
+
+        행마다 연속된 열을 묶고, 바로 윗행에 열 범위가 같은 블록이 있으면 아래로 이어붙인다.
+        """
+        by_row = defaultdict(list)
+        for row, col in addrs:
+            by_row[row].append(col)
+        rects, opened = [], {}
+        for row in sorted(by_row):
+            current = {}
+            for left, right in cls._consecutive_runs(sorted(set(by_row[row]))):
+                rect = opened.pop((left, right), None)
+                if rect is not None and rect[2] == row - 1:
+                    rect[2] = row
+                else:
+                    if rect is not None:
+                        rects.append(rect)
+                    rect = [row, left, row, right]
+                current[(left, right)] = rect
+            rects.extend(opened.values())
+            opened = current
+        rects.extend(opened.values())
+        return sorted(tuple(rect) for rect in rects)
+
+    def _tables_in_document_order(self) -> List[Any]:
+        """
+        문서의 모든 표 컨트롤을 문서(HWPML/HWPX의 TABLE 요소) 순서대로 리턴하는 헬퍼메서드.
+
+        HeadCtrl 목록은 한 번만 훑고, 표 안의 표는 부모 표 셀의 (행, 열) 뒤에 오도록 앵커 위치로 정렬한다.
+        (get_into_nth_table의 HeadCtrl 순서는 표의 위치 순서와 다를 수 있어서 diff의 표 번호와 맞지 않는다.)
+        캐럿 위치는 바뀔 수 있으므로 호출한 쪽에서 복원할 것.
+        """
+        tables, anchors = [], {}
+        ctrl = self.hwp.HeadCtrl
+        while ctrl:
+            if ctrl.CtrlID == "tbl":
+                anchor = ctrl.GetAnchorPos(0)
+                tables.append((ctrl, (anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos"))))
+            ctrl = ctrl.Next
+        keys: Dict[Tuple[int, int, int], tuple] = {}
+
+        def order_key(anchor: Tuple[int, int, int]) -> tuple:
+            # 본문(List 0)의 표는 (문단, 위치), 셀 안의 표는 부모 컨트롤의 키 + (행, 열, 문단, 위치)
+            if anchor in keys:
+                return keys[anchor]
+            list_, para, pos = anchor
+            key = (para, pos)
+            if list_ != 0 and self.set_pos(list_, 0, 0):
+                parent = self.hwp.ParentCtrl
+                row_col = self.get_cell_addr("tuple") if parent and parent.CtrlID == "tbl" else (0, 0)
+                if parent:
+                    parent_anchor = parent.GetAnchorPos(0)
+                    parent_anchor = (parent_anchor.Item("List"), parent_anchor.Item("Para"), parent_anchor.Item("Pos"))
+                    if parent_anchor != anchor:
+                        key = order_key(parent_anchor) + tuple(row_col or (0, 0)) + key
+            keys[anchor] = key
+            return key
+
+        return [ctrl for ctrl, anchor in sorted(tables, key=lambda t: order_key(t[1]))]
+
     def open_pdf(self, pdf_path: str, this_window: int = 1) -> bool:
         """
         pdf를 hwp문서로 변환하여 여는 함수.
@@ -5456,11 +6565,166 @@ class Hwp(ParamHelpers, RunMethods):
         for key, value in kwargs.items():
             setattr(pset, key, value)
         try:
-            return self.hwp.HAction.Execute("RepeatFind", pset.HSet)
+            return self.hwp.HAction.Execute("RepeatFind", pset.HSet)
+        finally:
+            self.SetMessageBoxMode(0xFFFFF)
+
+    def scan_text_chunks(self) -> List[Tuple[int, int, int, str]]:
+        """
+        init_scan/get_text로 문서 전체를 한 번 스캔해서
+        텍스트 조각과 그 시작위치를 리스트로 리턴하는 메서드.
+
+        조각마다 move_pos(201)로 시작위치를 확인하며, 문단 끝의 줄바꿈("\\r\\n")은 제거한 상태로 리턴한다.
+
+        Returns:
+            (list, para, pos, text) 튜플의 리스트(문서 순서)
+        """
+        cur_loc = self.get_pos()
+        chunks = []
+        if not self.init_scan():
+            return chunks
+        try:
+            state = 2
+            while state not in [0, 1]:
+                state, text = self.hwp.GetText()
+                text = text.rstrip("\r\n")
+                if state == 2 and text:
+                    self.move_pos(201)
+                    chunks.append((*self.get_pos(), text))
+        finally:
+            self.release_scan()
+            self.set_pos(*cur_loc)
+        return chunks
+
+    def build_text_index(self, ngram: int = 2) -> TextIndex:
+        """
+        search 메서드에서 사용할 위치 색인을 만드는 메서드.
+
+        실행할 때마다 문서 전체를 다시 스캔(scan_text_chunks)해서 색인을 새로 만든다.
+        search 메서드가 문서가 바뀐 경우에만 자동으로 실행하므로 직접 실행할 필요는 없다.
+
+        Args:
+            ngram: n-gram 길이
+
+        Returns:
+            TextIndex 인스턴스
+        """
+        self._text_index = TextIndex(ngram)
+        self._text_index.build(self.scan_text_chunks())
+        self._text_index_key = self._document_key()
+        return self._text_index
+
+    def search(self, query: str, refresh: bool = False, whole_word: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        문서 전체에서 query가 나타나는 모든 위치를 리턴하는 메서드.
+
+        캐럿을 옮겨가며 찾는 find와 달리,
+        처음 한 번 문서 전체의 위치 색인을 만들어두고 색인에서 찾는다.
+        문서가 바뀌면(get_text_snapshot과 같은 기준) 문서 전체를 다시 스캔해서 색인을 새로 만든다(build_text_index 참고).
+        이 기준으로는 이미 수정된 문서를 한/글 액션(hwp.Delete 등)으로 고친 경우를 알아채지 못하므로,
+        그럴 때는 refresh=True로 실행할 것. goto_hit은 이동한 위치의 문자열을 확인하므로 잘못된 위치를 선택하지 않는다.
+        찾은 위치로 이동할 때는 goto_hit 메서드를 사용한다.
+
+        Args:
+            query: 찾을 문자열(문단을 넘어가지 않는 문자열)
+            refresh: True인 경우 문서 변경여부와 무관하게 색인을 갱신한다.
+            whole_word: True인 경우 공백으로 구분된 단어와 정확히 일치하는 위치만 찾는다(토큰 색인 사용).
+
+        Returns:
+            (list, para, pos) 튜플의 리스트
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hits = hwp.search("예산")
+            >>> len(hits)
+            12
+            >>> hwp.goto_hit(3)  # 네 번째 "예산"으로 이동해서 선택
+            True
+        """
+        if refresh or self._text_index is None or self._text_index_key != self._document_key():
+            self.build_text_index(self._text_index.ngram if self._text_index else 2)
+        if whole_word:
+            positions = self._text_index.search_token(query)
+        else:
+            positions = self._text_index.search(query)
+        self._search_hits = [(*pos, len(query)) for pos in positions]
+        self._search_query = query
+        return [hit[:3] for hit in self._search_hits]
+
+    def goto_hit(self, i: int = 0, select: bool = True) -> bool:
+        """
+        마지막 search 결과 중 i번째 위치로 캐럿을 이동하는 메서드.
+
+        이동한 위치의 문자열이 검색어와 다르면(색인 후에 문서가 바뀐 경우) 캐럿을 원래 위치로 되돌리고,
+        다음 search에서 색인을 다시 만들도록 표시한 후 False를 리턴한다.
+
+        Args:
+            i: search 결과의 인덱스(음수 인덱스 가능)
+            select: True인 경우 찾은 문자열을 선택한다.
+
+        Returns:
+            성공하면 True, 검색결과가 없거나 i가 범위를 벗어나거나 위치가 맞지 않으면 False
+        """
+        if not -len(self._search_hits) <= i < len(self._search_hits):
+            return False
+        list_, para, pos, length = self._search_hits[i]
+        cur_loc = self.get_pos()
+        if not self.set_pos(list_, para, pos):
+            return False
+        self.hwp.SelectText(spara=para, spos=pos, epara=para, epos=pos + length)
+        if self.get_selected_text(keep_select=True) != self._search_query:
+            self._text_index_key = None
+            self.set_pos(*cur_loc)
+            return False
+        if not select:
+            self.set_pos(list_, para, pos)
+        return True
+
+    def scan_bracket_fields(self) -> List[dict]:
+        """
+        문서 전체를 한 번만 스캔(init_scan/get_text)해서
+        {{name:direction:memo}}, [[name]] 자리표시자의 위치를 모두 리턴하는 메서드.
+
+        자리표시자가 포함된 문단에서만 move_pos(201)로 위치를 확인하므로,
+        문서를 여러 번 찾아다니지 않는다.
+
+        Returns:
+            각 자리표시자의 정보를 담은 사전의 리스트(문서 순서).
+            kind("field", "cell" 또는 "unclosed"), name, direction, memo, list, para, pos, length를 키로 갖는다.
+            "unclosed"는 닫는 괄호가 없는 "{{", "[["의 위치다(find_bracket_fields 참고).
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.insert_text("{{name:이름}} [[cell]]")
+            >>> [(i["kind"], i["name"], i["direction"]) for i in hwp.scan_bracket_fields()]
+            [('field', 'name', '이름'), ('cell', 'cell', 'cell')]
+        """
+        cur_loc = self.get_pos()
+        hits = []
+        if not self.init_scan():
+            return hits
+        try:
+            state = 2
+            while state not in [0, 1]:
+                state, text = self.hwp.GetText()
+                if state != 2 or ("{{" not in text and "[[" not in text):
+                    continue
+                found = find_bracket_fields(text)
+                if not found:
+                    continue
+                self.move_pos(201)
+                list_, para, pos = self.get_pos()
+                for item in found:
+                    item["list"], item["para"], item["pos"] = list_, para, pos + item.pop("start")
+                    hits.append(item)
         finally:
-            self.SetMessageBoxMode(0xFFFFF)
+            self.release_scan()
+            self.set_pos(*cur_loc)
+        return hits
 
-    def set_field_by_bracket(self):
+    def set_field_by_bracket(self) -> List[dict]:
         """
         필드를 지정하는 일련의 반복작업을 간소화하기 위한 메서드.
 
@@ -5475,48 +6739,43 @@ class Hwp(ParamHelpers, RunMethods):
         셀 안에서 누름틀을 삽입할 수도 있지만,
         편의상 셀필드를 삽입하고 싶은 경우 "[[name]]"으로 지정하면 된다.
 
+        자리표시자의 위치는 scan_bracket_fields로 한 번에 수집하고,
+        앞쪽 위치가 바뀌지 않도록 문서의 뒤에서부터 역순으로 변환한다.
+        닫는 괄호가 없는 "{{", "[["(예: "{{a}")는 그대로 두고, 위치만 리턴값에 kind="unclosed"로 남긴다.
+
         Returns:
+            자리표시자 정보의 리스트(scan_bracket_fields의 리턴값과 동일).
+            kind가 "unclosed"인 항목은 변환하지 않은 위치다.
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.insert_text("{{name:이름}} {{oops}")
+            >>> result = hwp.set_field_by_bracket()
+            >>> [(i["list"], i["para"], i["pos"]) for i in result if i["kind"] == "unclosed"]
+            [(0, 0, 11)]
         """
         cur_loc = self.get_pos()
-        self.MoveDocBegin()
-        while self.find(r"\{\{[^(\}\})]+\}\}", regex=True):
-            field_name = self.get_selected_text(keep_select=True)[2:-2]
-            if ":" in field_name:
-                field_name, direction = field_name.split(":", maxsplit=1)
-                if ":" in direction:
-                    direction, memo = direction.split(":", maxsplit=1)
-                else:
-                    memo = ""
-            else:
-                direction = field_name
-                memo = ""
-            if self.get_selected_text(keep_select=True).endswith("\r\n"):
-                raise Exception("필드를 닫는 중괄호가 없습니다.")
-            self.hwp.HAction.Run("Delete")
-            self.create_field(field_name, direction, memo)
-
-        self.MoveDocBegin()
-        while self.find(r"\[\[[^\]\]]+\]\]", regex=True):
-            field_name = self.get_selected_text(keep_select=True)[2:-2]
-            if ":" in field_name:
-                field_name, direction = field_name.split(":", maxsplit=1)
-                if ":" in direction:
-                    direction, memo = direction.split(":", maxsplit=1)
-                else:
-                    memo = ""
-            else:
-                direction = field_name
-                memo = ""
-            if self.get_selected_text(keep_select=True).endswith("\r\n"):
-                raise Exception("필드를 닫는 중괄호가 없습니다.")
+        hits = self.scan_bracket_fields()
+        self.invalidate_text_snapshot()
+        targets = [hit for hit in hits if hit["kind"] != "unclosed"]
+        for hit in sorted(targets, key=lambda i: (i["list"], i["para"], i["pos"]), reverse=True):
+            self.set_pos(hit["list"], hit["para"], hit["pos"])
+            self.hwp.SelectText(
+                spara=hit["para"],
+                spos=hit["pos"],
+                epara=hit["para"],
+                epos=hit["pos"] + hit["length"],
+            )
             self.hwp.HAction.Run("Delete")
-            if self.is_cell():
+            if hit["kind"] == "field":
+                self.create_field(hit["name"], hit["direction"], hit["memo"])
+            elif self.is_cell():
                 self.set_cur_field_name(
-                    field_name, option=1, direction=direction, memo=memo
+                    hit["name"], option=1, direction=hit["direction"], memo=hit["memo"]
                 )
-            else:
-                pass
         self.set_pos(*cur_loc)
+        return hits
 
     def find_replace(
             self,
@@ -5543,22 +6802,25 @@ class Hwp(ParamHelpers, RunMethods):
         아래아한글의 찾아바꾸기와 동일한 액션을 수행하지만,
 
         regex=True로 설정하고 실행하면,
-        문단별로 잘라서 문서 전체를 순회하며
-        파이썬의 re.sub 함수를 실행한다.
+        문서 텍스트에서 파이썬 정규식에 처음 매치되는 문자열을 구한 후,
+        그 문자열을 direction 방향으로 한 번만 찾아 바꾼다.
+        문서 전체를 한 번에 바꾸려면 find_replace_all(regex=True)나 regex_replace_all을 사용한다.
+
+        Returns:
+            치환 성공시 True, 실패시 False
         """
+        self.invalidate_text_snapshot()
         self.SetMessageBoxMode(0x2FFF1)
         pset = self.hwp.HParameterSet.HFindReplace
         self.hwp.HAction.GetDefault("FindDlg", pset.HSet)
         self.hwp.HAction.Execute("FindDlg", pset.HSet)
         if regex:
             whole_text = self.get_text_file(option="")
-            src_list = [i.group() for i in re.finditer(src, whole_text)]
-            dst_list = [re.sub(src, dst, i) for i in src_list]
-            for i, j in zip(src_list, dst_list):
-                try:
+            try:
+                for match in re.finditer(src, whole_text):
                     return self.find_replace(
-                        i,
-                        j,
+                        match.group(),
+                        match.expand(dst),
                         direction=direction,
                         MatchCase=MatchCase,
                         AllWordForms=AllWordForms,
@@ -5575,9 +6837,9 @@ class Hwp(ParamHelpers, RunMethods):
                         ReplaceStyle=ReplaceStyle,
                         FindType=FindType,
                     )
-                finally:
-                    self.SetMessageBoxMode(0xFFFFF)
-
+                return False
+            finally:
+                self.SetMessageBoxMode(0xFFFFF)
         else:
             pset = self.hwp.HParameterSet.HFindReplace
             # self.hwp.HAction.GetDefault("ExecReplace", pset.HSet)
@@ -5626,39 +6888,25 @@ class Hwp(ParamHelpers, RunMethods):
             FindType=1,
     ):
         """
-        아래아한글의 찾아바꾸기와 동일한 액션을 수항해지만,
+        아래아한글의 찾아바꾸기와 동일한 액션을 수행하지만,
+
+        regex=True로 설정하고 실행하면,
+        문서 전체를 대상으로 파이썬 정규식 치환을 실행한다.
+        (내부적으로 regex_replace_all 메서드를 사용한다.)
 
-        re=True로 설정하고 실행하면,
-        문단별로 잘라서 문서 전체를 순회하며
-        파이썬의 re.sub 함수를 실행한다.
+        Returns:
+            치환 성공시 True, 실패시 False
         """
+        self.invalidate_text_snapshot()
         self.SetMessageBoxMode(0x2FFF1)
         pset = self.hwp.HParameterSet.HFindReplace
         self.hwp.HAction.GetDefault("FindDlg", pset.HSet)
         self.hwp.HAction.Execute("FindDlg", pset.HSet)
         if regex:
-            whole_text = self.get_text_file(option="")
-            src_list = [i.group() for i in re.finditer(src, whole_text)]
-            dst_list = [re.sub(src, dst, i) for i in src_list]
-            for i, j in zip(src_list, dst_list):
-                self.find_replace_all(
-                    i,
-                    j,
-                    MatchCase=MatchCase,
-                    AllWordForms=AllWordForms,
-                    SeveralWords=SeveralWords,
-                    UseWildCards=UseWildCards,
-                    WholeWordOnly=WholeWordOnly,
-                    AutoSpell=AutoSpell,
-                    IgnoreFindString=IgnoreFindString,
-                    IgnoreReplaceString=IgnoreReplaceString,
-                    ReplaceMode=ReplaceMode,
-                    HanjaFromHangul=HanjaFromHangul,
-                    FindJaso=FindJaso,
-                    FindStyle=FindStyle,
-                    ReplaceStyle=ReplaceStyle,
-                    FindType=FindType,
-                )
+            try:
+                return bool(self.regex_replace_all(src, dst, FindStyle=FindStyle, ReplaceStyle=ReplaceStyle)[src])
+            finally:
+                self.SetMessageBoxMode(0xFFFFF)
         else:
             pset = self.hwp.HParameterSet.HFindReplace
             # self.hwp.HAction.GetDefault("AllReplace", pset.HSet)
@@ -5691,6 +6939,194 @@ class Hwp(ParamHelpers, RunMethods):
             finally:
                 self.SetMessageBoxMode(0xFFFFF)
 
+    def regex_replace_all(
+            self,
+            src: Union[str, Dict[str, str]],
+            dst: str = "",
+            flags: int = 0,
+            FindStyle: str = "",
+            ReplaceStyle: str = "",
+    ) -> Dict[str, int]:
+        """
+        문서 전체에 파이썬 정규식 치환을 일괄 적용하는 메서드.
+
+        문서 텍스트를 한 번만 추출해서 모든 매치를 계산한 후,
+        (찾을 문자열, 바꿀 문자열) 쌍이 같은 매치끼리 묶어서
+        서로 다른 쌍마다 AllReplace 액션을 한 번씩만 실행한다.
+        예를 들어 1만 개의 매치가 100종류의 치환쌍으로 묶이면 AllReplace는 100번만 실행된다.
+
+        단, 한/글의 AllReplace는 찾은 문자열을 그대로(정규식 없이) 모두 바꾸므로
+        앞뒤 문맥(\\b, 전방탐색 등)에 따라 매치 여부가 갈리는 패턴이나,
+        바꿀 문자열 안에 다른 쌍의 찾을 문자열이 들어있는 경우에는 결과가 정규식 치환과 달라진다.
+        그래서 먼저 추출한 텍스트에 같은 순서의 문자열 치환을 적용해보고,
+        정규식 치환 결과와 다르면 AllReplace 대신 매치 위치마다(문서 뒤쪽부터) 직접 바꾼다.
+
+        여러 패턴을 사전으로 넘기면 순서대로 적용하며,
+        뒤쪽 패턴의 매치는 앞쪽 패턴을 치환한 결과 텍스트를 기준으로 계산한다.
+        문단을 넘어가는(줄바꿈이 포함된) 매치는 치환하지 않는다.
+
+        Args:
+            src: 정규식 패턴 문자열, 또는 {패턴: 바꿀 문자열} 형식의 사전
+            dst: 바꿀 문자열(\\1, \\g<name> 등 그룹 참조 가능). src가 사전이면 무시한다.
+            flags: re.compile에 전달할 플래그(예: re.IGNORECASE)
+            FindStyle: 찾을 글자모양(AllReplace로 치환할 수 있는 경우에만 사용 가능)
+            ReplaceStyle: 바꿀 글자모양(AllReplace로 치환할 수 있는 경우에만 사용 가능)
+
+        Returns:
+            {패턴: 치환한 매치 개수} 형식의 사전
+
+        Raises:
+            ValueError: FindStyle/ReplaceStyle을 지정했는데 위치별 치환이 필요한 경우
+                (모든 패턴을 먼저 검사하므로, 예외가 나면 문서는 바뀌지 않는다.)
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.insert_text("2024-01-02, 2024-03-04")
+            >>> hwp.regex_replace_all(r"(\\d{4})-(\\d{2})-(\\d{2})", r"\\1년 \\2월 \\3일")
+            {'(\\\\d{4})-(\\\\d{2})-(\\\\d{2})': 2}
+            >>> hwp.regex_replace_all({r"\\s+,": ",", r"년\\s": "년"})
+            {'\\\\s+,': 0, '년\\\\s': 2}
+        """
+        patterns = src if isinstance(src, dict) else {src: dst}
+        whole_text = self.get_text_file(option="")
+        # 문서를 건드리기 전에 모든 패턴과 바꿀 문자열을 검사하고 치환 방법을 정해둔다.
+        # (중간 패턴에서 예외가 나서 문서의 일부만 바뀌는 일이 없도록)
+        plans = []
+        for pattern, replacement in patterns.items():
+            regex = re.compile(pattern, flags)
+            pairs = defaultdict(int)
+
+            def expand(match: re.Match) -> str:
+                found = match.group()
+                if not found or "\r" in found or "\n" in found:
+                    return found
+                new = match.expand(replacement)
+                pairs[(found, new)] += 1
+                return new
+
+            expected = regex.sub(expand, whole_text)
+            ordered = sorted((pair for pair in pairs if pair[0] != pair[1]),
+                             key=lambda pair: len(pair[0]), reverse=True)
+            simulated = whole_text
+            for found, new in ordered:
+                simulated = simulated.replace(found, new)
+            if simulated != expected and (FindStyle or ReplaceStyle):
+                raise ValueError(
+                    f"'{pattern}' 패턴은 위치별로 치환해야 하므로 FindStyle/ReplaceStyle을 사용할 수 없습니다."
+                )
+            plans.append((pattern, regex, replacement, sum(pairs.values()),
+                          ordered if simulated == expected else None))
+            whole_text = expected
+
+        result = {}
+        for pattern, regex, replacement, count, ordered in plans:
+            if ordered is not None:
+                self._all_replace_pairs(ordered, FindStyle, ReplaceStyle)
+                result[pattern] = count
+            else:
+                result[pattern] = self._replace_at_positions(regex, replacement)
+        return result
+
+    def _replace_at_positions(self, regex: re.Pattern, replacement: str) -> int:
+        """
+        init_scan/GetText로 읽은 텍스트 조각을 하나로 이어붙인 전체 텍스트에서 정규식 매치를 찾고,
+        매치의 시작/끝 오프셋을 조각별 시작위치(list, para, pos)로 환산한 후
+        앞쪽 위치가 바뀌지 않도록 문서의 뒤쪽 매치부터 선택-삭제-삽입으로 바꾸는 헬퍼메서드.
+        컨트롤 등으로 조각이 나뉘어도 같은 리스트 안이면 매치를 찾을 수 있지만,
+        서로 다른 리스트(표의 셀 등)에 걸친 매치와 줄바꿈이 포함된 매치는 치환하지 않는다.
+
+        Returns:
+            치환한 매치 개수
+        """
+        cur_loc = self.get_pos()
+        texts = []
+        starts = []  # 조각마다 (전체 텍스트 오프셋, list, para, pos)
+        offset = 0
+        if not self.init_scan():
+            return 0
+        try:
+            state = 2
+            while state not in [0, 1]:
+                state, text = self.hwp.GetText()
+                if state != 2 or not text:
+                    continue
+                self.move_pos(201)
+                list_, para, pos = self.get_pos()
+                if starts and starts[-1][1] != list_:
+                    texts.append("\n")  # 리스트가 바뀌는 곳에서는 매치가 이어지지 않도록
+                    offset += 1
+                starts.append((offset, list_, para, pos))
+                texts.append(text)
+                offset += len(text)
+        finally:
+            self.release_scan()
+        offsets = [start[0] for start in starts]
+
+        def locate(index: int) -> Tuple[int, int, int]:
+            chunk_offset, list_, para, pos = starts[bisect_right(offsets, index) - 1]
+            return list_, para, pos + index - chunk_offset
+
+        hits = []
+        for m in regex.finditer("".join(texts)):
+            if not m.group() or "\r" in m.group() or "\n" in m.group():
+                continue
+            slist, spara, spos = locate(m.start())
+            elist, epara, epos = locate(m.end() - 1)
+            if slist != elist:
+                continue
+            hits.append((slist, spara, spos, epara, epos + 1, m.expand(replacement)))
+        if hits:
+            self.invalidate_text_snapshot()
+        for list_, spara, spos, epara, epos, new in reversed(hits):
+            self.set_pos(list_, spara, spos)
+            self.hwp.SelectText(spara=spara, spos=spos, epara=epara, epos=epos)
+            self.hwp.HAction.Run("Delete")
+            if new:
+                self.insert_text(new)
+        self.set_pos(*cur_loc)
+        return len(hits)
+
+    def _all_replace_pairs(
+            self, pairs: List[Tuple[str, str]], FindStyle: str = "", ReplaceStyle: str = ""
+    ) -> None:
+        """
+        (찾을 문자열, 바꿀 문자열) 쌍마다 AllReplace 액션을 한 번씩 실행하는 헬퍼메서드.
+
+        파라미터셋은 한 번만 만들고 FindString/ReplaceString만 바꿔가며 실행한다.
+        짧은 문자열이 긴 문자열의 일부를 먼저 바꾸지 않도록 긴 문자열부터 처리한다.
+        """
+        if not pairs:
+            return
+        self.invalidate_text_snapshot()
+        self.SetMessageBoxMode(0x2FFF1)
+        try:
+            pset = self.hwp.HParameterSet.HFindReplace
+            self.hwp.HAction.GetDefault("AllReplace", pset.HSet)
+            pset.MatchCase = 1
+            pset.AllWordForms = 0
+            pset.SeveralWords = 0
+            pset.UseWildCards = 0
+            pset.WholeWordOnly = 0
+            pset.AutoSpell = 0
+            pset.Direction = self.hwp.FindDir("AllDoc")
+            pset.IgnoreFindString = 0
+            pset.IgnoreReplaceString = 0
+            pset.ReplaceMode = 1
+            pset.IgnoreMessage = 1
+            pset.HanjaFromHangul = 0
+            pset.FindJaso = 0
+            pset.FindRegExp = 0
+            pset.FindStyle = FindStyle
+            pset.ReplaceStyle = ReplaceStyle
+            pset.FindType = 1
+            for found, replacement in sorted(pairs, key=lambda pair: len(pair[0]), reverse=True):
+                pset.FindString = found
+                pset.ReplaceString = replacement
+                self.hwp.HAction.Execute("AllReplace", pset.HSet)
+        finally:
+            self.SetMessageBoxMode(0xFFFFF)
+
     def clipboard_to_pyfunc(self):
         """
         한/글 프로그램에서 스크립트매크로 녹화 코드를 클립보드에 복사하고
@@ -5930,40 +7366,76 @@ class Hwp(ParamHelpers, RunMethods):
                 pset.ShapeTableCell.Header = header
                 self.hwp.HAction.Execute("TablePropertyDialog", pset.HSet)
 
-    def get_selected_text(self, as_: Literal["list", "str"] = "str", keep_select: bool = False):
+    def get_selected_text(
+            self,
+            as_: Literal["list", "str", "iter"] = "str",
+            keep_select: bool = False,
+            with_pos: bool = False,
+    ):
         """
         한/글 문서 선택 구간의 텍스트를 리턴하는 메서드.
         표 안에 있을 때는 셀의 문자열을, 본문일 때는 선택영역 또는 현재 단어를 리턴.
 
+        GetText로 읽은 조각을 리스트에 모은 후 한 번에 join하므로,
+        수백 페이지를 선택한 경우에도 선택영역의 크기에 비례하는 시간이 걸린다.
+
         Args:
-            as_: 문자열 형태로 리턴할지("str"), 리스트 형태로 리턴할지("list") 결정.
+            as_: 리턴 형태.
+
+                - "str": 문자열(기본값)
+                - "list": GetText 조각의 리스트
+                - "iter": GetText 조각을 하나씩 내주는 제너레이터(반복을 시작할 때 블록을 선택하고, 반복이 끝나거나 제너레이터가 닫힐 때 스캔을 해제한다.)
+            keep_select: True인 경우 리턴 후에도 블록선택 상태를 유지한다.
+            with_pos: True인 경우 "list", "iter"의 각 조각을 (list, para, pos, text) 튜플로 리턴한다. 위치는 move_pos(201)로 확인한 조각의 시작위치이며, 이 경우 캐럿이 이동하므로 keep_select=True일 때는 스캔 후 블록을 다시 선택한다.
         Returns:
-            선택한 문자열 또는 셀 문자열
-        """
+            선택한 문자열 또는 셀 문자열(as_="list"/"iter"인 경우 조각의 리스트/제너레이터)
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.get_selected_text()
+            '선택한 문자열\r\n'
+            >>> for list_, para, pos, text in hwp.get_selected_text(as_="iter", with_pos=True):
+            ...     print(list_, para, pos, text)
+            0 0 0 선택한 문자열
+        """
+        chunks = self._iter_selected_text(keep_select, with_pos, tail=as_ == "str")
+        if as_ == "iter":
+            return chunks
+        if as_ == "list":
+            return list(chunks)
+        return "".join(chunks)
+
+    def _iter_selected_text(self, keep_select: bool = False, with_pos: bool = False, tail: bool = False):
+        # tail=True이면 스캔을 끝내는 마지막 GetText 조각도 내준다(문자열 리턴용).
+        # 리스트/제너레이터는 종전처럼(result[:-1]) 마지막 조각을 뺀다.
         if self.SelectionMode == 0:
             if self.is_cell():
                 self.TableCellBlock()
             else:
                 self.Select()
                 self.Select()
+        marked_area = self.get_selected_pos() if with_pos and keep_select else None
         if not self.hwp.InitScan(Range=0xFF):
             self.Cancel()
-            return ""
-        if as_ == "list":
-            result = []
-        else:
-            result = ""
-        state = 2
-        while state not in [0, 1]:
+            return
+        try:
             state, text = self.hwp.GetText()
-            if as_ == "list":
-                result.append(text)
-            else:
-                result += text
-        self.hwp.ReleaseScan()
-        if not keep_select:
-            self.Cancel()
-        return result if type(result) == str else result[:-1]
+            while state not in [0, 1]:
+                if with_pos:
+                    self.move_pos(201)
+                    yield (*self.get_pos(), text)
+                else:
+                    yield text
+                state, text = self.hwp.GetText()
+            if tail and text:
+                yield text
+        finally:
+            self.hwp.ReleaseScan()
+            if marked_area is not None and marked_area[0]:
+                self.select_text(marked_area)
+            elif not keep_select:
+                self.Cancel()
 
     def table_to_csv(
             self, n="", filename="result.csv", encoding="utf-8", startrow=0
@@ -6292,6 +7764,231 @@ class Hwp(ParamHelpers, RunMethods):
             if self.SelectionMode != 19:
                 self.set_pos(*start_pos)
 
+    def _select_table(self, n: Union[int, str, Any] = "") -> Any:
+        # n번째 표(n이 ""이면 캐럿이 들어있는 표, 표 밖이면 첫 번째 표)를 개체선택하고 표 컨트롤을 리턴
+        if n == "" and self.is_cell():
+            ctrl = self.hwp.ParentCtrl
+        elif isinstance(n, (int, str)):
+            ctrl = self.get_into_nth_table(0 if n == "" else n)
+            if not ctrl:
+                raise IndexError("해당 인덱스의 표가 존재하지 않습니다.")
+        else:
+            ctrl = n
+        self.set_pos_by_set(ctrl.GetAnchorPos(0))
+        self.hwp.FindCtrl()
+        return ctrl
+
+    def _export_table_hwpml(self, n: Union[int, str, Any] = "") -> str:
+        # n번째 표를 HWPML2X 임시파일로 저장하고 경로를 리턴(캐럿 위치는 복원). 파일 삭제는 호출한 쪽에서.
+        cur_pos = self.get_pos()
+        fd, path = tempfile.mkstemp(suffix=".xml")
+        os.close(fd)
+        try:
+            self._select_table(n)
+            if not self.save_block_as(path, format="HWPML2X"):
+                xml_data = self.GetTextFile("HWPML2X", option="saveblock")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(re.sub(r"^\s*<\?xml[^>]*\?>", "", xml_data))
+        except BaseException:
+            os.remove(path)
+            raise
+        finally:
+            self.set_pos(*cur_pos)
+        return path
+
+    def _rewrite_table(self, n: Union[int, str, Any], transform) -> bool:
+        # n번째 표를 HWPML2X로 저장해서 transform(root)로 고친 후, 원래 자리에 다시 붙여넣는다.(표 하나당 한 번의 구조 변경)
+        # 캐럿이 그 표 안에 있었다면 같은 셀로, 아니면 원래 위치로 돌아간다.
+        # transform 등에서 예외가 발생해도 선택을 풀고 캐럿과 보기 설정을 원래대로 되돌린다.
+        cur_pos = self.get_pos()
+        cell_offset = None
+        cur_view_state = None
+        result = None
+        in_table = n == "" and self.is_cell()
+        try:
+            ctrl = self._select_table(n)
+            if in_table:
+                self.ShapeObjTableSelCell()
+                cell_offset = cur_pos[0] - self.get_pos()[0]
+                self.Cancel()
+                self._select_table(ctrl)
+            anchor = ctrl.GetAnchorPos(0)
+            anchor = (anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos"))
+            root = ET.fromstring(self.GetTextFile("HWPML2X", option="saveblock"))
+            transform(root)
+            t = ET.tostring(root, encoding="UTF-16").decode("utf-16")
+            self.invalidate_text_snapshot()
+
+            cur_view_state = self.ViewProperties.Item("OptionFlag")
+            if cur_view_state not in (2, 6):
+                prop = self.ViewProperties
+                prop.SetItem("OptionFlag", 6)
+                self.ViewProperties = prop
+            self.move_to_ctrl(ctrl)
+            self.MoveSelRight()
+            self.HAction.Run("Delete")
+            result = self.SetTextFile(t, format="HWPML2X", option="insertfile")
+        finally:
+            if cur_view_state is not None:
+                prop = self.ViewProperties
+                prop.SetItem("OptionFlag", cur_view_state)
+                self.ViewProperties = prop
+            if result is None:  # 도중에 예외가 발생한 경우
+                self.Cancel()
+                self.set_pos(*cur_pos)
+
+        if cell_offset is None:
+            self.set_pos(*cur_pos)
+        else:
+            self.set_pos(*anchor)
+            self.hwp.FindCtrl()
+            self.ShapeObjTableSelCell()
+            self.Cancel()
+            self.set_pos(self.get_pos()[0] + cell_offset, 0, 0)
+        return bool(result)
+
+    def iter_table_rows(self, n: Union[int, str, Any] = "", startrow: int = 0):
+        """
+        한/글 문서의 n번째 표를 한 행씩 문자열 리스트로 내주는 제너레이터 메서드.
+
+        표를 HWPML2X 임시파일로 한 번 저장한 후 iterparse로 조금씩 읽고,
+        읽은 행은 바로 메모리에서 해제하므로 수십만 행의 표도 메모리를 거의 쓰지 않고 읽을 수 있다.
+        병합된 셀(RowSpan, ColSpan)의 값은 table_to_df와 마찬가지로 병합된 모든 칸에 채워넣는다.
+
+        Args:
+            n: 표 인덱스(또는 표 컨트롤). 생략하면 캐럿이 들어있는 표, 표 밖이면 첫 번째 표
+            startrow: 시작 행 인덱스(그 앞의 행은 건너뜀)
+
+        Yields:
+            열 개수만큼의 문자열 리스트
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> for row in hwp.iter_table_rows(0):
+            ...     print(row)
+            ['이름', '나이']
+            ['홍길동', '30']
+        """
+        path = self._export_table_hwpml(n)
+        try:
+            for i, row in enumerate(table_xml.iter_rows(path)):
+                if i >= startrow:
+                    yield row
+        finally:
+            os.remove(path)
+
+    def table_geometry(
+            self, n: Union[int, str, Any] = "", as_: Literal["mm", "hwpunit", "point", "inch"] = "mm"
+    ) -> Dict[str, Any]:
+        """
+        한/글 문서의 n번째 표의 모든 셀 너비, 높이, 병합, 여백을 numpy 배열로 리턴하는 메서드.
+
+        get_col_width, get_row_height 등은 캐럿이 들어있는 셀 하나의 값만 알려주므로
+        전체 값을 알려면 모든 셀로 이동해야 하지만, 이 메서드는 표를 HWPML2X로 한 번만 저장해서
+        CELL 요소의 Width, Height 등의 속성을 읽고, 단위 변환도 배열 연산으로 한 번에 처리한다.
+
+        배열은 (행 개수, 열 개수) 모양이며, 병합된 셀의 값은 시작 칸(좌상단)에만 들어있다.
+        (병합으로 가려진 칸의 width/height는 nan, row_span/col_span은 0)
+
+        Args:
+            n: 표 인덱스(또는 표 컨트롤). 생략하면 캐럿이 들어있는 표, 표 밖이면 첫 번째 표
+            as_: 길이 단위("mm", "hwpunit", "point", "inch")
+
+        Returns:
+            다음 키를 갖는 사전
+
+                - width, height: 셀 너비, 높이
+                - row_span, col_span: 병합된 행/열 개수
+                - margin_left, margin_right, margin_top, margin_bottom: 셀 안쪽 여백
+                - border_fill: 셀 테두리/배경의 BorderFill 아이디
+                - col_widths, row_heights: 열 너비, 행 높이(1차원 배열. 병합되지 않은 셀 기준)
+                - table_width, table_height: 표 전체의 너비, 높이
+                - outside_margin: 표 바깥 여백(좌, 우, 상, 하)
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> geo = hwp.table_geometry(0)
+            >>> geo["col_widths"]
+            array([49.2, 49.2, 49.2])
+            >>> geo["height"].shape
+            (3, 3)
+        """
+        path = self._export_table_hwpml(n)
+        try:
+            return table_xml.geometry(path, as_=as_)
+        finally:
+            os.remove(path)
+
+    def table_rows_to_file(
+            self,
+            n: Union[int, str, Any] = "",
+            filename: str = "result.csv",
+            encoding: str = "utf-8",
+            startrow: int = 0,
+            chunk_rows: int = 10000,
+    ) -> int:
+        """
+        한/글 문서의 n번째 표를 iter_table_rows로 읽으면서 바로 csv 또는 parquet 파일로 저장하는 메서드.
+
+        표 전체를 데이터프레임으로 만들지 않으므로, table_to_df로 다루기 어려운 대형 표에 사용한다.
+        startrow번째 행을 칼럼명으로 사용한다.
+        parquet 저장에는 pyarrow 패키지가 필요하다.
+
+        Args:
+            n: 표 인덱스(또는 표 컨트롤)
+            filename: 저장할 파일명. 확장자가 ".parquet"이면 parquet, 그 외에는 csv로 저장
+            encoding: csv 인코딩
+            startrow: 칼럼명으로 사용할 행 인덱스
+            chunk_rows: parquet 저장시 한 번에 기록할 행 수
+
+        Returns:
+            저장한 행 수(칼럼명 제외)
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> hwp.table_rows_to_file(0, "통계표.parquet")
+            100000
+        """
+        rows = self.iter_table_rows(n, startrow=startrow)
+        columns = next(rows, None)
+        if columns is None:
+            return 0
+        count = 0
+        if not filename.lower().endswith(".parquet"):
+            import csv
+
+            with open(filename, "w", encoding=encoding, newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            return count
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            rows.close()
+            raise ImportError("parquet 파일로 저장하려면 pyarrow 패키지를 설치해야 합니다. (pip install pyarrow)")
+        names = [str(c) if c else f"col{i}" for i, c in enumerate(columns)]
+        schema = pa.schema([(name, pa.string()) for name in names])
+        with pq.ParquetWriter(filename, schema) as writer:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_rows:
+                    writer.write_table(pa.Table.from_arrays([pa.array(list(col)) for col in zip(*chunk)], schema=schema))
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                writer.write_table(pa.Table.from_arrays([pa.array(list(col)) for col in zip(*chunk)], schema=schema))
+                count += len(chunk)
+        return count
+
     def table_to_bottom(self, offset: float = 0.0) -> bool:
         """
         표 앞에 캐럿을 둔 상태 또는 캐럿이 표 안에 있는 상태에서 위 함수 실행시
@@ -6329,11 +8026,43 @@ class Hwp(ParamHelpers, RunMethods):
             >>> hwp.insert_text('Hello world!')
             >>> hwp.BreakPara()
         """
+        self.invalidate_text_snapshot()
         param = self.hwp.HParameterSet.HInsertText
         self.hwp.HAction.GetDefault("InsertText", param.HSet)
         param.Text = text
         return self.hwp.HAction.Execute("InsertText", param.HSet)
 
+    def writer(self, max_chars: int = 1 << 16, max_items: int = 2000, font: str = "함초롬바탕",
+               size: float = 10.0) -> HwpWriter:
+        """
+        insert_text/BreakPara 호출을 모아두었다가 set_text_file 한 번으로 삽입하는 버퍼 기록기를 리턴한다.
+
+        짧은 문자열을 수천 번 insert_text하는 스크립트는 호출마다 COM 왕복 비용이 들지만,
+        writer를 쓰면 max_chars 글자 또는 max_items 호출마다(그리고 with 블록 종료시) 한 번만 삽입한다.
+        서식(bold, size, align 등), 쪽 나누기, 표는 pyhwpx.hml로 변환해서 함께 삽입한다.
+        자세한 내용은 pyhwpx.writer.HwpWriter 참고.
+
+        Args:
+            max_chars: 버퍼에 모을 최대 글자 수
+            max_items: 버퍼에 모을 최대 호출 수
+            font: 서식이 있는 경우의 기본 글꼴
+            size: 서식이 있는 경우의 기본 글자 크기(pt)
+
+        Returns:
+            HwpWriter 인스턴스. with 블록이 끝나면 자동으로 flush된다.
+
+        Examples:
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> with hwp.writer() as w:
+            ...     w.paragraph("목록", bold=True, size=14)
+            ...     for i in range(5000):
+            ...         w.paragraph(f"{i}번째 줄")
+            >>> print(w.stats)
+            {'calls': 10003, 'flushes': 3, 'saved': 10000, 'chars': 40892}
+        """
+        return HwpWriter(self, max_chars=max_chars, max_items=max_items, font=font, size=size)
+
     def insert_lorem(self, para_num: int = 1) -> bool:
         """
         Lorem Ipsum을 캐럿 위치에 작성한다.
@@ -6445,6 +8174,7 @@ class Hwp(ParamHelpers, RunMethods):
             >>> hwp = Hwp()
             >>> hwp.clear()
         """
+        self.invalidate_text_snapshot()
         return self.hwp.XHwpDocuments.Active_XHwpDocument.Clear(option=option)
 
     def Clear(self, option: int = 1) -> None:
@@ -6691,11 +8421,10 @@ class Hwp(ParamHelpers, RunMethods):
         return self.delete_ctrl(ctrl)
 
     def EquationCreate(self, thread=False):
-        visible = self.hwp.XHwpWindows.Active_XHwpWindow.Visible
         if thread:
             if win32gui.FindWindow(None, "수식 편집기"):
                 return False
-            t = threading.Thread(target=_eq_create, args=(visible,), name="eq_create")
+            t = threading.Thread(target=_eq_create, args=(self.marshal(),), name="eq_create")
             t.start()
             t.join(timeout=0)
             return True
@@ -6706,11 +8435,10 @@ class Hwp(ParamHelpers, RunMethods):
         return _close_eqedit(save, delay)
 
     def EquationModify(self, thread=False):
-        visible = self.hwp.XHwpWindows.Active_XHwpWindow.Visible
         if thread:
             if win32gui.FindWindow(None, "수식 편집기"):
                 return False
-            t = threading.Thread(target=_eq_modify, args=(visible,), name="eq_modify")
+            t = threading.Thread(target=_eq_modify, args=(self.marshal(),), name="eq_modify")
             t.start()
             t.join(timeout=0)
             return True
@@ -8186,6 +9914,39 @@ class Hwp(ParamHelpers, RunMethods):
     def MoveToMetatag(self, tag, text, start, select):
         return self.move_to_metatag(tag, text, start, select)
 
+    def render_template(self, template: str, context: Dict[str, Any], filename: Optional[str] = None) -> bool:
+        """
+        HWPX(.hwpx) 또는 HWPML(.hml) 서식파일을 한/글 없이 메모리에서 채운 후, 결과 문서를 한 번에 연다.
+
+        `{{이름}}` 치환, `{{#each 목록}}`~`{{/each}}` 반복(문단 묶음 또는 표의 행), `{{#if 이름}}`~`{{else}}`~`{{/if}}` 조건을
+        지원한다. 태그 문법은 pyhwpx.template.render_template 참고.
+        put_field_text와 TableAppendRow를 반복하는 대신 파일을 한 번만 열면 되므로
+        수천 행짜리 표도 몇 초 안에 만들 수 있다.
+
+        Args:
+            template: 서식파일 경로(.hwpx 또는 .hml)
+            context: 값 사전. DataFrame은 행마다 반복할 수 있다.
+            filename: 결과파일 경로. 생략하면 임시파일로 만들어서 연다(저장은 save_as로).
+
+        Returns:
+            성공하면 True, 실패하면 False
+
+        Examples:
+            >>> import pandas as pd
+            >>> from pyhwpx import Hwp
+            >>> hwp = Hwp()
+            >>> df = pd.read_excel("실적.xlsx")
+            >>> hwp.render_template("보고서_서식.hwpx", {"부서": "영업1팀", "실적": df})
+            True
+            >>> hwp.save_as("보고서.hwp")
+        """
+        if filename is None:
+            suffix = os.path.splitext(template)[1] or ".hwpx"
+            fd, filename = tempfile.mkstemp(prefix="pyhwpx_", suffix=suffix)
+            os.close(fd)
+        render_template(template, context, filename)
+        return self.open(os.path.abspath(filename))
+
     def open(self, filename: str, format: str = "", arg: str = "") -> bool:
         """
         문서를 연다.
@@ -8275,27 +10036,31 @@ class Hwp(ParamHelpers, RunMethods):
             성공하면 True, 실패하면 False
         """
         if filename and filename.startswith("http"):
-            try:
-                # url 문자열 중 hwp 파일명이 포함되어 있는지 체크해서 해당 파일명을 사용.
-                hwp_name = [
-                    parse.unquote_plus(i)
-                    for i in re.split("[/?=&]", filename)
-                    if ".hwp" in i
-                ][0]
-            except IndexError as e:
-                # url 문자열 안에 hwp 파일명이 포함되어 있지 않은 경우에는 임시파일명 지정(temp.hwp)
-                hwp_name = "temp.hwp"
-            request.urlretrieve(filename, os.path.join(os.getcwd(), hwp_name))
-            filename = os.path.join(os.getcwd(), hwp_name)
+            # 다운로드 캐시(ETag/Last-Modified 확인)에서 가져온 파일의 사본을 이 인스턴스의 임시폴더 안에 호출마다 따로 만든다.
+            # 파일명은 url에 포함된 hwp 파일명(없으면 temp.hwp)
+            filename = get_download_cache().copy_to(filename, directory=self._new_download_dir())
         elif filename.lower()[1] != ":" and os.path.exists(
                 os.path.join(os.getcwd(), filename)
         ):
             filename = os.path.join(os.getcwd(), filename)
+        self.invalidate_text_snapshot()
         return self.hwp.Open(filename=filename, Format=format, arg=arg)
 
     def Open(self, filename: str, format: str = "", arg: str = "") -> bool:
         return self.open(filename, format, arg)
 
+    def _new_download_dir(self) -> str:
+        """
+        open(url)로 받은 사본을 둘 폴더를 만드는 헬퍼메서드.
+
+        인스턴스마다 임시폴더 하나를 만들고, 그 안에 호출마다 하위폴더를 만든다.
+        임시폴더는 quit할 때, 또는 인스턴스가 사라질 때(프로그램 종료 포함) 통째로 지운다.
+        """
+        if self._download_dir is None:
+            root = tempfile.mkdtemp(prefix="pyhwpx_")
+            self._download_dir = (root, weakref.finalize(self, shutil.rmtree, root, True))
+        return tempfile.mkdtemp(dir=self._download_dir[0])
+
     def point_to_hwp_unit(self, point: float) -> int:
         """
         글자에 쓰이는 포인트 단위를 HwpUnit으로 변환
@@ -8393,6 +10158,7 @@ class Hwp(ParamHelpers, RunMethods):
             >>> # zxcv 필드에 "Hello world!" 텍스트 삽입
             >>> hwp.put_field_text("zxcv", "Hello world!")
         """
+        self.invalidate_text_snapshot()
         if isinstance(field, str) and (
                 field.endswith(".xlsx") or field.endswith(".xls")
         ):
@@ -8553,6 +10319,9 @@ class Hwp(ParamHelpers, RunMethods):
         else:
             self.clear()
         self.hwp.Quit()
+        if self._download_dir is not None:  # open(url)로 받은 사본 삭제
+            self._download_dir[1]()
+            self._download_dir = None
 
     def Quit(self, save: bool = False) -> None:
         return self.quit(save)
@@ -9309,19 +11078,17 @@ class Hwp(ParamHelpers, RunMethods):
 
                 return False
 
-            def save_as_html_plus(path, visible=True):
-                pythoncom.CoInitialize()
-                hwp = Hwp(visible=visible)
+            def save_as_html_plus(path, handle):
+                hwp = handle.unmarshal()  # 새 인스턴스 대신 현재 인스턴스를 마샬링해서 사용
                 pset = hwp.HParameterSet.HFileOpenSave
                 hwp.HAction.GetDefault("FileSaveAs_S", pset.HSet)
                 pset.filename = path
                 pset.Format = "HTML+"
                 hwp.HAction.Execute("FileSaveAs_S", pset.HSet)
                 find_window_and_send_key("서식 있는 인터넷 문서 종류", VK_UP)
-                pythoncom.CoUninitialize()
                 return True
 
-            t = threading.Thread(target=save_as_html_plus, args=(path, True))
+            t = threading.Thread(target=save_as_html_plus, args=(path, self.marshal()))
             t.start()
             t.join(timeout=0)
             if split_page:
@@ -9671,6 +11438,7 @@ class Hwp(ParamHelpers, RunMethods):
         Returns:
             성공이면 1을, 실패하면 0을 반환한다.
         """
+        self.invalidate_text_snapshot()
         return self.hwp.SetTextFile(data=data, Format=format, option=option)
 
     def SetTextFile(
@@ -9681,6 +11449,33 @@ class Hwp(ParamHelpers, RunMethods):
     ) -> int:
         return self.set_text_file(data, format, option)
 
+    def insert_hml(self, doc: Union["hml.Document", str]) -> int:
+        """
+        pyhwpx.hml 빌더로 만든 문서 조각을 현재 캐럿 위치에 한 번에 삽입한다.
+
+        문단, 표, 누름틀, 그림이 아무리 많아도 SetTextFile 한 번으로 끝나므로,
+        insert_text나 create_table을 반복 호출하는 것보다 훨씬 빠르다.
+
+        Args:
+            doc: hml.Document 또는 HWPML2X 문자열
+
+        Returns:
+            성공이면 1을, 실패하면 0을 반환한다.
+
+        Examples:
+            >>> from pyhwpx import Hwp, hml
+            >>> hwp = Hwp()
+            >>> doc = hml.Document()
+            >>> for i in range(1000):
+            ...     doc.paragraph(f"{i}번째 문단", bold=i % 2 == 0)
+            >>> doc.table([["이름", "점수"], ["철수", 90], ["영희", 95]])
+            >>> hwp.insert_hml(doc)
+            1
+        """
+        if not isinstance(doc, str):
+            doc = doc.to_string()
+        return self.set_text_file(doc, "HWPML2X", "insertfile")
+
     def get_title(self) -> str:
         """
         한/글 프로그램의 타이틀을 조회한다. 내부적으로 윈도우핸들을 이용한다.
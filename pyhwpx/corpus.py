@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter, strftime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .convert import file_hash
+from . import hwp5, hwpx
+
+__all__ = ["fingerprint", "find_duplicates", "extract_document", "extract_corpus"]
+
+MERSENNE = np.uint64((1 << 61) - 1)
+CHUNK = 8192  # MinHash 계산시 한 번에 처리할 shingle 수(메모리 사용량 제한)
+
+
+def iter_files(src: Union[str, Path], patterns: Iterable[str]) -> List[Path]:
+    """
+    폴더 안(하위폴더 포함)에서 patterns에 맞는 파일 목록을 정렬해서 리턴하는 헬퍼함수.
+    """
+    src = Path(src)
+    if src.is_file():
+        return [src]
+    return sorted({p for pattern in patterns for p in src.rglob(pattern) if p.is_file()})
+
+
+def _reader(path: Union[str, Path]):
+    # .hwp(OLE 복합 파일)는 pyhwpx.hwp5, 그 외(HWPX, HWPML)는 pyhwpx.hwpx로 읽는다.
+    return hwp5 if hwp5.is_hwp5(str(path)) else hwpx
+
+
+def document_text(path: Union[str, Path]) -> str:
+    """
+    한/글 없이 문서(.hwpx, .hwp, HWPML)의 문자열(본문 문단과 표 셀)을 줄 단위로 연결해서 리턴하는 헬퍼함수.
+    """
+    return "\n".join(block.text for block in _reader(path).iter_blocks(str(path)))
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _permutations(num_perm: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+def minhash(text: str, num_perm: int = 128, shingle: int = 5, seed: int = 1) -> np.ndarray:
+    """
+    문자 shingle(길이 shingle인 부분문자열) 집합의 MinHash 서명(num_perm개의 uint64)을 리턴한다.
+
+    shingle은 crc32로 32비트 정수로 바꾼 후, 무작위 1차함수 (a*x + b) mod (2^61 - 1)를 num_perm개 적용해서
+    각각의 최솟값을 구한다. 계산은 numpy로 CHUNK개씩 나눠서 한다.
+    두 서명에서 같은 값의 비율은 두 shingle 집합의 자카드 유사도의 추정값이다.
+    """
+    a, b = _permutations(num_perm, seed)
+    signature = np.full(num_perm, MERSENNE, dtype=np.uint64)
+    if not text:
+        return signature
+    encoded = [text[i:i + shingle].encode("utf-8") for i in range(max(1, len(text) - shingle + 1))]
+    hashes = np.unique(np.fromiter((zlib.crc32(s) for s in encoded), dtype=np.uint64, count=len(encoded)))
+    for start in range(0, len(hashes), CHUNK):
+        x = hashes[start:start + CHUNK]
+        values = (np.outer(a, x) + b[:, None]) % MERSENNE  # a < 2^31, x < 2^32 이므로 overflow 없음
+        np.minimum(signature, values.min(axis=1), out=signature)
+    return signature
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """
+    단어(공백 기준) 빈도를 가중치로 한 SimHash 값을 리턴한다. 비슷한 문서일수록 해밍 거리가 작다.
+    """
+    counts: Dict[str, int] = {}
+    for token in text.split():
+        counts[token] = counts.get(token, 0) + 1
+    if not counts:
+        return 0
+    digests = b"".join(hashlib.blake2b(token.encode("utf-8"), digest_size=bits // 8).digest() for token in counts)
+    matrix = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(counts), bits)
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    score = (weights[:, None] * (matrix.astype(np.int64) * 2 - 1)).sum(axis=0)
+    return int("".join("1" if v > 0 else "0" for v in score), 2)
+
+
+def fingerprint(path: Union[str, Path], num_perm: int = 128, shingle: int = 5, seed: int = 1) -> Dict[str, Any]:
+    """
+    문서 하나의 지문(본문 해시 + MinHash + SimHash)을 계산한다. find_duplicates의 작업 단위.
+
+    Returns:
+        {"path", "size", "text_hash", "chars", "minhash", "simhash", "error", "seconds"} 사전.
+        text_hash는 공백을 정규화한 본문 문자열의 sha256이다.
+    """
+    tic = perf_counter()
+    record: Dict[str, Any] = {"path": str(path), "size": os.path.getsize(path), "error": None}
+    try:
+        text = _normalize(document_text(path))
+        record["text_hash"] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        record["chars"] = len(text)
+        record["minhash"] = minhash(text, num_perm, shingle, seed)
+        record["simhash"] = simhash(text)
+    except Exception as e:  # 손상된 파일 등은 건너뛰고 보고서에 남긴다.
+        record["error"] = repr(e)
+    record["seconds"] = round(perf_counter() - tic, 4)
+    return record
+
+
+def _fingerprint_job(args: Tuple[str, int, int, int]) -> Dict[str, Any]:
+    return fingerprint(*args)
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def find_duplicates(
+        src: Union[str, Path, Sequence[Union[str, Path]]],
+        workers: Optional[int] = None,
+        patterns: Iterable[str] = ("*.hwpx", "*.hwp"),
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle: int = 5,
+        min_chars: int = 20,
+        report: Optional[Union[str, Path]] = None,
+) -> Dict[str, Any]:
+    """
+    문서 보관함에서 중복 문서와 유사 문서(near-duplicate) 묶음을 찾는 함수. 한/글을 실행하지 않는다.
+
+    1. 파일마다(프로세스 풀에서 병렬로) 구역(hwpx는 zip 안의 구역 XML, hwp는 BodyText 스트림)만 스트리밍으로 읽어서
+       본문/표 문자열을 얻고,
+       파일 해시, 문자열 해시, MinHash 서명, SimHash 값을 계산한다.
+    2. 문자열 해시가 같은 파일은 "exact" 묶음이 된다.
+    3. 나머지는 MinHash 서명을 bands개의 띠로 나눈 LSH(Locality Sensitive Hashing) 버킷으로 후보쌍을 고르고,
+       서명으로 추정한 자카드 유사도가 threshold 이상인 쌍을 이어서 "near" 묶음을 만든다.
+
+    Args:
+        src: 폴더 경로(하위폴더 포함) 또는 파일 경로 목록
+        workers: 프로세스 수. 기본값은 CPU 코어 수
+        patterns: 대상 파일의 glob 패턴
+        threshold: 유사 문서로 볼 최소 자카드 유사도(0~1)
+        num_perm: MinHash 서명 길이
+        bands: LSH 띠 개수(num_perm의 약수). 띠가 많을수록 낮은 유사도의 후보도 찾지만 비교 횟수가 늘어난다.
+        shingle: shingle 길이(글자 수)
+        min_chars: 이보다 짧은 문서는 유사도 비교에서 제외(빈 서식 등이 모두 묶이는 것을 방지)
+        report: 묶음 보고서(JSON Lines) 경로. 묶음마다 한 줄씩 기록한다.
+
+    Returns:
+        {"files", "errors", "clusters", "duplicates", "elapsed", "files_per_sec"} 사전.
+        clusters는 {"kind": "exact"/"near", "files": [...], "similarity": 묶음을 이은 쌍의 최소 추정 유사도,
+        "simhash_distance": 최대 해밍거리} 목록
+
+    Examples:
+        >>> import pyhwpx
+        >>> result = pyhwpx.find_duplicates("./archive", workers=8, threshold=0.85, report="dupes.jsonl")
+        >>> result["duplicates"], result["files_per_sec"]
+        (1520, 410.3)
+        >>> result["clusters"][0]
+        {'kind': 'exact', 'files': ['./archive/a.hwpx', './archive/old/a(1).hwpx'], 'similarity': 1.0, 'simhash_distance': 0}
+    """
+    if num_perm % bands:
+        raise ValueError(f"bands({bands})는 num_perm({num_perm})의 약수여야 합니다.")
+    tic = perf_counter()
+    if isinstance(src, (str, Path)):
+        files = iter_files(src, patterns)
+    else:
+        files = [Path(p) for p in src]
+    jobs = [(str(path), num_perm, shingle, 1) for path in files]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, min(64, len(jobs) // (workers * 4)))
+            records = list(pool.map(_fingerprint_job, jobs, chunksize=chunksize))
+    else:
+        records = [_fingerprint_job(job) for job in jobs]
+
+    valid = [r for r in records if r["error"] is None]
+    errors = [{"path": r["path"], "error": r["error"]} for r in records if r["error"] is not None]
+    uf = _UnionFind(len(valid))
+
+    # 1) 문자열이 같은 파일
+    by_text: Dict[str, int] = {}
+    for i, r in enumerate(valid):
+        first = by_text.setdefault(r["text_hash"], i)
+        if first != i:
+            uf.union(first, i)
+
+    # 2) LSH 버킷으로 유사 후보 찾기(대표 파일만)
+    # 버킷마다 기준 파일 하나와 나머지를 한 번에(배열 연산) 비교하고, 이미 같은 묶음인 파일은 비교하지 않는다.
+    # 유사도는 묶음을 이은 쌍의 값만 남긴다(버킷 안의 모든 쌍을 비교하거나 저장하지 않음).
+    representatives = [i for i in sorted(set(by_text.values())) if valid[i]["chars"] >= min_chars]
+    rows = num_perm // bands
+    links: List[Tuple[int, float]] = []  # (묶음에 이어진 파일, 유사도)
+    if len(representatives) > 1:
+        signatures = np.stack([valid[i]["minhash"] for i in representatives])
+        for band in range(bands):
+            buckets: Dict[bytes, List[int]] = {}
+            band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            for k in range(len(representatives)):
+                buckets.setdefault(band_values[k].tobytes(), []).append(k)
+            for members in buckets.values():
+                while len(members) > 1:
+                    pivot = members[0]
+                    root = uf.find(representatives[pivot])
+                    rest = [k for k in members[1:] if uf.find(representatives[k]) != root]
+                    if not rest:
+                        break
+                    scores = np.mean(signatures[rest] == signatures[pivot], axis=1)
+                    members = []
+                    for k, score in zip(rest, scores.tolist()):
+                        if score >= threshold:
+                            uf.union(representatives[pivot], representatives[k])
+                            links.append((representatives[k], score))
+                        else:
+                            members.append(k)  # 기준 파일과는 다르지만 서로는 비슷할 수 있음
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(valid)):
+        groups.setdefault(uf.find(i), []).append(i)
+    link_scores: Dict[int, List[float]] = {}
+    for i, score in links:
+        link_scores.setdefault(uf.find(i), []).append(score)
+    clusters = []
+    for root, members in groups.items():
+        if len(members) < 2:
+            continue
+        texts = {valid[i]["text_hash"] for i in members}
+        scores = [1.0, *link_scores.get(root, [])]
+        hashes = [valid[i]["simhash"] for i in members]
+        distance = max(bin(h ^ hashes[0]).count("1") for h in hashes)
+        clusters.append({
+            "kind": "exact" if len(texts) == 1 else "near",
+            "files": [valid[i]["path"] for i in members],
+            "similarity": round(min(scores), 4),
+            "simhash_distance": distance,
+        })
+    clusters.sort(key=lambda c: (c["kind"] != "exact", -len(c["files"]), c["files"][0]))
+
+    if report:
+        with open(report, "w", encoding="utf-8") as f:
+            for cluster in clusters:
+                f.write(json.dumps(cluster, ensure_ascii=False) + "\n")
+    elapsed = perf_counter() - tic
+    return {
+        "files": len(records),
+        "errors": errors,
+        "clusters": clusters,
+        "duplicates": sum(len(c["files"]) - 1 for c in clusters),
+        "elapsed": round(elapsed, 3),
+        "files_per_sec": round(len(records) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+EXTRACT_PATTERNS = ("*.hwpx", "*.hwp")
+PARQUET_BATCH = 256  # parquet 파일에 한 번에 쓸 레코드 수
+
+
+def extract_document(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    문서 하나에서 본문 문자열, 표, 필드 값을 뽑아 사전으로 리턴한다. extract_corpus의 작업 단위(한/글 불필요).
+
+    Returns:
+        {"path", "hash", "size", "status", "seconds", "chars", "paragraphs", "text", "tables", "fields", "error"} 사전.
+
+        - status: "done", "failed"(손상된 파일 등), "unsupported"(암호가 걸린 문서, 배포용 문서)
+        - text: 본문 문단(표 셀 제외)을 줄바꿈으로 연결한 문자열
+        - tables: 표마다 2차원 리스트(병합으로 가려진 셀은 "")
+        - fields: {"name", "value"} 목록(문서 순서, 같은 이름도 모두)
+    """
+    tic = perf_counter()
+    path = str(path)
+    record: Dict[str, Any] = {
+        "path": path, "hash": None, "size": os.path.getsize(path), "status": "done", "seconds": 0.0,
+        "chars": 0, "paragraphs": 0, "text": "", "tables": [], "fields": [], "error": None,
+    }
+    try:
+        record["hash"] = file_hash(path)
+        reader = _reader(path)
+        lines: List[str] = []
+        grids: Dict[int, Dict[Tuple[int, int], str]] = {}
+        for block in reader.iter_blocks(path):
+            if block.kind == "para":
+                lines.append(block.text)
+            else:
+                grids.setdefault(block.table, {})[block.row, block.col] = block.text
+        tables = []
+        for index in sorted(grids):
+            cells = grids[index]
+            rows = max(r for r, _ in cells) + 1
+            cols = max(c for _, c in cells) + 1
+            tables.append([[cells.get((r, c), "") for c in range(cols)] for r in range(rows)])
+        record["text"] = "\n".join(lines)
+        record["chars"] = len(record["text"])
+        record["paragraphs"] = len(lines)
+        record["tables"] = tables
+        record["fields"] = [{"name": name, "value": value} for name, value in reader.iter_fields(path)]
+    except NotImplementedError as e:  # 암호가 걸린 문서, 배포용 문서
+        record.update(status="unsupported", error=str(e))
+    except Exception as e:  # 손상된 파일 등은 기록만 남기고 계속한다.
+        record.update(status="failed", error=repr(e), text="", chars=0, paragraphs=0, tables=[], fields=[])
+    record["seconds"] = round(perf_counter() - tic, 4)
+    return record
+
+
+class _JsonlSink:
+    # 레코드를 한 줄씩 바로 쓴다. 이어서 실행하면 기존 파일 뒤에 붙인다.
+    def __init__(self, path: Path):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        return True
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetSink:
+    # PARQUET_BATCH개씩 모아서 batch마다 별도의 part 파일로 쓰고 바로 닫는다.
+    # parquet 파일은 닫을 때 footer가 기록되므로, 닫힌 파일의 레코드만 manifest에 남겨야
+    # 중간에 멈춰도 "done"으로 기록된 레코드가 사라지지 않는다.
+    # 첫 파일은 out 경로, 그 다음부터(또는 이미 파일이 있으면) "이름.partN.parquet"에 쓴다.
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("parquet으로 저장하려면 pyarrow가 필요합니다. pip install pyarrow") from e
+        self.pa = pa
+        self.pq = pq
+        self.schema = pa.schema([
+            ("path", pa.string()), ("hash", pa.string()), ("size", pa.int64()), ("status", pa.string()),
+            ("seconds", pa.float64()), ("chars", pa.int64()), ("paragraphs", pa.int64()), ("text", pa.string()),
+            ("tables", pa.list_(pa.list_(pa.list_(pa.string())))),
+            ("fields", pa.list_(pa.struct([("name", pa.string()), ("value", pa.string())]))),
+            ("error", pa.string()),
+        ])
+        self.base = path
+        self.part = 0
+        self.paths: List[Path] = []
+        self.buffer: List[Dict[str, Any]] = []
+
+    def _next_path(self) -> Path:
+        path = self.base
+        while path.exists():
+            self.part += 1
+            path = self.base.with_name(f"{self.base.stem}.part{self.part}.parquet")
+        return path
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        self.buffer.append(record)
+        if len(self.buffer) < PARQUET_BATCH:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        if self.buffer:
+            path = self._next_path()
+            temp = path.with_name(path.name + ".tmp")
+            self.pq.write_table(self.pa.Table.from_pylist(self.buffer, schema=self.schema), str(temp))
+            os.replace(temp, path)  # 다 쓴 파일만 보이도록
+            self.paths.append(path)
+            self.buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+
+def extract_corpus(
+        src: Union[str, Path, Sequence[Union[str, Path]]],
+        out: Union[str, Path],
+        workers: Optional[int] = None,
+        patterns: Iterable[str] = EXTRACT_PATTERNS,
+        manifest: Optional[Union[str, Path]] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    문서 보관함의 본문, 표, 필드 값을 한 파일(JSON Lines 또는 Parquet)로 뽑아내는 함수. 한/글을 실행하지 않는다.
+
+    파일마다 프로세스 풀에서 extract_document를 실행하고, 끝나는 순서대로 out에 바로 기록하므로
+    보관함이 아무리 커도 메모리 사용량이 일정하다(Parquet은 PARQUET_BATCH개씩 모아서 part 파일 하나로 기록).
+    기록한 파일은 처리 기록(manifest)에 남기므로, 중간에 멈췄거나 파일이 추가된 경우 같은 명령을 다시 실행하면
+    경로, 크기, 수정시각이 같은 "done" 파일은 건너뛰고 나머지만 처리한다.
+    JSON Lines는 레코드마다, Parquet은 part 파일을 닫을 때마다 처리 기록을 남긴다.
+    JSON Lines는 기존 파일 뒤에 이어 쓰고, Parquet은 out 경로 다음부터 "이름.part1.parquet"처럼 새 파일을 만든다.
+    (Parquet 결과는 `pd.read_parquet(sorted(Path(".").glob("corpus*.parquet")))`처럼 모든 part 파일을 함께 읽을 것)
+    처리 후에 고친 파일은 다시 뽑으므로, 같은 path의 레코드가 여러 개면 마지막 레코드가 최신이다.
+
+    커맨드라인에서는 `python -m pyhwpx extract <폴더> --out corpus.jsonl --workers 8` 로 실행한다.
+
+    Args:
+        src: 폴더 경로(하위폴더 포함) 또는 파일 경로 목록
+        out: 출력 파일 경로. 확장자가 ".parquet"이면 Parquet(pyarrow 필요), 그 외는 JSON Lines
+        workers: 프로세스 수. 기본값은 CPU 코어 수
+        patterns: 대상 파일의 glob 패턴
+        manifest: 처리 기록(JSON Lines) 경로. 기본값은 out 경로 + ".manifest.jsonl"
+        progress: 파일 하나를 처리할 때마다 처리 기록(사전)을 인자로 호출할 함수
+        verbose: True면 파일마다 처리시간을, 아니면 100개마다 진행상황을 stderr에 출력
+
+    Returns:
+        {"files", "done", "skipped", "failed", "unsupported", "elapsed", "files_per_sec", "slowest"} 사전.
+        slowest는 가장 오래 걸린 5개 파일의 (경로, 초) 목록
+
+    Examples:
+        >>> import pyhwpx
+        >>> pyhwpx.extract_corpus("./archive", "corpus.jsonl", workers=8)
+        {'files': 12000, 'done': 11950, 'skipped': 0, 'failed': 3, 'unsupported': 47, 'elapsed': 95.2, 'files_per_sec': 126.1, 'slowest': [...]}
+        >>> import pandas as pd
+        >>> df = pd.read_json("corpus.jsonl", lines=True)
+    """
+    tic = perf_counter()
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    manifest = Path(manifest) if manifest else out.with_name(out.name + ".manifest.jsonl")
+    if isinstance(src, (str, Path)):
+        files = iter_files(src, patterns)
+    else:
+        files = [Path(p) for p in src]
+
+    finished = set()
+    if manifest.exists():  # 내용이 같은 파일이 여러 개일 수 있으므로 해시가 아닌 경로로 확인한다.
+        with open(manifest, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    r = json.loads(line)
+                except ValueError:
+                    continue
+                if r.get("status") == "done":
+                    finished.add((r["src"], r["size"], r["mtime"]))
+    jobs = []
+    skipped = 0
+    for path in files:
+        stat = path.stat()
+        if (str(path), stat.st_size, stat.st_mtime_ns) in finished:
+            skipped += 1
+        else:
+            jobs.append(str(path))
+    mtimes = {job: os.stat(job).st_mtime_ns for job in jobs}
+
+    summary = {"files": len(files), "done": 0, "skipped": skipped, "failed": 0, "unsupported": 0}
+    timings: List[Tuple[float, str]] = []
+    pending: List[Dict[str, Any]] = []  # 출력 파일에 기록을 마쳤지만 manifest에는 아직 안 남긴 레코드
+    sink = _ParquetSink(out) if out.suffix.lower() == ".parquet" else _JsonlSink(out)
+
+    def commit() -> None:
+        with open(manifest, "a", encoding="utf-8") as f:
+            for entry in pending:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        pending.clear()
+
+    def handle(record: Dict[str, Any]) -> None:
+        summary[record["status"]] += 1
+        timings.append((record["seconds"], record["path"]))
+        entry = {"hash": record["hash"] or record["path"], "src": record["path"], "size": record["size"],
+                 "mtime": mtimes[record["path"]], "status": record["status"], "duration": record["seconds"],
+                 "error": record["error"], "time": strftime("%Y-%m-%d %H:%M:%S")}
+        pending.append(entry)
+        if sink.write(record):
+            commit()
+        count = len(timings)
+        if verbose:
+            print(f"[{count}/{len(jobs)}] {record['status']} {record['seconds']:.3f}s {record['path']}", file=sys.stderr)
+        elif count % 100 == 0 or count == len(jobs):
+            rate = count / (perf_counter() - tic)
+            print(f"{count}/{len(jobs)} files, {rate:.1f} files/sec", file=sys.stderr)
+        if progress is not None:
+            progress(entry)
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        if workers > 1 and len(jobs) > 1:
+            chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+            with multiprocessing.Pool(workers) as pool:
+                for record in pool.imap_unordered(extract_document, jobs, chunksize=chunksize):
+                    handle(record)
+        else:
+            for job in jobs:
+                handle(extract_document(job))
+    finally:
+        sink.close()  # 여기서 예외가 나면 닫지 못한 레코드는 기록하지 않는다.
+        commit()
+
+    elapsed = perf_counter() - tic
+    summary["elapsed"] = round(elapsed, 3)
+    summary["files_per_sec"] = round(len(jobs) / elapsed, 1) if elapsed else 0.0
+    summary["slowest"] = [(path, seconds) for seconds, path in sorted(timings, reverse=True)[:5]]
+    return summary
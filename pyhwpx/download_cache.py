@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import sys
+import threading
+import urllib.error
+from contextlib import contextmanager
+from time import sleep, time
+from typing import Dict, Optional
+from urllib import parse, request
+
+if sys.platform == "win32":
+    import msvcrt
+
+    fcntl = None
+else:
+    import fcntl
+
+    msvcrt = None
+
+__all__ = ["DownloadCache", "get_download_cache", "set_download_cache"]
+
+
+def _default_directory() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pyhwpx", "downloads")
+
+
+def guess_filename(url: str, default: str = "temp.hwp") -> str:
+    """
+    url 문자열 중 hwp 파일명이 포함되어 있으면 해당 파일명을, 없으면 default를 리턴하는 헬퍼함수.
+    """
+    for part in re.split("[/?=&]", url):
+        part = parse.unquote_plus(part)
+        if ".hwp" in part.lower():
+            return os.path.basename(part)
+    return default
+
+
+class DownloadCache:
+    """
+    URL로 받은 파일을 저장해두는 다운로드 캐시.
+
+    파일은 내용의 sha256 해시를 이름으로 캐시 폴더에 저장되고(content-addressed),
+    URL별로 ETag/Last-Modified 값을 기록해둔다.
+    같은 URL을 다시 요청하면 조건부 요청(If-None-Match, If-Modified-Since)을 보내서
+    서버가 304(Not Modified)를 응답하면 다운로드 없이 캐시된 파일을 사용한다.
+    서버에 연결할 수 없을 때도 캐시된 파일이 있으면 그 파일을 사용한다.
+
+    다운로드는 캐시 폴더 안의 임시파일에 나눠서 기록한 후 os.replace로 한 번에 옮기므로,
+    여러 스레드/프로세스가 동시에 같은 URL을 받아도 서로 덮어쓰지 않는다.
+    URL 목록(index.json)은 잠금파일(index.lock)을 잡은 상태에서 다시 읽고 고친 후 원자적으로 교체하므로,
+    여러 프로세스가 같은 캐시 폴더를 사용해도 서로의 기록을 지우지 않는다.
+    전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제한다(LRU).
+
+    `hwp.open(url)`은 기본 캐시(get_download_cache())를 사용한다.
+
+    Args:
+        directory: 캐시 폴더. 기본값은 %LOCALAPPDATA%/pyhwpx/downloads (없으면 ~/.cache/pyhwpx/downloads)
+        max_bytes: 캐시 최대 용량(바이트). 기본값은 512MB
+        chunk_size: 다운로드시 한 번에 읽을 바이트 수
+
+    Examples:
+        >>> from pyhwpx import DownloadCache
+        >>> cache = DownloadCache("./cache", max_bytes=100 * 1024 * 1024)
+        >>> cache.fetch("https://example.com/form.hwp")
+        './cache/3f0a...c1.hwp'
+        >>> cache.fetch("https://example.com/form.hwp")  # 서버가 304를 응답하면 다시 받지 않음
+        './cache/3f0a...c1.hwp'
+    """
+
+    INDEX_NAME = "index.json"
+    LOCK_NAME = "index.lock"
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024,
+                 chunk_size: int = 1 << 16):
+        self.directory = os.path.abspath(directory or _default_directory())
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"<DownloadCache: {self.directory}, {len(self._load())} urls>"
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.directory, self.INDEX_NAME)
+
+    @contextmanager
+    def _index_lock(self):
+        """
+        index.json을 읽고 고치는 동안 다른 스레드와 프로세스를 막는 잠금.
+        """
+        with self._lock, open(os.path.join(self.directory, self.LOCK_NAME), "a+b") as f:
+            if msvcrt is not None:
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # 약 10초 기다린 후 OSError
+                        break
+                    except OSError:
+                        sleep(0.05)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if msvcrt is not None:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, index: Dict[str, dict]) -> None:
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".json.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(temp, self._index_path)
+
+    def _path(self, entry: dict) -> str:
+        return os.path.join(self.directory, entry["blob"])
+
+    def _touch(self, url: str, entry: dict) -> str:
+        with self._index_lock():
+            index = self._load()  # 잠근 후 다시 읽어서 다른 프로세스의 기록을 보존
+            entry["atime"] = time()
+            index[url] = entry
+            self._save(index)
+        return self._path(entry)
+
+    def fetch(self, url: str, timeout: Optional[float] = 30, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        url의 파일을 캐시에서 찾거나 다운로드해서, 캐시된 파일의 경로를 리턴한다.
+
+        리턴된 파일은 여러 작업이 공유하므로 직접 수정하지 말고,
+        수정할 파일이 필요하면 copy_to를 사용한다.
+
+        Args:
+            url: 파일 주소
+            timeout: 서버 응답 대기시간(초)
+            headers: 요청에 추가할 HTTP 헤더
+
+        Returns:
+            캐시된 파일의 절대경로
+
+        Raises:
+            urllib.error.URLError: 다운로드에 실패했고 캐시된 파일도 없는 경우
+        """
+        with self._lock:
+            url_lock = self._url_locks.setdefault(url, threading.Lock())
+        with url_lock:  # 같은 url을 동시에 요청하면 한 번만 받는다.
+            return self._fetch(url, timeout, headers)
+
+    def _fetch(self, url: str, timeout: Optional[float], headers: Optional[Dict[str, str]]) -> str:
+        entry = self._load().get(url)
+        if entry and not os.path.exists(self._path(entry)):
+            entry = None
+
+        req = request.Request(url, headers=dict(headers or {}))
+        if entry:
+            if entry.get("etag"):
+                req.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                req.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            response = request.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry:
+                return self._touch(url, entry)
+            raise
+        except (urllib.error.URLError, OSError):
+            if entry:  # 오프라인이면 캐시된 파일 사용
+                return self._touch(url, entry)
+            raise
+
+        with response:
+            if response.status == 304 and entry:
+                return self._touch(url, entry)
+            ext = os.path.splitext(guess_filename(url, ""))[1]
+            digest = hashlib.sha256()
+            size = 0
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in iter(lambda: response.read(self.chunk_size), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+                blob = digest.hexdigest() + ext
+                target = os.path.join(self.directory, blob)
+                if os.path.exists(target):  # 내용이 같은 파일이 이미 있음(열려 있을 수도 있으므로 교체하지 않음)
+                    os.remove(temp)
+                else:
+                    os.replace(temp, target)
+            except BaseException:
+                if os.path.exists(temp):
+                    os.remove(temp)
+                raise
+            entry = {
+                "blob": blob,
+                "size": size,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        path = self._touch(url, entry)
+        self.prune(keep=blob)
+        return path
+
+    def copy_to(self, url: str, directory: Optional[str] = None, filename: Optional[str] = None, **kwargs) -> str:
+        """
+        url의 파일을 캐시에서 가져와서(없으면 다운로드해서) 작업용 사본을 만들고 그 경로를 리턴한다.
+
+        Args:
+            url: 파일 주소
+            directory: 사본을 만들 폴더. 기본값은 호출마다 새로 만드는 임시폴더(다른 작업과 겹치지 않음).
+                이 경우 다 쓴 후에 임시폴더를 지우는 것은 호출한 쪽의 몫이다.(hwp.open(url)은 quit할 때 지움)
+            filename: 사본 파일명. 기본값은 url에 포함된 hwp 파일명(없으면 "temp.hwp")
+            **kwargs: fetch의 인자
+
+        Returns:
+            사본 파일의 절대경로
+        """
+        source = self.fetch(url, **kwargs)
+        directory = directory or tempfile.mkdtemp(prefix="pyhwpx_")
+        target = os.path.join(directory, filename or guess_filename(url))
+        shutil.copyfile(source, target)
+        return target
+
+    def prune(self, max_bytes: Optional[int] = None, keep: Optional[str] = None) -> int:
+        """
+        캐시 용량이 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 파일부터 삭제한다.
+
+        Args:
+            max_bytes: 최대 용량. 생략하면 생성자의 max_bytes를 사용한다.
+            keep: 삭제하지 않을 파일(blob) 이름
+
+        Returns:
+            삭제한 파일 수
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        with self._index_lock():
+            index = self._load()
+            blobs: Dict[str, dict] = {}
+            for url, entry in index.items():
+                info = blobs.setdefault(entry["blob"], {"size": entry["size"], "atime": 0, "urls": []})
+                info["atime"] = max(info["atime"], entry.get("atime", 0))
+                info["urls"].append(url)
+            total = sum(info["size"] for info in blobs.values())
+            for blob, info in sorted(blobs.items(), key=lambda item: item[1]["atime"]):
+                if total <= max_bytes:
+                    break
+                if blob == keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self.directory, blob))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue  # 한/글에서 열려 있는 파일 등
+                for url in info["urls"]:
+                    del index[url]
+                total -= info["size"]
+                removed += 1
+            if removed:
+                self._save(index)
+        return removed
+
+    def clear(self) -> None:
+        """
+        캐시된 파일을 모두 삭제한다.
+        """
+        self.prune(max_bytes=0)
+
+
+_default_cache: Optional[DownloadCache] = None
+
+
+def get_download_cache() -> DownloadCache:
+    """
+    hwp.open(url) 등에서 사용하는 기본 다운로드 캐시를 리턴한다(처음 호출할 때 생성).
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DownloadCache()
+    return _default_cache
+
+
+def set_download_cache(cache: DownloadCache) -> None:
+    """
+    기본 다운로드 캐시를 바꾼다(캐시 폴더나 용량을 바꾸고 싶을 때).
+
+    Examples:
+        >>> from pyhwpx import DownloadCache, set_download_cache
+        >>> set_download_cache(DownloadCache("D:/hwp_cache", max_bytes=2 * 1024 ** 3))
+    """
+    global _default_cache
+    _default_cache = cache
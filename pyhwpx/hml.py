@@ -0,0 +1,688 @@
+"""
+HWPML2X(아래아한글 XML) 문서 조각을 파이썬에서 만드는 빌더.
+
+캐럿을 움직이며 insert_text, create_table 등을 반복 실행하는 대신,
+문단, 글자모양, 표(셀 병합 포함), 누름틀, 그림, 쪽 나누기를 파이썬 객체로 구성한 후
+HWPML2X 문자열 하나로 직렬화해서 `hwp.insert_hml(doc)`
+(= `hwp.set_text_file(doc.to_string(), "HWPML2X", "insertfile")`)로 한 번에 삽입한다.
+내용이 아무리 많아도 COM 호출은 한 번이다.
+
+한/글 없이 동작하므로(표준 라이브러리만 사용) 리눅스 등에서도 문서 조각을 만들고 시험할 수 있다.
+
+Examples:
+    >>> from pyhwpx import hml
+    >>> doc = hml.Document(font="맑은 고딕", size=10)
+    >>> title = doc.char_shape(size=16, bold=True)
+    >>> doc.paragraph("월간 보고서", char_shape=title, align="center")
+    >>> p = doc.paragraph("담당자: ")
+    >>> p.field("담당자", "홍길동", direction="이름을 입력하세요")
+    >>> table = doc.table([["구분", "금액"], ["1월", "1,000"], ["2월", "2,000"]], col_widths=[40, 60])
+    >>> table.merge(0, 0, col_span=2).text = "매출"
+    >>> doc.page_break()
+    >>> doc.paragraph("다음 쪽")
+    >>> xml = doc.to_string()
+    >>> hwp.insert_hml(doc)  # 한/글이 있는 경우
+"""
+from __future__ import annotations
+
+import base64
+import os
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+__all__ = ["Document", "BaseDocument", "Paragraph", "Table", "Cell", "mm_to_hwpunit", "rgb_to_colorref"]
+
+LANGS = ("Hangul", "Latin", "Hanja", "Japanese", "Other", "Symbol", "User")
+ALIGNS = {"left": "Left", "right": "Right", "center": "Center", "justify": "Justify", "distribute": "Distribute"}
+Color = Union[Tuple[int, int, int], str, None]
+
+
+def mm_to_hwpunit(value: float) -> int:
+    """
+    밀리미터를 HwpUnit(1/7200인치)으로 바꾸는 헬퍼함수.
+    """
+    return int(round(value * 7200 / 25.4))
+
+
+def rgb_to_colorref(color: Color) -> int:
+    """
+    (r, g, b) 튜플 또는 "#RRGGBB" 문자열을 한/글 색상값(0x00BBGGRR)으로 바꾸는 헬퍼함수.
+    """
+    if color is None:
+        return 0
+    if isinstance(color, str):
+        value = color.lstrip("#")
+        color = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+    r, g, b = color
+    return int(r) | (int(g) << 8) | (int(b) << 16)
+
+
+def _bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _margin(tag: str, left: int, right: int, top: int, bottom: int) -> ET.Element:
+    return ET.Element(tag, {"Left": str(left), "Right": str(right), "Top": str(top), "Bottom": str(bottom)})
+
+
+class Paragraph:
+    """
+    문단 하나. Document.paragraph 또는 Cell.paragraph로 만든다.
+
+    run, field, picture, table 메서드로 내용을 순서대로 추가하며, run과 field는 자신을 리턴하므로 이어서 호출할 수 있다.
+    """
+
+    def __init__(self, doc: "BaseDocument", para_shape: int = 0, page_break: bool = False):
+        self.doc = doc
+        self.para_shape = para_shape
+        self.page_break = page_break
+        self.items: List[Tuple[Any, ...]] = []
+
+    def __repr__(self):
+        return f"<Paragraph: {self.text!r}>"
+
+    @property
+    def text(self) -> str:
+        """
+        문단의 문자열(누름틀의 문자열 포함)
+        """
+        return "".join(item[2] for item in self.items if item[0] in ("text", "field"))
+
+    def run(self, text: str, char_shape: Optional[int] = None, **fmt) -> "Paragraph":
+        """
+        글자모양이 같은 문자열 조각을 추가한다.
+
+        Args:
+            text: 문자열(줄바꿈 문자는 넣지 말 것. 문단을 나누려면 새 문단을 만든다.)
+            char_shape: Document.char_shape로 만든 글자모양 아이디
+            **fmt: char_shape 대신 Document.char_shape의 인자(size, bold 등)를 바로 넣어도 된다.
+        """
+        if text:
+            self.items.append(("text", self.doc._char(char_shape, fmt), str(text)))
+        return self
+
+    def field(self, name: str, text: str = "", direction: str = "", memo: str = "",
+              char_shape: Optional[int] = None, **fmt) -> "Paragraph":
+        """
+        누름틀(필드)을 추가한다. hwp.put_field_text/get_field_text로 읽고 쓸 수 있다.
+
+        Args:
+            name: 필드 이름
+            text: 필드에 들어갈 문자열
+            direction: 안내문(빈 누름틀에 보이는 문자열)
+            memo: 도움말
+        """
+        self.items.append(("field", self.doc._char(char_shape, fmt), str(text), name, direction, memo))
+        return self
+
+    def picture(self, image: Union[str, bytes], width: Optional[float] = None, height: Optional[float] = None,
+                format: Optional[str] = None) -> "Paragraph":
+        """
+        글자처럼 취급하는 그림을 추가한다. 그림 데이터는 문서에 포함(Embedding)된다.
+
+        Args:
+            image: 그림 파일 경로 또는 바이트
+            width, height: 그림 크기(mm). 생략하면 원본 크기(96dpi 기준, pillow 필요)로, 하나만 넣으면 비율을 유지한다.
+            format: 그림 형식(png, jpg, bmp, gif 등). 파일 경로인 경우 확장자로 정한다.
+        """
+        if isinstance(image, str):
+            format = format or os.path.splitext(image)[1].lstrip(".")
+            with open(image, "rb") as f:
+                data = f.read()
+        else:
+            data = bytes(image)
+        if not format:
+            raise ValueError("바이트로 그림을 넣을 때는 format을 지정해야 합니다.")
+        if width is None or height is None:
+            from io import BytesIO
+            from PIL import Image
+
+            with Image.open(BytesIO(data)) as img:
+                px_w, px_h = img.size
+                dpi = img.info.get("dpi", (96, 96))[0] or 96
+            if width is None and height is None:
+                width, height = px_w / dpi * 25.4, px_h / dpi * 25.4
+            elif width is None:
+                width = height * px_w / px_h
+            else:
+                height = width * px_h / px_w
+        bin_id = self.doc._add_bin(data, format.lower())
+        self.items.append(("picture", 0, "", bin_id, mm_to_hwpunit(width), mm_to_hwpunit(height)))
+        return self
+
+    def table(self, data: Optional[Sequence[Sequence[Any]]] = None, rows: int = 0, cols: int = 0,
+              **kwargs) -> "Table":
+        """
+        이 문단에 표를 추가하고 Table을 리턴한다. 인자는 Document.table과 같다.
+        """
+        table = Table(self.doc, data, rows, cols, **kwargs)
+        self.items.append(("table", 0, "", table))
+        return table
+
+    def to_element(self) -> ET.Element:
+        doc = self.doc
+        p = ET.Element("P", {
+            "ColumnBreak": "false", "PageBreak": _bool(self.page_break),
+            "ParaShape": str(self.para_shape), "Style": "0",
+        })
+        text_el = None
+        current = None
+        for kind, char_id, text, *rest in self.items:
+            if text_el is None or current != char_id:
+                text_el = ET.SubElement(p, "TEXT", {"CharShape": str(char_id)})
+                current = char_id
+            if kind == "text":
+                ET.SubElement(text_el, "CHAR").text = text
+            elif kind == "field":
+                name, direction, memo = rest
+                command = f"Direction:wstring:{len(direction)}:{direction} HelpState:wstring:{len(memo)}:{memo} "
+                ET.SubElement(text_el, "FIELDBEGIN", {
+                    "Command": f"Clickhere:set:{len(command)}:{command}", "Dirty": "false", "Editable": "true",
+                    "InstId": str(doc._next_inst_id()), "Name": name, "Property": "0", "Type": "Clickhere",
+                })
+                if text:
+                    ET.SubElement(text_el, "CHAR").text = text
+                ET.SubElement(text_el, "FIELDEND", {"Editable": "true", "Property": "0", "Type": "Clickhere"})
+            elif kind == "picture":
+                text_el.append(doc._picture_element(*rest))
+            elif kind == "table":
+                text_el.append(rest[0].to_element())
+        if text_el is None:
+            ET.SubElement(p, "TEXT", {"CharShape": str(doc.default_char_shape)})
+        return p
+
+
+class Cell:
+    """
+    표의 셀 하나. Table.cell 또는 Table.merge로 얻는다.
+    """
+
+    def __init__(self, table: "Table", row: int, col: int):
+        self.table = table
+        self.row = row
+        self.col = col
+        self.row_span = 1
+        self.col_span = 1
+        self.border_fill: Optional[int] = None
+        self.vert_align = "Center"
+        self.paragraphs: List[Paragraph] = []
+
+    def __repr__(self):
+        return f"<Cell: ({self.row}, {self.col}) span=({self.row_span}, {self.col_span}) {self.text!r}>"
+
+    @property
+    def text(self) -> str:
+        """
+        셀 문자열. 값을 넣으면 기존 내용을 지우고 "\\n"마다 문단을 나눠서 넣는다.(표의 글자/문단모양 사용)
+        """
+        return "\r\n".join(p.text for p in self.paragraphs)
+
+    @text.setter
+    def text(self, value: Any) -> None:
+        self.set_text(value)
+
+    def set_text(self, value: Any, char_shape: Optional[int] = None, para_shape: Optional[int] = None,
+                 align: Optional[str] = None, **fmt) -> "Cell":
+        """
+        셀 문자열을 글자/문단모양과 함께 넣는다.
+        """
+        self.paragraphs = []
+        for line in ("" if value is None else str(value)).replace("\r\n", "\n").split("\n"):
+            self.paragraph(line, char_shape=char_shape, para_shape=para_shape, align=align, **fmt)
+        return self
+
+    def paragraph(self, text: str = "", char_shape: Optional[int] = None, para_shape: Optional[int] = None,
+                  align: Optional[str] = None, **fmt) -> Paragraph:
+        """
+        셀에 문단을 추가한다.
+        """
+        table = self.table
+        doc = table.doc
+        if para_shape is None:
+            para_shape = doc.para_shape(align=align) if align else table.para_shape
+        if char_shape is None and not fmt:
+            char_shape = table.char_shape
+        p = Paragraph(doc, para_shape)
+        p.run(text, char_shape, **fmt)
+        self.paragraphs.append(p)
+        return p
+
+    def fill(self, color: Color) -> "Cell":
+        """
+        셀 배경색을 지정한다.
+        """
+        self.border_fill = self.table.doc.border_fill(border=self.table.border, fill=color)
+        return self
+
+
+class Table:
+    """
+    표. Document.table 또는 Paragraph.table로 만든다.
+
+    Args:
+        doc: Document
+        data: 셀 문자열의 2차원 리스트(생략 가능)
+        rows, cols: 행/열 개수(data가 있으면 data 크기가 기본값)
+        col_widths: 열 너비(mm) 리스트. 생략하면 표 너비(width)를 균등분할
+        width: 표 전체 너비(mm). 기본값은 A4 기본여백 기준 본문너비(150mm)에서 바깥여백을 뺀 148mm
+        row_height: 행 높이(mm). 0이면 내용에 맞춤
+        border: "solid"(실선 테두리, 기본값) 또는 "none"
+        header: 첫 행을 제목행(쪽마다 반복)으로 지정할지 여부
+        char_shape, para_shape: 셀 문자열의 기본 글자/문단모양 아이디
+        align: 셀 문단 정렬(para_shape를 생략한 경우). 기본값은 "center"
+    """
+
+    def __init__(self, doc: "BaseDocument", data: Optional[Sequence[Sequence[Any]]] = None, rows: int = 0,
+                 cols: int = 0, col_widths: Optional[Sequence[float]] = None, width: float = 148.0,
+                 row_height: float = 0, border: str = "solid", header: bool = True,
+                 char_shape: Optional[int] = None, para_shape: Optional[int] = None, align: str = "center"):
+        data = [list(row) for row in data] if data is not None else []
+        self.doc = doc
+        self.rows = rows or len(data)
+        self.cols = cols or max(map(len, data), default=0)
+        if not self.rows or not self.cols:
+            raise ValueError("표의 행과 열은 1개 이상이어야 합니다.")
+        if col_widths is None:
+            col_widths = [width / self.cols] * self.cols
+        if len(col_widths) != self.cols:
+            raise IndexError(f"열 너비의 개수({len(col_widths)})가 열 개수({self.cols})와 다릅니다.")
+        self.col_widths = [mm_to_hwpunit(w) for w in col_widths]
+        self.row_height = mm_to_hwpunit(row_height) if row_height else 282
+        self.border = border
+        self.header = header
+        self.border_fill = doc.border_fill(border=border)
+        self.char_shape = doc.default_char_shape if char_shape is None else char_shape
+        self.para_shape = para_shape if para_shape is not None else doc.para_shape(align=align)
+        self.cells: Dict[Tuple[int, int], Cell] = {}
+        self._covered: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        for r in range(self.rows):
+            for c in range(self.cols):
+                cell = Cell(self, r, c)
+                if r < len(data) and c < len(data[r]):
+                    cell.text = data[r][c]
+                self.cells[(r, c)] = cell
+
+    def __repr__(self):
+        return f"<Table: {self.rows}x{self.cols}>"
+
+    def cell(self, row: int, col: int) -> Cell:
+        """
+        (row, col) 칸의 셀을 리턴한다. 병합으로 가려진 칸이면 병합된 셀을 리턴한다.
+        """
+        return self.cells[self._covered.get((row, col), (row, col))]
+
+    def merge(self, row: int, col: int, row_span: int = 1, col_span: int = 1) -> Cell:
+        """
+        (row, col)부터 row_span행, col_span열을 하나의 셀로 병합하고 그 셀을 리턴한다.
+        가려지는 셀의 내용은 버린다.
+        (row, col)이 이미 병합된 셀이면 범위를 새로 지정한다.(예: merge(0, 0, 1, 1)은 병합 해제)
+
+        Raises:
+            ValueError: row_span/col_span이 1보다 작거나, 병합 범위가 표를 벗어나거나, 다른 병합 셀과 겹치는 경우
+        """
+        if row_span < 1 or col_span < 1:
+            raise ValueError(f"병합할 행/열 수는 1 이상이어야 합니다.(row_span={row_span}, col_span={col_span})")
+        if row < 0 or col < 0 or row + row_span > self.rows or col + col_span > self.cols:
+            raise ValueError(
+                f"병합 범위({row}, {col}, {row_span}, {col_span})가 {self.rows}행 {self.cols}열 표를 벗어납니다."
+            )
+        anchor = (row, col)
+        for r in range(row, row + row_span):
+            for c in range(col, col + col_span):
+                owner = self._covered.get((r, c))
+                other = self.cells.get((r, c)) if (r, c) != anchor else None
+                if (owner is not None and owner != anchor) or (
+                        other is not None and (other.row_span > 1 or other.col_span > 1)):
+                    raise ValueError(f"({r}, {c}) 칸은 이미 다른 셀과 병합되어 있습니다.")
+        # 기존 병합 범위를 먼저 풀어서 가려졌던 칸을 빈 셀로 되돌린다.
+        for key in [k for k, v in self._covered.items() if v == anchor]:
+            del self._covered[key]
+            self.cells[key] = Cell(self, *key)
+        cell = self.cells[anchor]
+        cell.row_span, cell.col_span = row_span, col_span
+        for r in range(row, row + row_span):
+            for c in range(col, col + col_span):
+                if (r, c) != (row, col):
+                    self.cells.pop((r, c), None)
+                    self._covered[(r, c)] = (row, col)
+        return cell
+
+    def to_element(self) -> ET.Element:
+        doc = self.doc
+        width = sum(self.col_widths)
+        height = self.row_height * self.rows
+        table = ET.Element("TABLE", {
+            "BorderFill": str(self.border_fill), "CellSpacing": "0", "ColCount": str(self.cols),
+            "PageBreak": "Cell", "RepeatHeader": _bool(self.header), "RowCount": str(self.rows),
+        })
+        shape = ET.SubElement(table, "SHAPEOBJECT", {
+            "InstId": str(doc._next_inst_id()), "Lock": "false", "NumberingType": "Table",
+            "TextFlow": "BothSides", "TextWrap": "TopAndBottom", "ZOrder": "0",
+        })
+        ET.SubElement(shape, "SIZE", {
+            "Height": str(height), "HeightRelTo": "Absolute", "Protect": "false",
+            "Width": str(width), "WidthRelTo": "Absolute",
+        })
+        ET.SubElement(shape, "POSITION", {
+            "AffectLSpacing": "false", "AllowOverlap": "false", "FlowWithText": "true",
+            "HoldAnchorAndSO": "false", "HorzAlign": "Left", "HorzOffset": "0", "HorzRelTo": "Column",
+            "TreatAsChar": "false", "VertAlign": "Top", "VertOffset": "0", "VertRelTo": "Para",
+        })
+        shape.append(_margin("OUTSIDEMARGIN", 283, 283, 283, 283))
+        table.append(_margin("INSIDEMARGIN", 510, 510, 141, 141))
+        for r in range(self.rows):
+            row_el = ET.SubElement(table, "ROW")
+            for c in range(self.cols):
+                cell = self.cells.get((r, c))
+                if cell is None:
+                    continue
+                cell_el = ET.SubElement(row_el, "CELL", {
+                    "BorderFill": str(cell.border_fill or self.border_fill),
+                    "ColAddr": str(c), "ColSpan": str(cell.col_span), "Dirty": "false", "Editable": "false",
+                    "HasMargin": "false", "Header": _bool(self.header and r == 0),
+                    "Height": str(self.row_height * cell.row_span), "Protect": "false",
+                    "RowAddr": str(r), "RowSpan": str(cell.row_span),
+                    "Width": str(sum(self.col_widths[c:c + cell.col_span])),
+                })
+                cell_el.append(_margin("CELLMARGIN", 510, 510, 141, 141))
+                paralist = ET.SubElement(cell_el, "PARALIST", {
+                    "LineWrap": "Break", "LinkListID": "0", "LinkListIDNext": "0",
+                    "TextDirection": "0", "VertAlign": cell.vert_align,
+                })
+                for p in cell.paragraphs or [Paragraph(doc, self.para_shape)]:
+                    paralist.append(p.to_element())
+        return table
+
+
+class BaseDocument:
+    """
+    문단, 글자/문단모양, 테두리/배경, 표, 그림을 모으는 빌더의 공통 부분. 직렬화(to_string, save)는 하위 클래스의 몫이다.
+
+    글자모양(char_shape), 문단모양(para_shape), 테두리/배경(border_fill)은 같은 설정이면 하나만 만들어서 아이디를 재사용한다.
+    Document(HWPML2X)와 pyhwpx.hwpx.HwpxWriter(HWPX)가 이 클래스를 상속한다.
+
+    Args:
+        font: 기본 글꼴 이름(모든 언어 공통)
+        size: 기본 글자 크기(pt)
+    """
+
+    def __init__(self, font: str = "함초롬바탕", size: float = 10.0):
+        self.font = font
+        self.size = size
+        self.fonts: List[str] = []
+        self._char_shapes: Dict[tuple, int] = {}
+        self._para_shapes: Dict[tuple, int] = {}
+        self._border_fills: Dict[tuple, int] = {}
+        self._bins: List[Tuple[str, bytes]] = []
+        self._inst_id = 0
+        self.blocks: List[Paragraph] = []
+        self._page_break = False
+        self.default_char_shape = self.char_shape()
+        self.default_para_shape = self.para_shape()
+        self.border_fill()  # 1번: 테두리 없음(문단 테두리 기본값)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {len(self.blocks)} paragraphs>"
+
+    def _next_inst_id(self) -> int:
+        self._inst_id += 1
+        return self._inst_id
+
+    def _font_id(self, name: str) -> int:
+        if name not in self.fonts:
+            self.fonts.append(name)
+        return self.fonts.index(name)
+
+    def _char(self, char_shape: Optional[int], fmt: dict) -> int:
+        if fmt:
+            return self.char_shape(**fmt)
+        return self.default_char_shape if char_shape is None else char_shape
+
+    def _add_bin(self, data: bytes, format: str) -> int:
+        self._bins.append((format, data))
+        return len(self._bins)
+
+    def char_shape(self, size: Optional[float] = None, bold: bool = False, italic: bool = False,
+                   underline: bool = False, color: Color = (0, 0, 0), font: Optional[str] = None) -> int:
+        """
+        글자모양을 등록하고 아이디를 리턴한다. 같은 설정이면 같은 아이디를 리턴한다.
+
+        Args:
+            size: 글자 크기(pt). 기본값은 문서의 size
+            bold, italic, underline: 진하게, 기울임, 밑줄
+            color: 글자색((r, g, b) 또는 "#RRGGBB")
+            font: 글꼴 이름. 기본값은 문서의 font
+        """
+        key = (size or self.size, bool(bold), bool(italic), bool(underline), rgb_to_colorref(color),
+               self._font_id(font or self.font))
+        return self._char_shapes.setdefault(key, len(self._char_shapes))
+
+    def para_shape(self, align: str = "justify", line_spacing: int = 160, indent: float = 0, left: float = 0,
+                   right: float = 0, prev: float = 0, next: float = 0) -> int:
+        """
+        문단모양을 등록하고 아이디를 리턴한다. 같은 설정이면 같은 아이디를 리턴한다.
+
+        Args:
+            align: 정렬("left", "right", "center", "justify", "distribute")
+            line_spacing: 줄간격(%)
+            indent: 첫 줄 들여쓰기(pt, 음수면 내어쓰기)
+            left, right: 왼쪽/오른쪽 여백(pt)
+            prev, next: 문단 위/아래 간격(pt)
+        """
+        key = (ALIGNS[(align or "justify").lower()], int(line_spacing),
+               *(int(round(v * 200)) for v in (indent, left, right, prev, next)))
+        return self._para_shapes.setdefault(key, len(self._para_shapes))
+
+    def border_fill(self, border: str = "none", fill: Color = None) -> int:
+        """
+        테두리/배경을 등록하고 아이디(1부터)를 리턴한다.
+
+        Args:
+            border: "none" 또는 "solid"(0.12mm 실선)
+            fill: 배경색. None이면 채우지 않음
+        """
+        key = (border, None if fill is None else rgb_to_colorref(fill))
+        return self._border_fills.setdefault(key, len(self._border_fills) + 1)
+
+    def paragraph(self, text: str = "", char_shape: Optional[int] = None, para_shape: Optional[int] = None,
+                  align: Optional[str] = None, page_break: bool = False, **fmt) -> Paragraph:
+        """
+        본문에 문단을 추가하고 리턴한다.
+
+        Args:
+            text: 문단 문자열
+            char_shape: 글자모양 아이디(또는 **fmt로 char_shape의 인자를 바로 지정)
+            para_shape: 문단모양 아이디
+            align: para_shape를 생략한 경우의 정렬
+            page_break: 이 문단 앞에서 쪽을 나눌지 여부
+        """
+        if para_shape is None:
+            para_shape = self.para_shape(align=align) if align else self.default_para_shape
+        p = Paragraph(self, para_shape, page_break=page_break or self._page_break)
+        self._page_break = False
+        p.run(text, char_shape, **fmt)
+        self.blocks.append(p)
+        return p
+
+    def paragraphs(self, text: str, **kwargs) -> List[Paragraph]:
+        """
+        여러 줄 문자열을 줄마다 문단으로 추가한다. 인자는 paragraph와 같다.
+        """
+        return [self.paragraph(line, **kwargs) for line in str(text).replace("\r\n", "\n").split("\n")]
+
+    def page_break(self) -> None:
+        """
+        다음에 추가하는 문단을 새 쪽에서 시작한다.
+        """
+        self._page_break = True
+
+    def table(self, data: Optional[Sequence[Sequence[Any]]] = None, rows: int = 0, cols: int = 0,
+              **kwargs) -> Table:
+        """
+        표 하나가 들어있는 문단을 추가하고 Table을 리턴한다. 인자는 Table 클래스를 참고.
+        """
+        return self.paragraph().table(data, rows, cols, **kwargs)
+
+
+class Document(BaseDocument):
+    """
+    HWPML2X 문서 조각 빌더.
+
+    글자모양(char_shape), 문단모양(para_shape), 테두리/배경(border_fill)은 같은 설정이면 하나만 만들어서
+    아이디를 재사용하고, to_string으로 직렬화할 때 HEAD의 목록(MAPPINGTABLE)에 모두 기록한다.
+    삽입시 한/글이 문서의 기존 모양 목록과 합쳐준다.
+
+    Args:
+        font: 기본 글꼴 이름(모든 언어 공통)
+        size: 기본 글자 크기(pt)
+    """
+
+    def __repr__(self):
+        return f"<hml.Document: {len(self.blocks)} paragraphs>"
+
+    def _picture_element(self, bin_id: int, width: int, height: int) -> ET.Element:
+        pic = ET.Element("PICTURE", {"Reverse": "false"})
+        shape = ET.SubElement(pic, "SHAPEOBJECT", {
+            "InstId": str(self._next_inst_id()), "Lock": "false", "NumberingType": "Figure",
+            "TextFlow": "BothSides", "TextWrap": "TopAndBottom", "ZOrder": "0",
+        })
+        ET.SubElement(shape, "SIZE", {
+            "Height": str(height), "HeightRelTo": "Absolute", "Protect": "false",
+            "Width": str(width), "WidthRelTo": "Absolute",
+        })
+        ET.SubElement(shape, "POSITION", {
+            "AffectLSpacing": "false", "AllowOverlap": "false", "FlowWithText": "true",
+            "HoldAnchorAndSO": "false", "HorzAlign": "Left", "HorzOffset": "0", "HorzRelTo": "Para",
+            "TreatAsChar": "true", "VertAlign": "Top", "VertOffset": "0", "VertRelTo": "Para",
+        })
+        shape.append(_margin("OUTSIDEMARGIN", 0, 0, 0, 0))
+        component = ET.SubElement(pic, "SHAPECOMPONENT", {
+            "CurHeight": str(height), "CurWidth": str(width), "GroupLevel": "0", "HorzFlip": "false",
+            "InstID": str(self._next_inst_id()), "OriHeight": str(height), "OriWidth": str(width),
+            "VertFlip": "false", "XPos": "0", "YPos": "0",
+        })
+        ET.SubElement(component, "ROTATIONINFO", {"Angle": "0", "CenterX": str(width // 2), "CenterY": str(height // 2)})
+        rendering = ET.SubElement(component, "RENDERINGINFO")
+        for tag in ("TRANSMATRIX", "SCAMATRIX", "ROTATIONMATRIX"):
+            ET.SubElement(rendering, tag, {"E1": "1", "E2": "0", "E3": "0", "E4": "0", "E5": "1", "E6": "0"})
+        ET.SubElement(pic, "LINESHAPE", {"Color": "0", "Style": "None", "Width": "0"})
+        ET.SubElement(pic, "IMAGERECT", {
+            "X0": "0", "Y0": "0", "X1": str(width), "Y1": "0",
+            "X2": str(width), "Y2": str(height), "X3": "0", "Y3": str(height),
+        })
+        ET.SubElement(pic, "IMAGECLIP", {"Bottom": str(height), "Left": "0", "Right": str(width), "Top": "0"})
+        pic.append(_margin("INSIDEMARGIN", 0, 0, 0, 0))
+        ET.SubElement(pic, "IMAGE", {"Alpha": "0", "BinItem": str(bin_id), "Bright": "0", "Contrast": "0",
+                                     "Effect": "RealPic"})
+        return pic
+
+    def _head(self) -> ET.Element:
+        head = ET.Element("HEAD", {"SecCnt": "1"})
+        mapping = ET.SubElement(head, "MAPPINGTABLE")
+
+        if self._bins:
+            bins = ET.SubElement(mapping, "BINDATALIST", {"Count": str(len(self._bins))})
+            for i, (format, _) in enumerate(self._bins, 1):
+                ET.SubElement(bins, "BINITEM", {"BinData": str(i), "Format": format, "Type": "Embedding"})
+
+        faces = ET.SubElement(mapping, "FACENAMELIST")
+        for lang in LANGS:
+            face = ET.SubElement(faces, "FONTFACE", {"Count": str(len(self.fonts)), "Lang": lang})
+            for i, name in enumerate(self.fonts):
+                ET.SubElement(face, "FONT", {"Id": str(i), "Name": name, "Type": "ttf"})
+
+        fills = ET.SubElement(mapping, "BORDERFILLLIST", {"Count": str(len(self._border_fills))})
+        for (border, fill), fill_id in self._border_fills.items():
+            el = ET.SubElement(fills, "BORDERFILL", {
+                "BackSlash": "0", "BreakCellSeparateLine": "0", "CenterLine": "0", "CounterBackSlash": "0",
+                "CounterSlash": "0", "CrookedSlash": "0", "Id": str(fill_id), "Shadow": "false",
+                "Slash": "0", "ThreeD": "false",
+            })
+            line = {"Type": "Solid", "Width": "0.12mm", "Color": "0"} if border == "solid" else \
+                {"Type": "None", "Width": "0.1mm", "Color": "0"}
+            for tag in ("LEFTBORDER", "RIGHTBORDER", "TOPBORDER", "BOTTOMBORDER"):
+                ET.SubElement(el, tag, line)
+            ET.SubElement(el, "DIAGONAL", {"Type": "Solid", "Width": "0.1mm", "Color": "0"})
+            if fill is not None:
+                brush = ET.SubElement(el, "FILLBRUSH")
+                ET.SubElement(brush, "WINDOWBRUSH", {"Alpha": "0", "FaceColor": str(fill), "HatchColor": "10066329"})
+
+        chars = ET.SubElement(mapping, "CHARSHAPELIST", {"Count": str(len(self._char_shapes))})
+        for (size, bold, italic, underline, color, font_id), char_id in self._char_shapes.items():
+            el = ET.SubElement(chars, "CHARSHAPE", {
+                "BorderFillId": "0", "Height": str(int(round(size * 100))), "Id": str(char_id),
+                "ShadeColor": "4294967295", "SymMark": "0", "TextColor": str(color),
+                "UseFontSpace": "false", "UseKerning": "false",
+            })
+            ET.SubElement(el, "FONTID", {lang: str(font_id) for lang in LANGS})
+            ET.SubElement(el, "RATIO", {lang: "100" for lang in LANGS})
+            ET.SubElement(el, "CHARSPACING", {lang: "0" for lang in LANGS})
+            ET.SubElement(el, "RELSIZE", {lang: "100" for lang in LANGS})
+            ET.SubElement(el, "CHAROFFSET", {lang: "0" for lang in LANGS})
+            if italic:
+                ET.SubElement(el, "ITALIC")
+            if bold:
+                ET.SubElement(el, "BOLD")
+            if underline:
+                ET.SubElement(el, "UNDERLINE", {"Color": "0", "Shape": "Solid", "Type": "Bottom"})
+
+        tabs = ET.SubElement(mapping, "TABDEFLIST", {"Count": "1"})
+        ET.SubElement(tabs, "TABDEF", {"AutoTabLeft": "false", "AutoTabRight": "false", "Id": "0"})
+
+        paras = ET.SubElement(mapping, "PARASHAPELIST", {"Count": str(len(self._para_shapes))})
+        for (align, spacing, indent, left, right, prev, next_), para_id in self._para_shapes.items():
+            el = ET.SubElement(paras, "PARASHAPE", {
+                "Align": align, "AutoSpaceEAsianEng": "false", "AutoSpaceEAsianNum": "false",
+                "BreakLatinWord": "KeepWord", "BreakNonLatinWord": "true", "Condense": "0",
+                "FontLineHeight": "false", "HeadingType": "None", "Id": str(para_id), "KeepLines": "false",
+                "KeepWithNext": "false", "Level": "0", "LineWrap": "Break", "PageBreakBefore": "false",
+                "SnapToGrid": "true", "TabDef": "0", "VerAlign": "Baseline", "WidowOrphan": "false",
+            })
+            ET.SubElement(el, "PARAMARGIN", {
+                "Indent": str(indent), "Left": str(left), "LineSpacing": str(spacing),
+                "LineSpacingType": "Percent", "Next": str(next_), "Prev": str(prev), "Right": str(right),
+            })
+            ET.SubElement(el, "PARABORDER", {"BorderFill": "1", "Connect": "false", "IgnoreMargin": "false"})
+
+        styles = ET.SubElement(mapping, "STYLELIST", {"Count": "1"})
+        ET.SubElement(styles, "STYLE", {
+            "CharShape": str(self.default_char_shape), "EngName": "Normal", "Id": "0", "LangId": "1042",
+            "LockForm": "0", "Name": "바탕글", "NextStyle": "0", "ParaShape": str(self.default_para_shape),
+            "Type": "Para",
+        })
+        return head
+
+    def to_element(self) -> ET.Element:
+        """
+        문서를 HWPML 요소 트리로 리턴한다.
+        """
+        self._inst_id = 0
+        root = ET.Element("HWPML", {"Style": "embed", "SubVersion": "8.0.0.0", "Version": "2.8"})
+        body = ET.Element("BODY")
+        section = ET.SubElement(body, "SECTION", {"Id": "0"})
+        for p in self.blocks or [Paragraph(self, self.default_para_shape)]:
+            section.append(p.to_element())
+        root.append(self._head())  # 본문을 먼저 만들어야 글자모양 등이 모두 등록된다.
+        root.append(body)
+        if self._bins:
+            tail = ET.SubElement(root, "TAIL")
+            storage = ET.SubElement(tail, "BINDATASTORAGE")
+            for i, (_, data) in enumerate(self._bins, 1):
+                ET.SubElement(storage, "BINDATA", {
+                    "Encoding": "Base64", "Id": str(i), "Size": str(len(data)),
+                }).text = base64.b64encode(data).decode("ascii")
+        return root
+
+    def to_string(self) -> str:
+        """
+        문서를 HWPML2X 문자열로 리턴한다. hwp.set_text_file(..., "HWPML2X")에 그대로 넣을 수 있다.
+        """
+        return ET.tostring(self.to_element(), encoding="unicode")
+
+    def save(self, path: str) -> None:
+        """
+        문서를 HWPML2X 파일(.hml)로 저장한다. 한/글에서 바로 열 수 있다.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="UTF-8" standalone="no" ?>')
+            f.write(self.to_string())
@@ -0,0 +1,583 @@
+"""
+한/글 없이 HWP 5.0 바이너리(.hwp) 문서의 본문을 읽는 모듈.
+
+.hwp 파일은 OLE 복합 파일(Compound File Binary)이고, 본문은 "BodyText/Section0", "BodyText/Section1" ...
+스트림에 레코드(태그, 레벨, 크기 + 데이터)가 이어져 있는 구조다(압축 문서는 스트림 전체가 raw deflate).
+
+- HwpFile: 복합 파일의 디렉터리와 FAT만 읽어두고, 구역 스트림은 필요할 때 섹터 단위로 읽으면서 압축을 푼다.
+- iter_records: 구역 스트림의 레코드를 하나씩 내준다.
+- iter_paragraphs: 문단(HWPTAG_PARA_TEXT)의 문자열과 컨트롤 표식(표, 그림, 필드 시작/끝 등)을 하나씩 내준다.
+- iter_blocks, iter_fields, read_text: pyhwpx.hwpx의 같은 이름의 함수와 같은 결과를 .hwp 파일에서 얻는다.
+
+문서 전체를 메모리에 올리지 않으므로 리눅스 서버에서도 디스크 읽기 속도로 문자열을 뽑을 수 있다.
+배포용 문서와 암호가 걸린 문서는 본문이 암호화되어 있어 읽을 수 없다(NotImplementedError).
+"""
+from __future__ import annotations
+
+import io
+import os
+import re
+import struct
+import zlib
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .hwpx import Block
+
+__all__ = ["HwpFile", "Record", "Control", "Paragraph", "is_hwp5", "iter_records", "iter_paragraphs",
+           "iter_blocks", "iter_fields", "read_text"]
+
+Source = Union[str, bytes, os.PathLike, IO[bytes]]
+
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+HWP_SIGNATURE = b"HWP Document File"
+ENDOFCHAIN = 0xFFFFFFFE
+NOSTREAM = 0xFFFFFFFF
+
+HWPTAG_BEGIN = 0x10
+HWPTAG_PARA_HEADER = HWPTAG_BEGIN + 50
+HWPTAG_PARA_TEXT = HWPTAG_BEGIN + 51
+HWPTAG_CTRL_HEADER = HWPTAG_BEGIN + 55
+HWPTAG_LIST_HEADER = HWPTAG_BEGIN + 56
+HWPTAG_TABLE = HWPTAG_BEGIN + 61
+HWPTAG_CTRL_DATA = HWPTAG_BEGIN + 71
+
+# 문단 문자열의 제어 문자(0~31) 중 1글자(2바이트)짜리. 나머지(인라인/확장 컨트롤)는 8글자(16바이트)를 차지한다.
+CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+# 확장 컨트롤은 문단 뒤에 컨트롤 헤더 레코드가 하나씩 따라온다.
+EXTENDED_CONTROLS = {1, 2, 3, 11, 12, 14, 15, 16, 17, 18, 21, 22, 23}
+# 문자열로 바꿔 넣는 제어 문자(탭, 줄바꿈, 하이픈, 묶음 빈칸, 고정폭 빈칸)
+TEXT_CONTROLS = {9: "\t", 10: "\n", 24: "-", 30: " ", 31: " "}
+FIELD_START = 3
+FIELD_END = 4
+_CONTROL = re.compile(rb"(?=[\x00-\x1f]\x00)")
+
+
+class Record(NamedTuple):
+    """
+    구역 스트림의 레코드 하나. tag는 HWPTAG_* 값, level은 트리 깊이, data는 레코드 데이터(bytes)
+    """
+    tag: int
+    level: int
+    data: bytes
+
+
+class Control(NamedTuple):
+    """
+    문단 문자열 안의 컨트롤 표식 하나.
+
+    - pos: 문단 문자열(Paragraph.text)에서의 위치
+    - code: 제어 문자 코드(3: 필드 시작, 4: 필드 끝, 11: 표/그리기 개체, 2: 구역/단 정의, 16: 머리말/꼬리말 ...)
+    - ctrl_id: 컨트롤 ID("tbl ", "gso ", "%clk", "secd" ...). 컨트롤 헤더가 없는 인라인 컨트롤은 ""
+    - name: 필드 시작이면 필드 이름(없으면 "")
+    """
+    pos: int
+    code: int
+    ctrl_id: str = ""
+    name: str = ""
+
+
+class Paragraph(NamedTuple):
+    """
+    iter_paragraphs가 내주는 문단 하나.
+
+    - section: 구역 번호(0부터)
+    - para: 구역 안의 본문 문단 번호(표, 머리말 등의 안에 있는 문단은 그 컨트롤이 들어있는 본문 문단의 번호)
+    - text: 문자열(컨트롤 제외)
+    - controls: Control 목록
+    - level: 레코드 트리 깊이(본문 문단은 0)
+    - table, row, col: 표 셀 안의 문단이면 문서 안의 표 번호와 셀 주소(아니면 -1)
+    """
+    section: int
+    para: int
+    text: str
+    controls: List[Control]
+    level: int = 0
+    table: int = -1
+    row: int = -1
+    col: int = -1
+
+
+class _ChainStream(io.RawIOBase):
+    # 섹터 체인을 따라가며 필요한 만큼만 읽는 스트림
+    def __init__(self, f: IO[bytes], offsets: List[int], sector_size: int, size: int):
+        self.f = f
+        self.offsets = offsets
+        self.sector_size = sector_size
+        self.size = size
+        self.pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.pos >= self.size:
+            return 0
+        index, skip = divmod(self.pos, self.sector_size)
+        n = min(len(buffer), self.sector_size - skip, self.size - self.pos)
+        self.f.seek(self.offsets[index] + skip)
+        data = self.f.read(n)
+        buffer[:len(data)] = data
+        self.pos += len(data)
+        return len(data)
+
+
+class _InflateStream(io.RawIOBase):
+    # raw deflate(wbits=-15) 스트림을 조금씩 풀어주는 스트림
+    def __init__(self, raw: IO[bytes], chunk_size: int = 1 << 16):
+        self.raw = raw
+        self.chunk_size = chunk_size
+        self.inflater = zlib.decompressobj(-15)
+        self.pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.pending:
+            if self.inflater.eof:
+                return 0
+            chunk = self.inflater.unconsumed_tail or self.raw.read(self.chunk_size)
+            if not chunk:
+                self.pending = self.inflater.flush()
+                if not self.pending:
+                    return 0
+                break
+            self.pending = self.inflater.decompress(chunk, self.chunk_size * 4)
+        n = min(len(buffer), len(self.pending))
+        buffer[:n] = self.pending[:n]
+        self.pending = self.pending[n:]
+        return n
+
+
+class HwpFile:
+    """
+    HWP 5.0 문서(OLE 복합 파일)를 여는 클래스. 디렉터리와 FAT만 읽고, 스트림은 open_stream으로 필요할 때 읽는다.
+
+    Args:
+        source: 파일 경로, 파일 내용(bytes) 또는 seek 가능한 바이너리 파일객체
+
+    Attributes:
+        version: 문서 버전 문자열(예: "5.1.0.1")
+        compressed: 본문 압축 여부
+        encrypted: 암호 설정 여부
+        distributed: 배포용 문서 여부
+        sections: 구역 수
+
+    Examples:
+        >>> from pyhwpx.hwp5 import HwpFile, iter_records
+        >>> with HwpFile("report.hwp") as doc:
+        ...     print(doc.version, doc.sections, doc.streams()[:3])
+        ...     for record in iter_records(doc.open_section(0)):
+        ...         ...
+        5.1.0.1 1 ['BinData/BIN0001.png', 'BodyText/Section0', 'DocInfo']
+    """
+
+    def __init__(self, source: Source):
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        self._owned = isinstance(source, (str, os.PathLike))
+        self.f: IO[bytes] = open(source, "rb") if self._owned else source
+        try:
+            self._read_directory()
+            header = self.read_stream("FileHeader")
+        except Exception:
+            self.close()
+            raise
+        if not header.startswith(HWP_SIGNATURE):
+            self.close()
+            raise ValueError("HWP 5.0 문서가 아닙니다.")
+        version, flags = struct.unpack_from("<II", header, 32)
+        self.version = f"{version >> 24 & 0xFF}.{version >> 16 & 0xFF}.{version >> 8 & 0xFF}.{version & 0xFF}"
+        self.compressed = bool(flags & 1)
+        self.encrypted = bool(flags & 2)
+        self.distributed = bool(flags & 4)
+        self.sections = sum(1 for name in self._entries if re.fullmatch(r"BodyText/Section\d+", name))
+
+    def __repr__(self):
+        return f"<HwpFile {self.version}: {self.sections} sections>"
+
+    def __enter__(self) -> "HwpFile":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owned and not self.f.closed:
+            self.f.close()
+
+    def _read_directory(self) -> None:
+        f = self.f
+        f.seek(0)
+        header = f.read(512)
+        if header[:8] != OLE_SIGNATURE:
+            raise ValueError("OLE 복합 파일이 아닙니다.")
+        self._sector_size = 1 << struct.unpack_from("<H", header, 0x1E)[0]
+        self._mini_size = 1 << struct.unpack_from("<H", header, 0x20)[0]
+        (fat_count, dir_start, _, self._cutoff, minifat_start, _, difat_start, difat_count
+         ) = struct.unpack_from("<8I", header, 0x2C)
+        difat = [s for s in struct.unpack_from("<109I", header, 0x4C) if s < ENDOFCHAIN]
+        per_sector = self._sector_size // 4
+        sector = difat_start
+        for _ in range(difat_count):
+            if sector >= ENDOFCHAIN:
+                break
+            entries = struct.unpack(f"<{per_sector}I", self._sector(sector))
+            difat.extend(s for s in entries[:-1] if s < ENDOFCHAIN)
+            sector = entries[-1]
+        self._fat: List[int] = []
+        for s in difat[:fat_count]:
+            self._fat.extend(struct.unpack(f"<{per_sector}I", self._sector(s)))
+
+        directory = b"".join(self._sector(s) for s in self._chain(dir_start))
+        raw = []
+        for offset in range(0, len(directory) - 127, 128):
+            name_size, kind, _, left, right, child = struct.unpack_from("<HBBIII", directory, offset + 64)
+            start, size = struct.unpack_from("<IQ", directory, offset + 116)
+            name = directory[offset:offset + max(0, name_size - 2)].decode("utf-16-le", "replace")
+            raw.append((name, kind, left, right, child, start, size))
+        if not raw:
+            raise ValueError("디렉터리가 비어 있습니다.")
+        root = raw[0]
+        self._mini_offsets = [self._offset(s) for s in self._chain(root[5])]
+        self._minifat: List[int] = []
+        for s in self._chain(minifat_start):
+            self._minifat.extend(struct.unpack(f"<{per_sector}I", self._sector(s)))
+
+        self._entries: Dict[str, Tuple[int, int]] = {}  # {경로: (시작 섹터, 크기)}
+        visited = set()
+
+        def walk(index: int, prefix: str) -> None:  # 형제는 레드블랙트리(left/right), 하위 항목은 child
+            stack = [index]
+            while stack:
+                i = stack.pop()
+                if i == NOSTREAM or i >= len(raw) or i in visited:
+                    continue
+                visited.add(i)
+                name, kind, left, right, child, start, size = raw[i]
+                stack.extend((left, right))
+                if kind == 1:
+                    walk(child, prefix + name + "/")
+                elif kind == 2:
+                    self._entries[prefix + name] = (start, size if self._sector_size > 512 else size & 0xFFFFFFFF)
+
+        walk(root[4], "")
+
+    def _offset(self, sector: int) -> int:
+        return (sector + 1) * self._sector_size
+
+    def _sector(self, sector: int) -> bytes:
+        self.f.seek(self._offset(sector))
+        return self.f.read(self._sector_size)
+
+    def _chain(self, start: int, fat: Optional[List[int]] = None) -> List[int]:
+        fat = self._fat if fat is None else fat
+        chain = []
+        sector = start
+        while sector < ENDOFCHAIN and sector < len(fat) and len(chain) <= len(fat):
+            chain.append(sector)
+            sector = fat[sector]
+        return chain
+
+    def streams(self) -> List[str]:
+        """
+        복합 파일 안의 스트림 경로 목록("FileHeader", "DocInfo", "BodyText/Section0" ...)
+        """
+        return sorted(self._entries)
+
+    def open_stream(self, name: str) -> IO[bytes]:
+        """
+        스트림을 (압축을 풀지 않은 채) 읽기용 파일객체로 연다. 큰 스트림은 읽는 만큼만 디스크에서 읽는다.
+        """
+        if name not in self._entries:
+            raise KeyError(name)
+        start, size = self._entries[name]
+        if size < self._cutoff:  # 작은 스트림은 루트 항목의 미니 스트림에 64바이트 단위로 들어있다.
+            parts = []
+            for s in self._chain(start, self._minifat):
+                index, skip = divmod(s * self._mini_size, self._sector_size)
+                self.f.seek(self._mini_offsets[index] + skip)
+                parts.append(self.f.read(self._mini_size))
+            return io.BytesIO(b"".join(parts)[:size])
+        offsets = [self._offset(s) for s in self._chain(start)]
+        return io.BufferedReader(_ChainStream(self.f, offsets, self._sector_size, size), 1 << 16)
+
+    def read_stream(self, name: str, decompress: bool = False) -> bytes:
+        """
+        스트림 전체를 bytes로 리턴한다. decompress=True면 raw deflate 압축을 푼다.
+        """
+        with self.open_stream(name) as stream:
+            data = stream.read()
+        return zlib.decompress(data, -15) if decompress else data
+
+    def open_section(self, index: int) -> IO[bytes]:
+        """
+        index번째 구역의 레코드 스트림을 연다. 압축 문서는 읽는 만큼만 압축을 푼다.
+        """
+        if self.encrypted or self.distributed:
+            raise NotImplementedError("암호가 걸린 문서나 배포용 문서의 본문은 읽을 수 없습니다.")
+        stream = self.open_stream(f"BodyText/Section{index}")
+        if not self.compressed:
+            return stream
+        return io.BufferedReader(_InflateStream(stream), 1 << 16)
+
+    @property
+    def preview_text(self) -> str:
+        """
+        문서에 저장된 미리보기 문자열(PrvText, 앞부분 일부)
+        """
+        try:
+            return self.read_stream("PrvText").decode("utf-16-le", "replace").rstrip("\x00")
+        except KeyError:
+            return ""
+
+
+def is_hwp5(source: Source) -> bool:
+    """
+    source가 OLE 복합 파일(HWP 5.0 문서)인지 첫 8바이트로 확인한다. 파일객체는 읽은 후 처음 위치로 되돌린다.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return source[:8] == OLE_SIGNATURE
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read(8) == OLE_SIGNATURE
+    position = source.tell()
+    try:
+        return source.read(8) == OLE_SIGNATURE
+    finally:
+        source.seek(position)
+
+
+def iter_records(stream: IO[bytes]) -> Iterator[Record]:
+    """
+    구역(또는 DocInfo) 스트림의 레코드를 하나씩 내주는 제너레이터.
+    레코드 헤더는 32비트(태그 10비트, 레벨 10비트, 크기 12비트)이고, 크기가 0xFFF면 다음 32비트가 크기다.
+    """
+    read = stream.read
+    while True:
+        header = read(4)
+        if len(header) < 4:
+            return
+        value = int.from_bytes(header, "little")
+        size = value >> 20
+        if size == 0xFFF:
+            size = int.from_bytes(read(4), "little")
+        data = read(size)
+        if len(data) < size:
+            raise ValueError("레코드가 중간에 잘렸습니다.")
+        yield Record(value & 0x3FF, (value >> 10) & 0x3FF, data)
+
+
+def _parse_text(data: bytes) -> Tuple[str, List[Control]]:
+    # HWPTAG_PARA_TEXT(UTF-16LE)에서 제어 문자를 골라내고 문자열과 컨트롤 목록을 리턴한다.
+    parts: List[str] = []
+    controls: List[Control] = []
+    length = 0
+    pos = 0
+    for match in _CONTROL.finditer(data):
+        i = match.start()
+        if i < pos or i % 2:
+            continue
+        if i > pos:
+            chunk = data[pos:i].decode("utf-16-le", "replace")
+            parts.append(chunk)
+            length += len(chunk)
+        code = data[i]
+        pos = i + (2 if code in CHAR_CONTROLS else 16)
+        if code in TEXT_CONTROLS:
+            parts.append(TEXT_CONTROLS[code])
+            length += 1
+        elif code not in (0, 13):
+            controls.append(Control(length, code))
+    if pos < len(data):
+        parts.append(data[pos:].decode("utf-16-le", "replace"))
+    return "".join(parts), controls
+
+
+def _field_name(data: bytes) -> str:
+    # 필드의 HWPTAG_CTRL_DATA(파라미터셋: ID, 아이템 수, [아이템 ID, 종류, 값]...)에서 이름 아이템(문자열)을 읽는다.
+    try:
+        _, count = struct.unpack_from("<Hh", data, 0)
+        _, kind, size = struct.unpack_from("<IHH", data, 4)
+    except struct.error:
+        return ""
+    if count < 1 or kind != 1:  # 1: PIT_BSTR
+        return ""
+    return data[12:12 + size * 2].decode("utf-16-le", "replace")
+
+
+class _Frame:
+    # 레코드 트리를 따라가는 중인 문단(PARA_HEADER) 또는 컨트롤(CTRL_HEADER)
+    __slots__ = ("level", "kind", "text", "controls", "pending", "cell", "table", "ctrl_id", "body_table",
+                 "cell_texts", "control_index")
+
+    def __init__(self, level: int, kind: str):
+        self.level = level
+        self.kind = kind
+        self.text = ""
+        self.controls: List[Control] = []
+        self.pending: List[int] = []  # 컨트롤 헤더를 기다리는 확장 컨트롤의 위치(controls의 인덱스)
+        self.cell: Optional[Tuple[int, int]] = None  # 표 컨트롤: 지금 읽고 있는 셀 주소(캡션이면 None)
+        self.table = -1
+        self.ctrl_id = ""
+        self.body_table = False  # 표 컨트롤: HWPTAG_TABLE을 지났는지(그 전의 리스트 헤더는 캡션)
+        self.cell_texts: List[str] = []
+        self.control_index = -1  # 컨트롤: 문단의 controls에서의 인덱스
+
+
+def _walk(doc: HwpFile) -> Iterator[Tuple[str, Any]]:
+    # 구역 스트림을 한 번 읽으면서 ("para", Paragraph)와 ("cell", Block) 이벤트를 내준다.
+    # 안쪽(표 셀) 문단은 바깥 문단보다, 셀은 그 표가 들어있는 문단보다 먼저 나온다(pyhwpx.hwpx.iter_blocks와 같은 순서).
+    table_index = -1
+    for section in range(doc.sections):
+        stack: List[_Frame] = []
+        body = -1
+        events: List[Tuple[str, Any]] = []
+
+        def close_cell(ctrl: _Frame) -> None:
+            if ctrl.cell is not None:
+                events.append(("cell", Block("cell", section, body, "\n".join(ctrl.cell_texts),
+                                             ctrl.table, ctrl.cell[0], ctrl.cell[1])))
+            ctrl.cell = None
+            ctrl.cell_texts = []
+
+        def pop(level: int) -> None:
+            while stack and stack[-1].level >= level:
+                frame = stack.pop()
+                parent = stack[-1] if stack else None
+                if frame.kind == "para":
+                    in_cell = parent is not None and parent.ctrl_id == "tbl " and parent.cell is not None
+                    row, col = parent.cell if in_cell else (-1, -1)
+                    events.append(("para", Paragraph(section, body, frame.text, frame.controls, frame.level,
+                                                     parent.table if in_cell else -1, row, col)))
+                    if in_cell:
+                        parent.cell_texts.append(frame.text)
+                elif frame.ctrl_id == "tbl ":
+                    close_cell(frame)
+
+        with doc.open_section(section) as stream:
+            for tag, level, data in iter_records(stream):
+                if tag == HWPTAG_PARA_HEADER:
+                    pop(level)
+                    if level == 0:
+                        body += 1
+                    stack.append(_Frame(level, "para"))
+                elif tag == HWPTAG_PARA_TEXT:
+                    pop(level)
+                    if stack and stack[-1].kind == "para":
+                        para = stack[-1]
+                        para.text, para.controls = _parse_text(data)
+                        para.pending = [i for i, c in enumerate(para.controls) if c.code in EXTENDED_CONTROLS]
+                        para.pending.reverse()
+                elif tag == HWPTAG_CTRL_HEADER:
+                    pop(level)
+                    ctrl = _Frame(level, "ctrl")
+                    ctrl.ctrl_id = data[:4][::-1].decode("latin-1")
+                    if ctrl.ctrl_id == "tbl ":
+                        table_index += 1
+                        ctrl.table = table_index
+                    if stack and stack[-1].kind == "para" and stack[-1].pending:
+                        para = stack[-1]
+                        ctrl.control_index = para.pending.pop()
+                        para.controls[ctrl.control_index] = para.controls[ctrl.control_index]._replace(
+                            ctrl_id=ctrl.ctrl_id)
+                    stack.append(ctrl)
+                elif tag == HWPTAG_LIST_HEADER:
+                    pop(level)
+                    if stack and stack[-1].ctrl_id == "tbl ":
+                        ctrl = stack[-1]
+                        close_cell(ctrl)
+                        if ctrl.body_table and len(data) >= 12:
+                            col, row = struct.unpack_from("<HH", data, 8)
+                            ctrl.cell = (row, col)
+                elif tag == HWPTAG_TABLE:
+                    pop(level)
+                    if stack and stack[-1].ctrl_id == "tbl ":
+                        stack[-1].body_table = True
+                elif tag == HWPTAG_CTRL_DATA:
+                    pop(level)
+                    if stack and stack[-1].ctrl_id.startswith("%") and stack[-1].control_index >= 0:
+                        ctrl = stack[-1]
+                        para = stack[-2]
+                        para.controls[ctrl.control_index] = para.controls[ctrl.control_index]._replace(
+                            name=_field_name(data))
+                else:
+                    pop(level)  # 레코드는 전위 순회 순서이므로, 레벨 level 이상의 열린 문단/컨트롤은 끝난 것이다.
+                if events:
+                    yield from events
+                    events.clear()
+            pop(0)
+            yield from events
+
+
+def _open(source: Union[Source, HwpFile]) -> Tuple[HwpFile, bool]:
+    if isinstance(source, HwpFile):
+        return source, False
+    return HwpFile(source), True
+
+
+def iter_paragraphs(source: Union[Source, HwpFile]) -> Iterator[Paragraph]:
+    """
+    HWP 5.0 문서의 모든 문단(본문, 표 셀, 머리말/꼬리말, 각주, 글상자 등)을 하나씩 내주는 제너레이터(한/글 불필요).
+
+    구역 스트림을 읽는 만큼만 압축을 풀고 HWPTAG_PARA_TEXT 레코드를 문자열과 컨트롤 표식으로 나눈다.
+    문단은 그 안의 컨트롤(표 등)의 문단이 모두 나온 후에 나온다.
+
+    Args:
+        source: 파일 경로, 파일 내용(bytes), 바이너리 파일객체 또는 HwpFile
+
+    Examples:
+        >>> from pyhwpx.hwp5 import iter_paragraphs
+        >>> for p in iter_paragraphs("report.hwp"):
+        ...     if p.level == 0:
+        ...         print(p.para, p.text, [c.ctrl_id for c in p.controls])
+        0 월간 보고서 ['secd', 'cold']
+        1  ['tbl ']
+    """
+    doc, owned = _open(source)
+    try:
+        for kind, item in _walk(doc):
+            if kind == "para":
+                yield item
+    finally:
+        if owned:
+            doc.close()
+
+
+def iter_blocks(source: Union[Source, HwpFile], tables: bool = True) -> Iterator[Block]:
+    """
+    HWP 5.0 문서의 본문 문단과 표 셀을 pyhwpx.hwpx.iter_blocks와 같은 형식(Block)으로 하나씩 내주는 제너레이터.
+    """
+    doc, owned = _open(source)
+    try:
+        for kind, item in _walk(doc):
+            if kind == "cell":
+                if tables:
+                    yield item
+            elif item.level == 0:
+                yield Block("para", item.section, item.para, item.text)
+    finally:
+        if owned:
+            doc.close()
+
+
+def iter_fields(source: Union[Source, HwpFile]) -> Iterator[Tuple[str, str]]:
+    """
+    HWP 5.0 문서의 필드(누름틀 등)를 (필드이름, 값) 튜플로 하나씩 내주는 제너레이터.
+    값은 한 문단 안의 필드 시작과 끝 사이의 문자열이다. 셀필드(셀 이름)는 읽지 않는다.
+    """
+    for p in iter_paragraphs(source):
+        starts: List[Control] = []
+        for control in p.controls:
+            if control.code == FIELD_START:
+                starts.append(control)
+            elif control.code == FIELD_END and starts:
+                start = starts.pop()
+                yield start.name, p.text[start.pos:control.pos]
+
+
+def read_text(source: Union[Source, HwpFile], tables: bool = True) -> str:
+    """
+    HWP 5.0 문서의 문자열을 문단마다 줄을 바꿔서 리턴한다(pyhwpx.hwpx.read_text와 같은 형식).
+    """
+    return "\n".join(block.text for block in iter_blocks(source, tables=tables))
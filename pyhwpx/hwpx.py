@@ -0,0 +1,639 @@
+"""
+한/글 없이 HWPX(.hwpx) 파일을 쓰고 읽는 모듈.
+
+- HwpxWriter: pyhwpx.hml.Document와 같은 방식(문단, 글자/문단모양, 표, 그림, 누름틀, 쪽 나누기)으로 문서를 만들면서
+  구역(Contents/section*.xml)을 zip 파일에 바로바로 기록한다. 메모리에는 마지막 문단(또는 표) 하나만 남는다.
+- iter_blocks, iter_fields, read_text: HWPX(또는 HWPML) 파일의 문단, 표 셀, 필드 값을 iterparse로 하나씩 읽는다.
+
+리눅스 서버 등 한/글을 실행할 수 없는 환경에서 문서를 만들고 검증하는 용도.
+"""
+from __future__ import annotations
+
+import io
+import mimetypes
+import os
+import re
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from . import hml
+
+__all__ = ["HwpxWriter", "Block", "iter_blocks", "iter_fields", "read_text"]
+
+NAMESPACES = {
+    "ha": "http://www.hancom.co.kr/hwpml/2011/app",
+    "hp": "http://www.hancom.co.kr/hwpml/2011/paragraph",
+    "hp10": "http://www.hancom.co.kr/hwpml/2016/paragraph",
+    "hs": "http://www.hancom.co.kr/hwpml/2011/section",
+    "hc": "http://www.hancom.co.kr/hwpml/2011/core",
+    "hh": "http://www.hancom.co.kr/hwpml/2011/head",
+    "hhs": "http://www.hancom.co.kr/hwpml/2011/history",
+    "hm": "http://www.hancom.co.kr/hwpml/2011/master-page",
+    "hpf": "http://www.hancom.co.kr/schema/2011/hpf",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "opf": "http://www.idpf.org/2007/opf/",
+}
+XMLNS = " ".join(f'xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items())
+DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+LANGS = ("hangul", "latin", "hanja", "japanese", "other", "symbol", "user")
+
+Source = Union[str, bytes, os.PathLike, IO[bytes]]
+
+
+def _color(colorref: Optional[int]) -> str:
+    # 0x00BBGGRR -> "#RRGGBB"
+    if colorref is None:
+        return "none"
+    return f"#{colorref & 0xFF:02X}{(colorref >> 8) & 0xFF:02X}{(colorref >> 16) & 0xFF:02X}"
+
+
+def _el(tag: str, parent: Optional[ET.Element] = None, **attrib: Any) -> ET.Element:
+    attrib = {key.rstrip("_"): str(value) for key, value in attrib.items()}
+    if parent is None:
+        return ET.Element(tag, attrib)
+    return ET.SubElement(parent, tag, attrib)
+
+
+def _size(parent: ET.Element, width: int, height: int, treat_as_char: bool, horz_rel_to: str) -> None:
+    _el("hp:sz", parent, width=width, widthRelTo="ABSOLUTE", height=height, heightRelTo="ABSOLUTE", protect=0)
+    _el("hp:pos", parent, treatAsChar=int(treat_as_char), affectLSpacing=0, flowWithText=1, allowOverlap=0,
+        holdAnchorAndSO=0, vertRelTo="PARA", horzRelTo=horz_rel_to, vertAlign="TOP", horzAlign="LEFT",
+        vertOffset=0, horzOffset=0)
+
+
+def _margin(tag: str, parent: ET.Element, left: int, right: int, top: int, bottom: int) -> None:
+    _el(tag, parent, left=left, right=right, top=top, bottom=bottom)
+
+
+class HwpxWriter(hml.BaseDocument):
+    """
+    한/글 없이 HWPX 파일을 만드는 기록기.
+
+    사용법은 pyhwpx.hml.Document와 같다(paragraph, run, field, picture, table, page_break, char_shape 등).
+    다만 문단(또는 표)을 새로 추가하면 그 전까지의 문단은 곧바로 zip 파일의 구역 XML에 기록되므로,
+    아주 큰 문서도 메모리 사용량이 일정하다. 따라서 이미 지나간 문단은 고칠 수 없다.
+    그림은 임시폴더에 모아두었다가 close할 때 binData에 기록한다.
+    header.xml(글꼴, 글자/문단모양, 테두리/배경 목록)과 content.hpf도 close할 때 기록한다.
+    hml.Document와 달리 HWPML2X 문자열(to_string)로 바꿀 수 없으므로 hwp.insert_hml에는 넣을 수 없다.
+    with 블록 안에서 예외가 발생하면 파일을 완성하지 않고 지운다(파일객체인 경우에는 닫기만 한다).
+
+    Args:
+        path: 저장할 파일 경로(.hwpx) 또는 바이너리 파일객체
+        font: 기본 글꼴 이름
+        size: 기본 글자 크기(pt)
+        paper: 용지 크기(가로, 세로 mm). 기본값은 A4
+        landscape: 가로방향 여부
+        margins: 용지 여백(왼쪽, 오른쪽, 위쪽, 아래쪽, 머리말, 꼬리말 mm). 기본값은 한/글 기본값
+
+    Examples:
+        >>> from pyhwpx.hwpx import HwpxWriter, read_text
+        >>> with HwpxWriter("report.hwpx", font="맑은 고딕") as doc:
+        ...     doc.paragraph("월간 보고서", size=16, bold=True, align="center")
+        ...     for i in range(100000):
+        ...         doc.paragraph(f"{i}번째 문단")
+        ...     doc.table([["구분", "금액"], ["1월", "1,000"]], col_widths=[40, 60])
+        ...     doc.paragraph("그림: ").picture("chart.png", width=80)
+        >>> read_text("report.hwpx")[:6]
+        '월간 보고서'
+    """
+
+    def __init__(self, path: Union[str, os.PathLike, IO[bytes]], font: str = "함초롬바탕", size: float = 10.0,
+                 paper: Tuple[float, float] = (210, 297), landscape: bool = False,
+                 margins: Tuple[float, float, float, float, float, float] = (30, 30, 20, 15, 15, 15)):
+        self.path = path
+        self.paper = paper
+        self.landscape = landscape
+        self.margins = margins
+        self._bin_dir = tempfile.mkdtemp(prefix="pyhwpx_bin_")
+        self._sections = 0
+        self._stream: Optional[IO[bytes]] = None
+        self._first = True
+        self._chunk = ET.Element("chunk")
+        self.chunk_size = 256
+        self.paragraph_count = 0
+        super().__init__(font, size)
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr(zipfile.ZipInfo("mimetype"), "application/hwp+zip", compress_type=zipfile.ZIP_STORED)
+        self._zip.writestr("version.xml", DECLARATION + (
+            '<hv:HCFVersion xmlns:hv="http://www.hancom.co.kr/hwpml/2011/version" tagetApplication="WORDPROCESSOR" '
+            'major="5" minor="1" micro="0" buildNumber="1" os="1" xmlVersion="1.4" application="Hancom Office Hangul" '
+            'appVersion="12, 0, 0, 0"/>'
+        ))
+        self.new_section()
+
+    def __repr__(self):
+        return f"<HwpxWriter: {self.path}, sections={self._sections}, paragraphs={self.paragraph_count}>"
+
+    def __enter__(self) -> "HwpxWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _add_bin(self, data: bytes, format: str) -> int:
+        bin_id = len(self._bins) + 1
+        path = os.path.join(self._bin_dir, f"image{bin_id}.{format}")
+        with open(path, "wb") as f:
+            f.write(data)
+        self._bins.append((format, path))
+        return bin_id
+
+    def paragraph(self, *args, **kwargs) -> hml.Paragraph:
+        self._write_blocks()
+        return super().paragraph(*args, **kwargs)
+
+    paragraph.__doc__ = hml.BaseDocument.paragraph.__doc__
+
+    def new_section(self) -> None:
+        """
+        지금까지의 내용을 기록하고 새 구역(Contents/sectionN.xml)을 시작한다.
+        """
+        self._write_blocks(flush=True)
+        if self._stream is not None:
+            self._stream.write(b"</hs:sec>")
+            self._stream.close()
+        self._stream = self._zip.open(f"Contents/section{self._sections}.xml", "w")
+        self._stream.write(f"{DECLARATION}<hs:sec {XMLNS}>".encode("utf-8"))
+        self._sections += 1
+        self._first = True
+
+    def _write_blocks(self, flush: bool = False) -> None:
+        # 지나간 문단을 XML 요소로 바꾸고, chunk_size개씩 모아서 구역에 기록한다.
+        # (ET.tostring은 호출마다 비용이 커서 문단 하나씩 기록하면 느리다.)
+        if self._stream is None:
+            return
+        for p in self.blocks:
+            self._chunk.append(self._paragraph(p))
+            self.paragraph_count += 1
+        self.blocks.clear()
+        if len(self._chunk) >= self.chunk_size or (flush and len(self._chunk)):
+            xml = ET.tostring(self._chunk, encoding="utf-8", xml_declaration=False)
+            self._stream.write(xml[len(b"<chunk>"):-len(b"</chunk>")])
+            self._chunk = ET.Element("chunk")
+
+    def close(self) -> None:
+        """
+        남은 문단과 그림, header.xml, content.hpf 등을 기록하고 파일을 닫는다.
+        """
+        if self._zip is None:
+            return
+        try:
+            if self._first and not self.blocks:  # 빈 구역에도 구역 정의가 들어갈 문단 하나는 있어야 한다.
+                super().paragraph()
+            self._write_blocks(flush=True)
+            self._stream.write(b"</hs:sec>")
+            self._stream.close()
+            self._stream = None
+            for i, (format, path) in enumerate(self._bins, 1):
+                self._zip.write(path, f"BinData/image{i}.{format}")
+            self._zip.writestr("Contents/header.xml", DECLARATION + ET.tostring(self._header(), encoding="unicode"))
+            self._zip.writestr("Contents/content.hpf", self._content_hpf())
+            self._zip.writestr("META-INF/container.xml", DECLARATION + (
+                '<ocf:container xmlns:ocf="urn:oasis:names:tc:opendocument:xmlns:container" '
+                'xmlns:hpf="http://www.hancom.co.kr/schema/2011/hpf"><ocf:rootfiles>'
+                '<ocf:rootfile full-path="Contents/content.hpf" media-type="application/hwpml-package+xml"/>'
+                "</ocf:rootfiles></ocf:container>"
+            ))
+            self._zip.writestr("META-INF/manifest.xml", DECLARATION + (
+                '<odf:manifest xmlns:odf="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"/>'
+            ))
+        finally:
+            self._zip.close()
+            self._zip = None
+            shutil.rmtree(self._bin_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        """
+        기록을 중단하고 만들던 파일을 지운다(경로로 연 경우). 중간까지 기록된 불완전한 hwpx 파일이 남지 않는다.
+        """
+        if self._zip is None:
+            return
+        try:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+            self._zip.close()
+        finally:
+            self._zip = None
+            shutil.rmtree(self._bin_dir, ignore_errors=True)
+            if isinstance(self.path, (str, os.PathLike)) and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _content_hpf(self) -> str:
+        items = ['<opf:item id="header" href="Contents/header.xml" media-type="application/xml"/>']
+        spine = ['<opf:itemref idref="header" linear="yes"/>']
+        for i in range(self._sections):
+            items.append(f'<opf:item id="section{i}" href="Contents/section{i}.xml" media-type="application/xml"/>')
+            spine.append(f'<opf:itemref idref="section{i}" linear="yes"/>')
+        for i, (format, _) in enumerate(self._bins, 1):
+            media_type = mimetypes.guess_type(f"a.{format}")[0] or f"image/{format}"
+            items.append(f'<opf:item id="image{i}" href="BinData/image{i}.{format}" media-type="{media_type}" '
+                         f'isEmbeded="1"/>')
+        return (f'{DECLARATION}<opf:package {XMLNS} version="" unique-identifier="" id="">'
+                f"<opf:metadata><opf:title/><opf:language>ko</opf:language></opf:metadata>"
+                f"<opf:manifest>{''.join(items)}</opf:manifest><opf:spine>{''.join(spine)}</opf:spine></opf:package>")
+
+    def _sec_pr(self, parent: ET.Element) -> None:
+        # 구역의 첫 문단에 들어가는 구역 정의(용지, 여백)와 단 정의
+        run = _el("hp:run", parent, charPrIDRef=self.default_char_shape)
+        sec = _el("hp:secPr", run, id="", textDirection="HORIZONTAL", spaceColumns=1134, tabStop=8000,
+                  tabStopVal=4000, tabStopUnit="HWPUNIT", outlineShapeIDRef=0, memoShapeIDRef=0,
+                  textVerticalWidthHead=0, masterPageCnt=0)
+        _el("hp:grid", sec, lineGrid=0, charGrid=0, wonggojiFormat=0)
+        _el("hp:startNum", sec, pageStartsOn="BOTH", page=0, pic=0, tbl=0, equation=0)
+        _el("hp:visibility", sec, hideFirstHeader=0, hideFirstFooter=0, hideFirstMasterPage=0, border="SHOW_ALL",
+            fill="SHOW_ALL", hideFirstPageNum=0, hideFirstEmptyLine=0, showLineNumber=0)
+        _el("hp:lineNumberShape", sec, restartType=0, countBy=0, distance=0, startNumber=0)
+        width, height = (hml.mm_to_hwpunit(v) for v in self.paper)
+        page = _el("hp:pagePr", sec, landscape="NARROWLY" if self.landscape else "WIDELY",
+                   width=width, height=height, gutterType="LEFT_ONLY")
+        left, right, top, bottom, header, footer = (hml.mm_to_hwpunit(v) for v in self.margins)
+        _el("hp:margin", page, header=header, footer=footer, gutter=0, left=left, right=right, top=top,
+            bottom=bottom)
+        for tag, place in (("hp:footNotePr", "EACH_COLUMN"), ("hp:endNotePr", "END_OF_DOCUMENT")):
+            note = _el(tag, sec)
+            _el("hp:autoNumFormat", note, type="DIGIT", userChar="", prefixChar="", suffixChar=")", supscript=0)
+            _el("hp:noteLine", note, length=-1, type="SOLID", width="0.12 mm", color="#000000")
+            _el("hp:noteSpacing", note, betweenNotes=283, belowLine=567, aboveLine=850)
+            _el("hp:numbering", note, type="CONTINUOUS", newNum=1)
+            _el("hp:placement", note, place=place, beneathText=0)
+        for kind in ("BOTH", "EVEN", "ODD"):
+            fill = _el("hp:pageBorderFill", sec, type=kind, borderFillIDRef=1, textBorder="PAPER", headerInside=0,
+                       footerInside=0, fillArea="PAPER")
+            _margin("hp:offset", fill, 1417, 1417, 1417, 1417)
+        ctrl = _el("hp:ctrl", run)
+        _el("hp:colPr", ctrl, id="", type="NEWSPAPER", layout="LEFT", colCount=1, sameSz=1, sameGap=0)
+
+    def _paragraph(self, p: hml.Paragraph) -> ET.Element:
+        el = _el("hp:p", id=0, paraPrIDRef=p.para_shape, styleIDRef=0, pageBreak=int(p.page_break),
+                 columnBreak=0, merged=0)
+        if self._first:
+            self._sec_pr(el)
+            self._first = False
+        run = None
+        current = None
+        for kind, char_id, text, *rest in p.items:
+            if run is None or current != char_id:
+                run = _el("hp:run", el, charPrIDRef=char_id)
+                current = char_id
+            if kind == "text":
+                _el("hp:t", run).text = text
+            elif kind == "field":
+                self._field(run, text, *rest)
+            elif kind == "picture":
+                run.append(self._picture(*rest))
+            elif kind == "table":
+                run.append(self._table(rest[0]))
+                _el("hp:t", run)
+        if run is None:
+            _el("hp:run", el, charPrIDRef=self.default_char_shape)
+        return el
+
+    def _field(self, run: ET.Element, text: str, name: str, direction: str, memo: str) -> None:
+        field_id = self._next_inst_id()
+        begin = _el("hp:fieldBegin", _el("hp:ctrl", run), id=field_id, type="CLICK_HERE", name=name, editable=1,
+                    dirty=0, zorder=-1, fieldid=field_id)
+        params = _el("hp:parameters", begin, cnt=3, name="")
+        _el("hp:integerParam", params, name="Prop").text = "9"
+        _el("hp:stringParam", params, name="Direction").text = direction
+        _el("hp:stringParam", params, name="HelpState").text = memo
+        _el("hp:t", run).text = text
+        _el("hp:fieldEnd", _el("hp:ctrl", run), beginIDRef=field_id, fieldid=field_id)
+
+    def _picture(self, bin_id: int, width: int, height: int) -> ET.Element:
+        inst_id = self._next_inst_id()
+        pic = _el("hp:pic", id=inst_id, zOrder=0, numberingType="PICTURE", textWrap="TOP_AND_BOTTOM",
+                  textFlow="BOTH_SIDES", lock=0, dropcapstyle="None", href="", groupLevel=0, instid=inst_id,
+                  reverse=0)
+        _el("hp:offset", pic, x=0, y=0)
+        _el("hp:orgSz", pic, width=width, height=height)
+        _el("hp:curSz", pic, width=width, height=height)
+        _el("hp:flip", pic, horizontal=0, vertical=0)
+        _el("hp:rotationInfo", pic, angle=0, centerX=width // 2, centerY=height // 2, rotateimage=1)
+        rendering = _el("hp:renderingInfo", pic)
+        for tag in ("hc:transMatrix", "hc:scaMatrix", "hc:rotMatrix"):
+            _el(tag, rendering, e1=1, e2=0, e3=0, e4=0, e5=1, e6=0)
+        _el("hc:img", pic, binaryItemIDRef=f"image{bin_id}", bright=0, contrast=0, effect="REAL_PIC", alpha=0)
+        rect = _el("hp:imgRect", pic)
+        for i, (x, y) in enumerate(((0, 0), (width, 0), (width, height), (0, height))):
+            _el(f"hc:pt{i}", rect, x=x, y=y)
+        _el("hp:imgClip", pic, left=0, right=width, top=0, bottom=height)
+        _margin("hp:inMargin", pic, 0, 0, 0, 0)
+        _el("hp:imgDim", pic, dimwidth=width, dimheight=height)
+        _el("hp:effects", pic)
+        _size(pic, width, height, treat_as_char=True, horz_rel_to="PARA")
+        _margin("hp:outMargin", pic, 0, 0, 0, 0)
+        return pic
+
+    def _table(self, table: hml.Table) -> ET.Element:
+        width = sum(table.col_widths)
+        tbl = _el("hp:tbl", id=self._next_inst_id(), zOrder=0, numberingType="TABLE", textWrap="TOP_AND_BOTTOM",
+                  textFlow="BOTH_SIDES", lock=0, dropcapstyle="None", pageBreak="CELL",
+                  repeatHeader=int(table.header), rowCnt=table.rows, colCnt=table.cols, cellSpacing=0,
+                  borderFillIDRef=table.border_fill, noAdjust=0)
+        _size(tbl, width, table.row_height * table.rows, treat_as_char=False, horz_rel_to="COLUMN")
+        _margin("hp:outMargin", tbl, 283, 283, 283, 283)
+        _margin("hp:inMargin", tbl, 510, 510, 141, 141)
+        for r in range(table.rows):
+            tr = _el("hp:tr", tbl)
+            for c in range(table.cols):
+                cell = table.cells.get((r, c))
+                if cell is None:
+                    continue
+                tc = _el("hp:tc", tr, name="", header=int(table.header and r == 0), hasMargin=0, protect=0,
+                         editable=0, dirty=0, borderFillIDRef=cell.border_fill or table.border_fill)
+                sub = _el("hp:subList", tc, id="", textDirection="HORIZONTAL", lineWrap="BREAK",
+                          vertAlign=cell.vert_align.upper(), linkListIDRef=0, linkListNextIDRef=0, textWidth=0,
+                          textHeight=0, hasTextRef=0, hasNumRef=0)
+                first, self._first = self._first, False
+                for p in cell.paragraphs or [hml.Paragraph(self, table.para_shape)]:
+                    sub.append(self._paragraph(p))
+                self._first = first
+                _el("hp:cellAddr", tc, colAddr=c, rowAddr=r)
+                _el("hp:cellSpan", tc, colSpan=cell.col_span, rowSpan=cell.row_span)
+                _el("hp:cellSz", tc, width=sum(table.col_widths[c:c + cell.col_span]),
+                    height=table.row_height * cell.row_span)
+                _margin("hp:cellMargin", tc, 510, 510, 141, 141)
+        return tbl
+
+    def _header(self) -> ET.Element:
+        head = _el("hh:head", version="1.4", secCnt=self._sections)
+        for prefix in ("hh", "hc", "hp"):
+            head.set(f"xmlns:{prefix}", NAMESPACES[prefix])
+        _el("hh:beginNum", head, page=1, footnote=1, endnote=1, pic=1, tbl=1, equation=1)
+        refs = _el("hh:refList", head)
+
+        faces = _el("hh:fontfaces", refs, itemCnt=len(LANGS))
+        for lang in LANGS:
+            face = _el("hh:fontface", faces, lang=lang.upper(), fontCnt=len(self.fonts))
+            for i, name in enumerate(self.fonts):
+                _el("hh:font", face, id=i, face=name, type="TTF", isEmbedded=0)
+
+        fills = _el("hh:borderFills", refs, itemCnt=len(self._border_fills))
+        for (border, fill), fill_id in self._border_fills.items():
+            el = _el("hh:borderFill", fills, id=fill_id, threeD=0, shadow=0, centerLine="NONE",
+                     breakCellSeparateLine=0)
+            _el("hh:slash", el, type="NONE", Crooked=0, isCounter=0)
+            _el("hh:backSlash", el, type="NONE", Crooked=0, isCounter=0)
+            line = {"type": "SOLID", "width": "0.12 mm"} if border == "solid" else {"type": "NONE", "width": "0.1 mm"}
+            for tag in ("hh:leftBorder", "hh:rightBorder", "hh:topBorder", "hh:bottomBorder"):
+                _el(tag, el, color="#000000", **line)
+            _el("hh:diagonal", el, type="SOLID", width="0.1 mm", color="#000000")
+            if fill is not None:
+                _el("hc:winBrush", _el("hc:fillBrush", el), faceColor=_color(fill), hatchColor="#999999", alpha=0)
+
+        chars = _el("hh:charProperties", refs, itemCnt=len(self._char_shapes))
+        for (size, bold, italic, underline, color, font_id), char_id in self._char_shapes.items():
+            el = _el("hh:charPr", chars, id=char_id, height=int(round(size * 100)), textColor=_color(color),
+                     shadeColor="none", useFontSpace=0, useKerning=0, symMark="NONE", borderFillIDRef=1)
+            for tag, value in (("hh:fontRef", font_id), ("hh:ratio", 100), ("hh:spacing", 0), ("hh:relSz", 100),
+                               ("hh:offset", 0)):
+                _el(tag, el, **{lang: value for lang in LANGS})
+            if bold:
+                _el("hh:bold", el)
+            if italic:
+                _el("hh:italic", el)
+            _el("hh:underline", el, type="BOTTOM" if underline else "NONE", shape="SOLID", color="#000000")
+            _el("hh:strikeout", el, shape="NONE", color="#000000")
+            _el("hh:outline", el, type="NONE")
+            _el("hh:shadow", el, type="NONE", color="#B2B2B2", offsetX=10, offsetY=10)
+
+        tabs = _el("hh:tabProperties", refs, itemCnt=1)
+        _el("hh:tabPr", tabs, id=0, autoTabLeft=0, autoTabRight=0)
+
+        paras = _el("hh:paraProperties", refs, itemCnt=len(self._para_shapes))
+        for (align, spacing, indent, left, right, prev, next_), para_id in self._para_shapes.items():
+            el = _el("hh:paraPr", paras, id=para_id, tabPrIDRef=0, condense=0, fontLineHeight=0, snapToGrid=1,
+                     suppressLineNumbers=0, checked=0)
+            _el("hh:align", el, horizontal=align.upper(), vertical="BASELINE")
+            _el("hh:heading", el, type="NONE", idRef=0, level=0)
+            _el("hh:breakSetting", el, breakLatinWord="KEEP_WORD", breakNonLatinWord="KEEP_WORD", widowOrphan=0,
+                keepWithNext=0, keepLines=0, pageBreakBefore=0, lineWrap="BREAK")
+            _el("hh:autoSpacing", el, eAsianEng=0, eAsianNum=0)
+            margin = _el("hh:margin", el)
+            for tag, value in (("intent", indent), ("left", left), ("right", right), ("prev", prev),
+                               ("next", next_)):
+                _el(f"hc:{tag}", margin, value=value, unit="HWPUNIT")
+            _el("hh:lineSpacing", el, type="PERCENT", value=spacing, unit="HWPUNIT")
+            _el("hh:border", el, borderFillIDRef=1, offsetLeft=0, offsetRight=0, offsetTop=0, offsetBottom=0,
+                connect=0, ignoreMargin=0)
+
+        styles = _el("hh:styles", refs, itemCnt=1)
+        _el("hh:style", styles, id=0, type="PARA", name="바탕글", engName="Normal",
+            paraPrIDRef=self.default_para_shape, charPrIDRef=self.default_char_shape, nextStyleIDRef=0,
+            langID=1042, lockForm=0)
+        _el("hh:layoutCompatibility", _el("hh:compatibleDocument", head, targetProgram="HWP201X"))
+        _el("hh:linkinfo", _el("hh:docOption", head), path="", pageInherit=0, footnoteInherit=0)
+        return head
+
+
+class Block(NamedTuple):
+    """
+    iter_blocks가 내주는 문단 또는 표 셀 하나.
+
+    - kind: "para"(본문 문단) 또는 "cell"(표 셀)
+    - section: 구역 번호(0부터)
+    - para: 구역 안의 본문 문단 번호(셀은 표가 들어있는 문단의 번호)
+    - text: 문자열(셀 안의 여러 문단은 "\\n"으로 연결)
+    - table: 문서 안의 표 번호(문단은 -1)
+    - row, col: 셀 주소(문단은 -1)
+    """
+    kind: str
+    section: int
+    para: int
+    text: str
+    table: int = -1
+    row: int = -1
+    col: int = -1
+
+
+def _local(tag: Any) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _direct_text(p: ET.Element) -> str:
+    # 문단에 바로 들어있는 문자열(표 등 하위 컨트롤 안의 문자열 제외). HWPX: p/run/t, HWPML: P/TEXT/CHAR
+    parts = []
+    for run in p:
+        if _local(run.tag) not in ("run", "TEXT"):
+            continue
+        for t in run:
+            name = _local(t.tag)
+            if name not in ("t", "CHAR"):
+                continue
+            parts.append(t.text or "")
+            for child in t:
+                child_name = _local(child.tag)
+                if child_name == "tab":
+                    parts.append("\t")
+                elif child_name == "lineBreak":
+                    parts.append("\n")
+                parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _section_sources(source: Source) -> Tuple[Optional[zipfile.ZipFile], List[Any]]:
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            is_zip = f.read(2) == b"PK"
+    else:
+        is_zip = source.read(2) == b"PK"
+        source.seek(0)
+    if not is_zip:
+        return None, [source]
+    zf = zipfile.ZipFile(source)
+    names = [name for name in zf.namelist() if re.fullmatch(r"Contents/section\d+\.xml", name)]
+    try:  # content.hpf의 spine 순서를 따른다.
+        hpf = ET.fromstring(zf.read("Contents/content.hpf"))
+        hrefs = {item.get("id"): item.get("href") for item in hpf.iter() if _local(item.tag) == "item"}
+        order = [hrefs.get(ref.get("idref")) for ref in hpf.iter() if _local(ref.tag) == "itemref"]
+        names = [name for name in order if name in names] or names
+    except (KeyError, ET.ParseError):
+        names.sort(key=lambda name: int(re.findall(r"\d+", name)[-1]))
+    return zf, names
+
+
+def iter_blocks(source: Source, tables: bool = True) -> Iterator[Block]:
+    """
+    HWPX 파일(또는 HWPML2X 파일)의 본문 문단과 표 셀을 문서 순서대로 하나씩 내주는 제너레이터.
+
+    구역 XML을 iterparse로 읽으면서 다 읽은 문단을 바로 버리므로 문서가 아무리 커도 메모리 사용량이 일정하다.
+    표 셀은 그 표가 들어있는 문단보다 먼저 나온다.
+
+    Args:
+        source: 파일 경로, 파일 내용(bytes) 또는 바이너리 파일객체
+        tables: 표 셀도 내줄지 여부
+
+    Examples:
+        >>> from pyhwpx.hwpx import iter_blocks
+        >>> for block in iter_blocks("report.hwpx"):
+        ...     print(block.kind, block.para, block.text)
+        para 0 월간 보고서
+        cell 1 구분
+        ...
+    """
+    zf, sections = _section_sources(source)
+    table_index = -1
+    try:
+        for section_index, name in enumerate(sections):
+            stream = zf.open(name) if zf is not None else name
+            try:
+                stack: List[ET.Element] = []
+                para_index = 0
+                section = section_index
+                for event, element in ET.iterparse(stream, events=("start", "end")):
+                    tag = _local(element.tag)
+                    if event == "start":
+                        if tag == "SECTION" and zf is None:
+                            section = int(element.get("Id", section_index))
+                            para_index = 0
+                        elif tag in ("tbl", "TABLE"):
+                            table_index += 1
+                            element.set("pyhwpx_index", str(table_index))
+                        stack.append(element)
+                        continue
+                    stack.pop()
+                    parent = stack[-1] if stack else None
+                    if tag in ("p", "P") and parent is not None and _local(parent.tag) in ("sec", "SECTION"):
+                        yield Block("para", section, para_index, _direct_text(element))
+                        para_index += 1
+                        parent.remove(element)
+                    elif tag in ("tc", "CELL") and tables:
+                        if tag == "tc":
+                            addr = next((c for c in element if _local(c.tag) == "cellAddr"), None)
+                            row = int(addr.get("rowAddr", 0)) if addr is not None else -1
+                            col = int(addr.get("colAddr", 0)) if addr is not None else -1
+                        else:
+                            row, col = int(element.get("RowAddr", -1)), int(element.get("ColAddr", -1))
+                        table = next((el for el in reversed(stack) if _local(el.tag) in ("tbl", "TABLE")), None)
+                        paras = [p for sub in element for p in sub if _local(p.tag) in ("p", "P")]
+                        yield Block("cell", section, para_index, "\n".join(_direct_text(p) for p in paras),
+                                    int(table.get("pyhwpx_index", -1)) if table is not None else -1, row, col)
+                    elif tag in ("HEAD", "head") and parent is not None:
+                        parent.remove(element)
+            finally:
+                if zf is not None:
+                    stream.close()
+    finally:
+        if zf is not None:
+            zf.close()
+
+
+def _paragraph_fields(p: ET.Element) -> Iterator[Tuple[str, str]]:
+    # 문단 안의 누름틀(HWPX: ctrl/fieldBegin ~ ctrl/fieldEnd, HWPML: FIELDBEGIN ~ FIELDEND)과 그 사이의 문자열
+    open_fields: List[Tuple[str, List[str]]] = []
+    for run in p:
+        if _local(run.tag) not in ("run", "TEXT"):
+            continue
+        for child in run:
+            name = _local(child.tag)
+            if name in ("t", "CHAR"):
+                for _, parts in open_fields:
+                    parts.append(child.text or "")
+                    parts.extend(grandchild.tail or "" for grandchild in child)
+                continue
+            markers = [child] + list(child) if name == "ctrl" else [child]
+            for marker in markers:
+                marker_name = _local(marker.tag)
+                if marker_name in ("fieldBegin", "FIELDBEGIN"):
+                    open_fields.append((marker.get("name") or marker.get("Name") or "", []))
+                elif marker_name in ("fieldEnd", "FIELDEND") and open_fields:
+                    field, parts = open_fields.pop()
+                    yield field, "".join(parts)
+
+
+def iter_fields(source: Source) -> Iterator[Tuple[str, str]]:
+    """
+    HWPX 파일(또는 HWPML2X 파일)의 필드를 (필드이름, 값) 튜플로 하나씩 내주는 제너레이터(한/글 불필요).
+
+    누름틀과 이름이 지정된 셀(셀필드, HWPX만)을 문서 순서대로 내준다.
+    같은 이름의 필드가 여러 개면 모두 내준다.
+
+    Examples:
+        >>> from pyhwpx.hwpx import iter_fields
+        >>> dict(iter_fields("계약서.hwpx"))
+        {'성명': '홍길동', '계약일': '2024-01-01'}
+    """
+    zf, sections = _section_sources(source)
+    try:
+        for name in sections:
+            stream = zf.open(name) if zf is not None else name
+            try:
+                stack: List[ET.Element] = []
+                for event, element in ET.iterparse(stream, events=("start", "end")):
+                    if event == "start":
+                        stack.append(element)
+                        continue
+                    stack.pop()
+                    tag = _local(element.tag)
+                    if tag in ("p", "P"):
+                        yield from _paragraph_fields(element)
+                        if stack and _local(stack[-1].tag) in ("sec", "SECTION"):
+                            stack[-1].remove(element)
+                    elif tag == "tc" and element.get("name"):
+                        paras = [p for sub in element for p in sub if _local(p.tag) == "p"]
+                        yield element.get("name"), "\n".join(_direct_text(p) for p in paras)
+                    elif tag == "HEAD" and stack:
+                        stack[-1].remove(element)
+            finally:
+                if zf is not None:
+                    stream.close()
+    finally:
+        if zf is not None:
+            zf.close()
+
+
+def read_text(source: Source, tables: bool = True) -> str:
+    """
+    HWPX(또는 HWPML2X) 파일의 문자열을 문단마다 줄을 바꿔서 리턴한다(한/글 불필요).
+    표 셀의 문자열은 tables=True일 때 표가 있는 자리에 셀마다 한 줄씩 들어간다.
+    """
+    return "\n".join(block.text for block in iter_blocks(source, tables=tables))
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+__all__ = ["HwpPool"]
+
+
+def _default_factory():
+    from .core import Hwp
+
+    return Hwp(new=True, visible=False)
+
+
+def _default_health_check(hwp) -> bool:
+    # 가장 가벼운 COM 호출 중 하나(버전 조회)
+    return bool(hwp.Version)
+
+
+def _default_close(hwp) -> None:
+    hwp.quit(save=False)
+
+
+class _Worker:
+    def __init__(self, hwp: Any):
+        self.hwp = hwp
+        self.jobs = 0
+        self.created = perf_counter()
+        self.leased_at: Optional[float] = None
+
+
+class HwpPool:
+    """
+    숨겨진(visible=False) 한/글 인스턴스 여러 개를 관리하는 풀.
+
+    인스턴스는 필요할 때 `Hwp(new=True, visible=False)`로 하나씩 생성하며,
+    with 구문으로 빌려 쓰고 돌려준다.
+    빌려줄 때마다 가벼운 호출(버전 조회)로 상태를 확인하고,
+    max_jobs번 사용했거나 작업 중 예외가 발생한 인스턴스는 종료한 후 새 인스턴스로 교체한다.
+
+    factory, health_check, close 인자에 다른 함수를 넘기면
+    한/글 없이도(가짜 백엔드로) 풀의 동작을 시험할 수 있다.
+
+    주의: 한/글 인스턴스는 COM 개체이므로, 인스턴스를 만든 스레드가 아닌 곳에서 사용하려면
+    `hwp.marshal()`로 만든 핸들을 넘겨서 `handle.unmarshal()`로 연결해야 한다.
+
+    Args:
+        size: 최대 인스턴스 개수
+        max_jobs: 인스턴스 하나당 최대 작업 횟수. 이 횟수를 채우면 새 인스턴스로 교체한다. 0이면 교체하지 않음
+        factory: 인스턴스를 만드는 함수. 기본값은 `Hwp(new=True, visible=False)`
+        health_check: 인스턴스 상태를 확인하는 함수. 예외가 발생하거나 False를 리턴하면 교체한다.
+        close: 인스턴스를 종료하는 함수. 기본값은 `hwp.quit(save=False)`
+
+    Examples:
+        >>> from pyhwpx import HwpPool
+        >>> with HwpPool(size=2, max_jobs=50) as pool:
+        ...     for path in paths:
+        ...         with pool.lease() as hwp:
+        ...             hwp.open(path)
+        ...             hwp.save_as(path.replace(".hwp", ".pdf"))
+        ...     print(pool.metrics())
+        {'size': 2, 'alive': 1, 'idle': 1, 'busy': 0, 'waiting': 0, 'jobs': 120, 'failures': 0, 'recycled': 2, 'utilization': 0.0, 'busy_ratio': 0.97}
+    """
+
+    def __init__(
+            self,
+            size: int = 2,
+            max_jobs: int = 100,
+            factory: Optional[Callable[[], Any]] = None,
+            health_check: Optional[Callable[[Any], bool]] = None,
+            close: Optional[Callable[[Any], None]] = None,
+    ):
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+        self.size = size
+        self.max_jobs = max_jobs
+        self.factory = factory or _default_factory
+        self.health_check = health_check or _default_health_check
+        self._close_func = close or _default_close
+        self._cond = threading.Condition()
+        self._idle: List[_Worker] = []
+        self._busy: Dict[int, _Worker] = {}
+        self._alive = 0
+        self._waiting = 0
+        self._closed = False
+        self._jobs = 0
+        self._failures = 0
+        self._recycled = 0
+        self._busy_seconds = 0.0
+        self._started = perf_counter()
+
+    def __repr__(self):
+        m = self.metrics()
+        return f"<HwpPool: size={m['size']}, alive={m['alive']}, busy={m['busy']}, waiting={m['waiting']}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _healthy(self, worker: _Worker) -> bool:
+        try:
+            return bool(self.health_check(worker.hwp))
+        except Exception:
+            return False
+
+    def _discard(self, worker: _Worker) -> None:
+        try:
+            self._close_func(worker.hwp)
+        except Exception:
+            pass
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        인스턴스를 하나 빌린다. 다 쓰고 나면 반드시 release로 돌려줘야 한다.
+        (가급적 lease 메서드를 with 구문으로 사용할 것)
+
+        Args:
+            timeout: 빌릴 수 있는 인스턴스가 없을 때 기다릴 최대 시간(초). None이면 무한정 기다린다.
+
+        Returns:
+            Hwp 인스턴스(또는 factory가 만든 개체)
+
+        Raises:
+            TimeoutError: timeout 안에 인스턴스를 빌리지 못한 경우
+            RuntimeError: 이미 닫힌 풀인 경우
+        """
+        deadline = None if timeout is None else perf_counter() + timeout
+        while True:
+            with self._cond:
+                self._waiting += 1
+                try:
+                    while not self._idle and self._alive >= self.size and not self._closed:
+                        remaining = None if deadline is None else deadline - perf_counter()
+                        if remaining is not None and remaining <= 0:
+                            raise TimeoutError("사용 가능한 한/글 인스턴스가 없습니다.")
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                if self._closed:
+                    raise RuntimeError("이미 닫힌 HwpPool입니다.")
+                worker = self._idle.pop() if self._idle else None
+                if worker is None:
+                    self._alive += 1  # 자리 예약 후 락 밖에서 생성
+
+            if worker is None:
+                try:
+                    worker = _Worker(self.factory())
+                except Exception:
+                    with self._cond:
+                        self._alive -= 1
+                        self._failures += 1
+                        self._cond.notify()
+                    raise
+            elif not self._healthy(worker):
+                self._discard(worker)
+                with self._cond:
+                    self._alive -= 1
+                    self._recycled += 1
+                    self._cond.notify()
+                continue
+
+            worker.leased_at = perf_counter()
+            with self._cond:
+                self._busy[id(worker.hwp)] = worker
+            return worker.hwp
+
+    def release(self, hwp: Any, failed: bool = False) -> None:
+        """
+        빌린 인스턴스를 돌려준다.
+
+        Args:
+            hwp: acquire로 빌린 인스턴스
+            failed: 작업 중 오류가 있었다면 True. 해당 인스턴스는 종료하고 교체한다.
+        """
+        with self._cond:
+            worker = self._busy.pop(id(hwp))
+            worker.jobs += 1
+            self._jobs += 1
+            self._busy_seconds += perf_counter() - worker.leased_at
+            worker.leased_at = None
+            if failed:
+                self._failures += 1
+            retire = failed or self._closed or (self.max_jobs and worker.jobs >= self.max_jobs)
+            if not retire:
+                self._idle.append(worker)
+                self._cond.notify()
+                return
+        self._discard(worker)
+        with self._cond:
+            self._alive -= 1
+            if not self._closed:
+                self._recycled += 1
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        with 구문으로 인스턴스를 빌려 쓰는 컨텍스트 매니저.
+
+        블록 안에서 예외가 발생하면 해당 인스턴스는 교체되고, 예외는 그대로 전파된다.
+
+        Args:
+            timeout: acquire의 timeout과 같음
+
+        Examples:
+            >>> with pool.lease() as hwp:
+            ...     hwp.open("a.hwp")
+        """
+        hwp = self.acquire(timeout)
+        try:
+            yield hwp
+        except BaseException:
+            self.release(hwp, failed=True)
+            raise
+        else:
+            self.release(hwp)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        풀의 현재 상태와 누적 통계를 사전으로 리턴한다.
+
+        Returns:
+            - size: 최대 인스턴스 개수
+            - alive: 현재 살아있는 인스턴스 개수
+            - idle: 대기 중인 인스턴스 개수
+            - busy: 사용 중인 인스턴스 개수
+            - waiting: 인스턴스를 기다리는 요청 수(큐 깊이)
+            - jobs: 완료된 작업 수
+            - failures: 실패한 작업(또는 생성) 수
+            - recycled: 교체된 인스턴스 수
+            - utilization: 현재 사용률(busy / size)
+            - busy_ratio: 풀 생성 이후 누적 사용률(총 사용시간 / (size * 경과시간))
+        """
+        with self._cond:
+            now = perf_counter()
+            busy_seconds = self._busy_seconds + sum(
+                now - w.leased_at for w in self._busy.values() if w.leased_at is not None
+            )
+            elapsed = max(now - self._started, 1e-9)
+            return {
+                "size": self.size,
+                "alive": self._alive,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "waiting": self._waiting,
+                "jobs": self._jobs,
+                "failures": self._failures,
+                "recycled": self._recycled,
+                "utilization": len(self._busy) / self.size,
+                "busy_ratio": round(busy_seconds / (self.size * elapsed), 4),
+            }
+
+    def close(self) -> None:
+        """
+        대기 중인 인스턴스를 모두 종료한다.
+        사용 중인 인스턴스는 돌려받는 즉시 종료된다.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._alive -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            self._discard(worker)
@@ -0,0 +1,527 @@
+from __future__ import annotations
+
+import copy
+import xml.etree.ElementTree as ET
+from typing import IO, Any, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+
+Source = Union[str, IO[bytes]]
+
+
+def cell_text(cell: ET.Element) -> str:
+    """
+    HWPML2X CELL 요소의 문자열을 리턴하는 헬퍼함수. 문단 사이는 "\\r\\n"으로 연결한다.
+    """
+    paralist = cell.find("PARALIST")
+    paras = paralist.findall("P") if paralist is not None else cell.iter("P")
+    return "\r\n".join("".join(char.text or "" for char in p.iter("CHAR")) for p in paras)
+
+
+def _margin(element: Union[ET.Element, None]) -> Tuple[int, int, int, int]:
+    if element is None:
+        return 0, 0, 0, 0
+    return tuple(int(element.get(key, 0)) for key in ("Left", "Right", "Top", "Bottom"))
+
+
+def iter_cells(source: Source) -> Iterator[Tuple[Dict[str, Any], int, ET.Element]]:
+    """
+    HWPML2X 문서(파일경로 또는 바이너리 파일객체)에서 첫 번째 최상위 표의 셀을
+    iterparse로 하나씩 읽어서 (표 정보, 행 인덱스, CELL 요소) 튜플로 내주는 제너레이터.
+
+    행(ROW)을 다 읽으면 해당 요소를 트리에서 제거하므로, 표가 아무리 커도 한 행 분량의 요소만 메모리에 남는다.
+    셀 안에 들어있는 표(중첩 표)는 해당 셀의 일부로 취급한다.
+
+    표 정보 사전의 키:
+        - RowCount, ColCount: 행/열 개수
+        - InsideMargin: 표 안쪽 여백(Left, Right, Top, Bottom) 튜플(HwpUnit)
+        - OutsideMargin: 표 바깥 여백 튜플(HwpUnit)
+        - Width, Height: 표의 너비와 높이(HwpUnit)
+    """
+    stack: List[ET.Element] = []
+    table = None
+    info: Dict[str, Any] = {}
+    row_index = -1
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if table is None and element.tag == "TABLE":
+                table = element
+            elif element.tag == "ROW" and stack and stack[-1] is table:
+                row_index += 1
+                if not info:
+                    size = table.find("SHAPEOBJECT/SIZE")
+                    info = {
+                        "RowCount": int(table.get("RowCount", 0)),
+                        "ColCount": int(table.get("ColCount", 0)),
+                        "InsideMargin": _margin(table.find("INSIDEMARGIN")),
+                        "OutsideMargin": _margin(table.find("SHAPEOBJECT/OUTSIDEMARGIN")),
+                        "Width": int(size.get("Width", 0)) if size is not None else 0,
+                        "Height": int(size.get("Height", 0)) if size is not None else 0,
+                    }
+            stack.append(element)
+            continue
+
+        stack.pop()
+        if element is table:
+            return
+        if element.tag == "ROW" and stack and stack[-1] is table:
+            for cell in element.findall("CELL"):
+                yield info, row_index, cell
+            table.remove(element)
+        elif table is None and stack:
+            stack[-1].remove(element)  # 표 앞의 요소(글꼴, 스타일 목록 등)는 바로 버린다.
+
+
+def iter_rows(source: Source) -> Iterator[List[str]]:
+    """
+    HWPML2X 문서에서 첫 번째 최상위 표의 행을 문자열 리스트로 하나씩 내주는 제너레이터.
+
+    병합된 셀(RowSpan, ColSpan)의 값은 병합된 모든 칸에 채워넣는다.(table_to_df와 같은 방식)
+    RowSpan으로 아래 행까지 이어지는 값은 다음 행으로 넘겨가며 채운다.
+    """
+    carry: List[int] = []
+    carry_text: List[str] = []
+    row: List[Union[str, None]] = []
+    current = -1
+    col_count = row_count = 0
+
+    def finish() -> List[str]:
+        for c in range(col_count):
+            if row[c] is None and carry[c] > 0:
+                row[c] = carry_text[c]
+                carry[c] -= 1
+        return ["" if value is None else value for value in row]
+
+    for info, row_index, cell in iter_cells(source):
+        if row_index != current:
+            if current >= 0:
+                yield finish()
+            if not col_count:
+                col_count, row_count = info["ColCount"], info["RowCount"]
+                carry, carry_text = [0] * col_count, [""] * col_count
+            for _ in range(row_index - current - 1):  # 셀이 하나도 없는 행(모두 위에서 병합됨)
+                row = [None] * col_count
+                yield finish()
+            current = row_index
+            row = [None] * col_count
+            for c in range(col_count):
+                if carry[c] > 0:
+                    row[c] = carry_text[c]
+                    carry[c] -= 1
+
+        row_span = int(cell.get("RowSpan", 1))
+        col_span = int(cell.get("ColSpan", 1))
+        col = cell.get("ColAddr")
+        if col is None:  # 주소가 없으면 다음 빈 칸
+            col = next((c for c in range(col_count) if row[c] is None), col_count)
+        col = int(col)
+        text = cell_text(cell)
+        for c in range(col, min(col + col_span, col_count)):
+            row[c] = text
+            if row_span > 1:
+                carry[c] = row_span - 1
+                carry_text[c] = text
+    if current >= 0:
+        yield finish()
+        for _ in range(row_count - current - 1):
+            row = [None] * col_count
+            yield finish()
+
+
+def geometry(source: Source, as_: str = "hwpunit") -> Dict[str, Any]:
+    """
+    HWPML2X 문서에서 첫 번째 최상위 표의 셀 크기, 병합, 여백을 numpy 배열로 리턴하는 함수.
+
+    모든 배열은 (행 개수, 열 개수) 모양이며, 셀의 값은 병합된 셀의 시작 칸(좌상단)에만 기록된다.
+    병합으로 가려진 칸은 width/height가 nan, row_span/col_span이 0이다.
+
+    Args:
+        source: HWPML2X 파일경로 또는 바이너리 파일객체
+        as_: 길이 단위("hwpunit", "mm", "point", "inch")
+
+    Returns:
+        - width, height: 셀 너비, 높이
+        - row_span, col_span: 병합된 행/열 개수
+        - margin_left, margin_right, margin_top, margin_bottom: 셀 안쪽 여백(셀 여백을 따로 지정하지 않은 경우 표의 안쪽 여백)
+        - col_widths, row_heights: 병합되지 않은 셀로 계산한 열 너비, 행 높이(1차원 배열)
+        - table_width, table_height: 표 전체의 너비, 높이
+        - outside_margin: 표 바깥 여백(Left, Right, Top, Bottom)
+        - border_fill: 셀의 테두리/배경 BorderFill 아이디(정수 배열)
+    """
+    factor = {"hwpunit": 1, "hu": 1, "mm": 25.4 / 7200, "point": 1 / 100, "pt": 1 / 100, "inch": 1 / 7200}
+    if as_.lower() not in factor:
+        raise KeyError("mm, hwpunit, hu, point, pt, inch 중 하나를 입력하셔야 합니다.")
+
+    records = []
+    info: Dict[str, Any] = {}
+    for info, row_index, cell in iter_cells(source):
+        if cell.get("HasMargin") == "true":
+            margin = _margin(cell.find("CELLMARGIN"))
+        else:
+            margin = info["InsideMargin"]
+        records.append((
+            row_index, int(cell.get("ColAddr", 0)),
+            int(cell.get("Width", 0)), int(cell.get("Height", 0)),
+            int(cell.get("RowSpan", 1)), int(cell.get("ColSpan", 1)),
+            *margin, int(cell.get("BorderFill", 0)),
+        ))
+    if not records:
+        raise IndexError("표를 찾을 수 없습니다.")
+
+    data = np.array(records, dtype=np.int64)
+    rows = max(info["RowCount"], int((data[:, 0] + data[:, 4]).max()))
+    cols = max(info["ColCount"], int((data[:, 1] + data[:, 5]).max()))
+    r, c = data[:, 0], data[:, 1]
+
+    def grid(column: int, fill: float, dtype=np.float64):
+        arr = np.full((rows, cols), fill, dtype=dtype)
+        arr[r, c] = data[:, column]
+        return arr
+
+    scale = factor[as_.lower()]
+    result: Dict[str, Any] = {
+        "width": grid(2, np.nan) * scale,
+        "height": grid(3, np.nan) * scale,
+        "row_span": grid(4, 0, np.int64),
+        "col_span": grid(5, 0, np.int64),
+        "margin_left": grid(6, np.nan) * scale,
+        "margin_right": grid(7, np.nan) * scale,
+        "margin_top": grid(8, np.nan) * scale,
+        "margin_bottom": grid(9, np.nan) * scale,
+        "border_fill": grid(10, 0, np.int64),
+    }
+
+    single_col = data[:, 5] == 1
+    col_widths = np.full(cols, np.nan)
+    col_widths[c[single_col]] = data[single_col, 2]
+    single_row = data[:, 4] == 1
+    row_heights = np.full(rows, np.nan)
+    row_heights[r[single_row]] = data[single_row, 3]
+    result["col_widths"] = col_widths * scale
+    result["row_heights"] = row_heights * scale
+    result["table_width"] = info["Width"] * scale
+    result["table_height"] = info["Height"] * scale
+    result["outside_margin"] = np.array(info["OutsideMargin"], dtype=np.float64) * scale
+    return result
+
+
+def top_table(root: ET.Element) -> ET.Element:
+    """
+    HWPML2X 문서 트리에서 첫 번째 최상위 TABLE 요소를 리턴하는 헬퍼함수.
+    """
+    table = root.find(".//TABLE")
+    if table is None:
+        raise IndexError("표를 찾을 수 없습니다.")
+    return table
+
+
+def iter_table_cells(table: ET.Element) -> Iterator[ET.Element]:
+    """
+    TABLE 요소의 셀을 순서대로 내주는 헬퍼함수. (셀 안의 중첩 표는 제외)
+    """
+    for row in table.findall("ROW"):
+        yield from row.findall("CELL")
+
+
+def set_col_widths(root: ET.Element, widths: List[float]) -> None:
+    """
+    HWPML2X 문서 트리의 첫 번째 표에서 열 너비를 한 번에 바꾸는 함수.
+
+    각 셀의 Width는 그 셀이 차지하는 열(ColAddr ~ ColAddr + ColSpan) 너비의 합으로,
+    표의 너비(SIZE Width)는 전체 열 너비의 합으로 바꾼다.
+
+    Args:
+        root: HWPML2X 문서 트리(ET.fromstring 결과)
+        widths: 열 너비 리스트(HwpUnit)
+    """
+    table = top_table(root)
+    col_count = int(table.get("ColCount", len(widths)))
+    if len(widths) != col_count:
+        raise IndexError(f"열 너비의 개수({len(widths)})가 표의 열 개수({col_count})와 다릅니다.")
+    edges = np.concatenate(([0], np.cumsum(np.round(widths).astype(np.int64))))
+    for cell in iter_table_cells(table):
+        col = int(cell.get("ColAddr", 0))
+        span = int(cell.get("ColSpan", 1))
+        cell.set("Width", str(int(edges[min(col + span, col_count)] - edges[col])))
+    size = table.find("SHAPEOBJECT/SIZE")
+    if size is not None:
+        size.set("Width", str(int(edges[-1])))
+
+
+def rgb_to_colorref(rgb: np.ndarray) -> np.ndarray:
+    """
+    (..., 3) 모양의 RGB 배열을 한/글 색상값(0x00BBGGRR 정수) 배열로 바꾸는 함수.
+    """
+    rgb = np.clip(np.rint(np.asarray(rgb, dtype=np.float64)), 0, 255).astype(np.int64)
+    return rgb[..., 0] | (rgb[..., 1] << 8) | (rgb[..., 2] << 16)
+
+
+def color_matrix_to_colorref(colors: Any, cmap: Any = None, vmin: float = None, vmax: float = None) -> np.ndarray:
+    """
+    셀 색상 행렬을 (행, 열) 모양의 한/글 색상값 배열로 바꾸는 함수. 색을 칠하지 않을 칸은 -1이다.
+
+    Args:
+        colors: 다음 중 하나(numpy 배열, DataFrame, 중첩 리스트)
+
+            - (행, 열, 3) 모양의 RGB 값
+            - (행, 열) 모양의 (r, g, b) 튜플 또는 "#RRGGBB" 문자열. None은 칠하지 않음
+            - (행, 열) 모양의 숫자(cmap과 함께 사용). nan은 칠하지 않음
+        cmap: 숫자 행렬에 적용할 컬러맵
+
+            - RGB 튜플의 리스트: 리스트의 색 사이를 선형보간(예: [(255, 255, 255), (255, 0, 0)])
+            - matplotlib 컬러맵 이름(예: "RdYlGn") 또는 0~1 사이의 값을 받아 RGBA(0~1)를 리턴하는 함수
+        vmin, vmax: 컬러맵의 최소/최대값. 생략하면 행렬의 최소/최대값
+    """
+    if hasattr(colors, "to_numpy"):  # DataFrame
+        colors = colors.to_numpy()
+    if cmap is not None:
+        values = np.asarray(colors, dtype=np.float64)
+        mask = np.isnan(values)
+        lo = np.nanmin(values) if vmin is None else vmin
+        hi = np.nanmax(values) if vmax is None else vmax
+        norm = np.clip((values - lo) / ((hi - lo) or 1), 0, 1)
+        norm[mask] = 0
+        if isinstance(cmap, (list, tuple)):
+            palette = np.asarray(cmap, dtype=np.float64)
+            stops = np.linspace(0, 1, len(palette))
+            rgb = np.stack([np.interp(norm, stops, palette[:, i]) for i in range(3)], axis=-1)
+        else:
+            if isinstance(cmap, str):
+                try:
+                    import matplotlib
+                except ImportError:
+                    raise ImportError("컬러맵 이름을 사용하려면 matplotlib 패키지를 설치해야 합니다. (pip install matplotlib)")
+                cmap = matplotlib.colormaps[cmap]
+            rgb = np.asarray(cmap(norm), dtype=np.float64)[..., :3] * 255
+        result = rgb_to_colorref(rgb)
+        result[mask] = -1
+        return result
+
+    try:
+        arr = np.asarray(colors)
+        if arr.ndim == 3 and arr.dtype != object:
+            return rgb_to_colorref(arr)
+    except ValueError:  # 튜플과 문자열, None이 섞인 리스트
+        pass
+    rows = [list(row) for row in colors]
+    result = np.full((len(rows), max(map(len, rows), default=0)), -1, dtype=np.int64)
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = value.lstrip("#")
+                value = (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+            result[i, j] = int(rgb_to_colorref(value))
+    return result
+
+
+def fill_cells(root: ET.Element, colors: np.ndarray, startrow: int = 0, startcol: int = 0) -> int:
+    """
+    HWPML2X 문서 트리의 첫 번째 표에서 셀 배경색을 한 번에 바꾸는 함수.
+
+    (셀의 기존 BorderFill, 색상) 조합별로 BORDERFILL을 한 번씩만 만들고(테두리는 유지),
+    각 셀의 BorderFill 속성이 새 아이디를 가리키도록 바꾼다.
+
+    Args:
+        root: HWPML2X 문서 트리
+        colors: (행, 열) 모양의 한/글 색상값 배열(color_matrix_to_colorref의 결과). -1인 칸은 바꾸지 않음
+        startrow, startcol: colors[0, 0]을 적용할 셀의 행/열 인덱스
+
+    Returns:
+        새로 만든 BORDERFILL 개수
+    """
+    table = top_table(root)
+    fill_list = root.find(".//BORDERFILLLIST")
+    if fill_list is None:
+        raise ValueError("HWPML2X 문서에 BORDERFILLLIST가 없습니다.")
+    fills = {f.get("Id"): f for f in fill_list.findall("BORDERFILL")}
+    next_id = max((int(i) for i in fills), default=0) + 1
+
+    targets = []
+    for cell in iter_table_cells(table):
+        r = int(cell.get("RowAddr", 0)) - startrow
+        c = int(cell.get("ColAddr", 0)) - startcol
+        if 0 <= r < colors.shape[0] and 0 <= c < colors.shape[1] and colors[r, c] >= 0:
+            targets.append((cell, cell.get("BorderFill", "0"), int(colors[r, c])))
+
+    created: Dict[Tuple[str, int], str] = {}
+    for cell, base_id, color in targets:
+        key = (base_id, color)
+        if key not in created:
+            base = fills.get(base_id)
+            fill = copy.deepcopy(base) if base is not None else ET.Element("BORDERFILL")
+            fill.set("Id", str(next_id))
+            brush = fill.find("FILLBRUSH")
+            if brush is None:
+                brush = ET.SubElement(fill, "FILLBRUSH")
+            for child in list(brush):
+                if child.tag != "WINDOWBRUSH":
+                    brush.remove(child)  # 그라데이션, 그림 채우기는 제거
+            window = brush.find("WINDOWBRUSH")
+            if window is None:
+                window = ET.SubElement(brush, "WINDOWBRUSH", {"Alpha": "0", "HatchColor": "10066329"})
+            window.set("FaceColor", str(color))
+            fill_list.append(fill)
+            created[key] = str(next_id)
+            next_id += 1
+        cell.set("BorderFill", created[key])
+    fill_list.set("Count", str(len(fill_list.findall("BORDERFILL"))))
+    return len(created)
+
+
+_ALIGN = {"left": "Left", "right": "Right", "center": "Center", "justify": "Justify", "distribute": "Distribute"}
+
+
+def _clone_shape(shape_list: ET.Element, shapes: Dict[str, ET.Element], base_id: str, next_id: int) -> ET.Element:
+    base = shapes.get(base_id)
+    if base is None and shapes:
+        base = next(iter(shapes.values()))
+    shape = copy.deepcopy(base) if base is not None else ET.Element(shape_list.tag[:-4])
+    shape.set("Id", str(next_id))
+    shape_list.append(shape)
+    return shape
+
+
+def fill_texts(root: ET.Element, texts: List[List[str]], aligns: Any = None, bold: Any = None) -> None:
+    """
+    HWPML2X 문서 트리의 첫 번째 표에서 모든 셀의 문자열, 문단 정렬, 진하게 여부를 한 번에 바꾸는 함수.
+
+    필요한 (기존 모양, 정렬) 및 (기존 모양, 진하게) 조합마다 PARASHAPE, CHARSHAPE를 하나씩만 만든다.
+    문자열의 "\\n"은 셀 안의 문단 나누기로 바뀐다.
+
+    Args:
+        root: HWPML2X 문서 트리
+        texts: 셀 주소(행, 열)별 문자열의 2차원 리스트. None인 칸은 바꾸지 않는다.
+        aligns: 셀별 정렬("left", "center", "right", "justify", "distribute")의 2차원 리스트. None인 칸은 유지
+        bold: 셀별 진하게 여부의 2차원 리스트
+    """
+    table = top_table(root)
+    para_list = root.find(".//PARASHAPELIST")
+    char_list = root.find(".//CHARSHAPELIST")
+    paras = {s.get("Id"): s for s in para_list.findall("PARASHAPE")} if para_list is not None else {}
+    chars = {s.get("Id"): s for s in char_list.findall("CHARSHAPE")} if char_list is not None else {}
+    next_para = max((int(i) for i in paras), default=0) + 1
+    next_char = max((int(i) for i in chars), default=0) + 1
+    para_ids: Dict[Tuple[str, str], str] = {}
+    char_ids: Dict[str, str] = {}
+
+    for cell in iter_table_cells(table):
+        r, c = int(cell.get("RowAddr", 0)), int(cell.get("ColAddr", 0))
+        if r >= len(texts) or c >= len(texts[r]) or texts[r][c] is None:
+            continue
+        paralist = cell.find("PARALIST")
+        template = paralist.find("P")
+        template = template if template is not None else ET.Element("P")
+        text_el = template.find("TEXT")
+        para_id = template.get("ParaShape", "0")
+        char_id = text_el.get("CharShape", "0") if text_el is not None else "0"
+
+        align = aligns[r][c] if aligns is not None else None
+        if align and para_list is not None:
+            key = (para_id, _ALIGN[align.lower()])
+            if key not in para_ids:
+                shape = _clone_shape(para_list, paras, para_id, next_para)
+                shape.set("Align", key[1])
+                para_ids[key] = str(next_para)
+                next_para += 1
+            para_id = para_ids[key]
+        if bold is not None and bold[r][c] and char_list is not None:
+            if char_id not in char_ids:
+                shape = _clone_shape(char_list, chars, char_id, next_char)
+                if shape.find("BOLD") is None:
+                    ET.SubElement(shape, "BOLD")
+                char_ids[char_id] = str(next_char)
+                next_char += 1
+            char_id = char_ids[char_id]
+
+        for p in paralist.findall("P"):
+            paralist.remove(p)
+        for line in str(texts[r][c]).replace("\r\n", "\n").split("\n"):
+            p = ET.SubElement(paralist, "P", dict(template.attrib))
+            p.set("ParaShape", para_id)
+            text = ET.SubElement(p, "TEXT", {"CharShape": char_id})
+            if line:
+                ET.SubElement(text, "CHAR").text = line
+
+    for shape_list in (para_list, char_list):
+        if shape_list is not None:
+            shape_list.set("Count", str(len(shape_list)))
+
+
+def styled_table_spec(
+        df: Any,
+        formats: Any = None,
+        align: Any = None,
+        fills: Any = None,
+        header_fill: Any = None,
+        header_bold: bool = True,
+        index: bool = False,
+        header0: str = "",
+        na_rep: str = "",
+) -> Dict[str, Any]:
+    """
+    데이터프레임과 서식 지정(Styler와 비슷한 형식)으로 표 전체의 셀 문자열, 정렬, 진하게, 배경색을 계산하는 함수.
+    서식은 열마다 Series.map으로 적용한다(format 문자열이나 함수는 셀마다 한 번씩 호출된다). 첫 행은 칼럼명(제목행)이다.
+
+    Args:
+        df: 데이터프레임
+        formats: 열 서식. {열이름: "{:,.0f}" 같은 format 문자열 또는 값 하나를 받는 함수} 사전,
+            또는 모든 숫자 열에 적용할 format 문자열 하나
+        align: {열이름: "left"/"center"/"right"/"justify"/"distribute"} 사전. 지정하지 않은 열은 숫자면 "right", 아니면 "center"
+        fills: 배경색. {열이름: 열(Series)을 받아 셀별 색(RGB 튜플, "#RRGGBB", None)의 리스트를 리턴하는 함수} 사전,
+            또는 데이터프레임과 같은 모양의 색 행렬(index=True이면 인덱스 열을 뺀 모양도 가능. 이 때 인덱스 열은 칠하지 않음)
+        header_fill: 제목행 배경색(RGB 튜플 또는 "#RRGGBB")
+        header_bold: 제목행을 진하게 할지 여부
+        index: 인덱스를 첫 번째 열로 넣을지 여부
+        header0: index=True일 때 첫 번째 셀의 문자열
+        na_rep: 빈 값(NaN, None)의 표시 문자열
+
+    Returns:
+        texts, aligns, bold(2차원 리스트), colors(한/글 색상값 배열, -1은 칠하지 않음), rows, cols 키를 갖는 사전
+    """
+    import pandas as pd
+
+    if index:
+        df = df.reset_index()
+        df.columns = [header0, *df.columns[1:]]
+    formats = formats or {}
+    align = align or {}
+    columns = list(df.columns)
+
+    body_texts, body_aligns = [], []
+    for name in columns:
+        s = df[name]
+        numeric = pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s)
+        fmt = formats.get(name) if isinstance(formats, dict) else (formats if numeric else None)
+        mask = s.isna()
+        if fmt is None:
+            col = s.astype(str)
+        elif callable(fmt):
+            col = s.map(fmt)
+        else:
+            col = s.map(fmt.format)
+        body_texts.append(col.where(~mask, na_rep).tolist())
+        body_aligns.append(align.get(name, "right" if numeric else "center"))
+
+    n_rows, n_cols = len(df) + 1, len(columns)
+    texts = [[str(c) for c in columns]] + [list(row) for row in zip(*body_texts)]
+    aligns = [["center"] * n_cols] + [list(body_aligns) for _ in range(len(df))]
+    bold = [[header_bold] * n_cols] + [[False] * n_cols for _ in range(len(df))]
+
+    colors = np.full((n_rows, n_cols), -1, dtype=np.int64)
+    if header_fill is not None:
+        colors[0] = color_matrix_to_colorref([[header_fill]])[0, 0]
+    if isinstance(fills, dict):
+        for j, name in enumerate(columns):
+            if name in fills:
+                colors[1:, j] = color_matrix_to_colorref([[c] for c in fills[name](df[name])])[:, 0]
+    elif fills is not None:
+        matrix = color_matrix_to_colorref(fills)
+        if index and matrix.shape == (n_rows - 1, n_cols - 1):  # 원래 데이터프레임 모양(인덱스 열 제외)
+            colors[1:, 1:] = matrix
+        elif matrix.shape == (n_rows - 1, n_cols):
+            colors[1:] = matrix
+        else:
+            raise ValueError(f"fills 행렬의 모양{matrix.shape}이 표 본문의 모양({n_rows - 1}, {n_cols})과 다릅니다.")
+    return {"texts": texts, "aligns": aligns, "bold": bold, "colors": colors, "rows": n_rows, "cols": n_cols}
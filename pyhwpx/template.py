@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import copy
+import io
+import math
+import os
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+__all__ = ["render_template", "render_xml"]
+
+# 태그: {{이름}}, {{이름:서식}}, {{#each 이름}}, {{#if 이름}}, {{#unless 이름}}, {{else}}, {{/each}}, {{/if}}, {{/unless}}
+TAG = re.compile(r"\{\{\s*([#/]?)\s*([^{}:]*?)\s*(?::([^{}]*))?\s*\}\}")
+BLOCKS = ("each", "if", "unless")
+
+# (HWPX, HWPML) 요소 이름. 네임스페이스는 무시하고 로컬 이름으로 비교한다.
+PARA = ("p", "P")
+RUN = ("run", "TEXT")
+TEXT = ("t", "CHAR")
+TABLE = ("tbl", "TABLE")
+ROW = ("tr", "ROW")
+CELL = ("tc", "CELL")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _is(el: ET.Element, names: Tuple[str, str]) -> bool:
+    return isinstance(el.tag, str) and _local(el.tag) in names
+
+
+def _segments(para: ET.Element) -> List[list]:
+    """
+    문단의 문자열 조각 목록 [요소, "text" 또는 "tail"]. 표 등 하위 컨트롤 안의 문자열은 제외한다.
+    """
+    result = []
+    for run in para:
+        if not _is(run, RUN):
+            continue
+        for t in run:
+            if not _is(t, TEXT):
+                continue
+            result.append([t, "text"])
+            for child in t:  # hp:t 안의 탭, 줄바꿈 등
+                result.append([child, "tail"])
+    return result
+
+
+def _para_text(para: ET.Element) -> str:
+    return "".join(getattr(el, attr) or "" for el, attr in _segments(para))
+
+
+def _replace(para: ET.Element, func) -> bool:
+    """
+    문단 문자열의 태그를 func(match)의 리턴값으로 바꾼다.
+    태그가 여러 조각(글자모양이 다른 run 등)에 걸쳐 있으면 첫 조각에 결과를 넣고 나머지 조각에서 지운다.
+    """
+    segments = _segments(para)
+    texts = [getattr(el, attr) or "" for el, attr in segments]
+    joined = "".join(texts)
+    matches = list(TAG.finditer(joined))
+    if not matches:
+        return False
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text)
+    for m in reversed(matches):
+        value = func(m)
+        first = True
+        for i, (start, text) in enumerate(zip(starts, texts)):
+            end = start + len(text)
+            if end <= m.start() or start >= m.end() or (not text and start != m.start()):
+                continue
+            lo, hi = max(m.start(), start) - start, min(m.end(), end) - start
+            texts[i] = text[:lo] + (value if first else "") + text[hi:]
+            first = False
+    for (el, attr), text in zip(segments, texts):
+        setattr(el, attr, text or (None if attr == "tail" else ""))
+    for child in list(para):  # 줄 배치 정보(HWPX)는 한/글이 다시 계산하도록 지운다.
+        if _local(child.tag) == "linesegarray":
+            para.remove(child)
+    return True
+
+
+class _Context:
+    def __init__(self, scopes: List[Any]):
+        self.scopes = scopes
+
+    def child(self, scope: Any) -> "_Context":
+        return _Context([scope] + self.scopes)
+
+    def lookup(self, name: str) -> Any:
+        head, *rest = name.split(".")
+        for scope in self.scopes:
+            found, value = _get(scope, head)
+            if found:
+                break
+        else:
+            return None
+        for part in rest:
+            _, value = _get(value, part)
+        return value
+
+    def format(self, name: str, spec: Optional[str]) -> str:
+        value = self.lookup(name)
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return ""
+        if spec:
+            try:
+                return format(value, spec)
+            except (TypeError, ValueError):
+                pass
+        return str(value)
+
+    def truthy(self, name: str) -> bool:
+        value = self.lookup(name)
+        if hasattr(value, "empty"):  # DataFrame, Series
+            return not value.empty
+        if isinstance(value, float) and math.isnan(value):
+            return False
+        return bool(value)
+
+    def records(self, name: str) -> List[Any]:
+        value = self.lookup(name)
+        if value is None:
+            return []
+        if hasattr(value, "to_dict") and hasattr(value, "columns"):  # DataFrame
+            return value.to_dict("records")
+        if isinstance(value, Mapping):
+            return [value]
+        return list(value)
+
+
+def _get(scope: Any, key: str) -> Tuple[bool, Any]:
+    if isinstance(scope, Mapping):
+        return (key in scope), scope.get(key)
+    if isinstance(scope, Sequence) and not isinstance(scope, str) and key.isdigit():
+        return int(key) < len(scope), scope[int(key)] if int(key) < len(scope) else None
+    if hasattr(scope, key):
+        return True, getattr(scope, key)
+    return False, None
+
+
+def _marker(text: str) -> Optional[Tuple[str, str]]:
+    """
+    문자열이 블록 태그 하나뿐이면 ("#each", 이름) 형태로 리턴한다.
+    """
+    m = TAG.fullmatch(text.strip())
+    if not m:
+        return None
+    sign, name = m.group(1), m.group(2)
+    if sign and name.split(" ")[0] in BLOCKS:
+        keyword, _, arg = name.partition(" ")
+        return sign + keyword, arg.strip()
+    if not sign and name == "else":
+        return "else", ""
+    return None
+
+
+def _row_markers(row: ET.Element) -> List[Tuple[str, str]]:
+    markers = []
+    for para in row.iter():
+        if _is(para, PARA):
+            for m in TAG.finditer(_para_text(para)):
+                marker = _marker(m.group(0))
+                if marker:
+                    markers.append(marker)
+    return markers
+
+
+def _strip_markers(row: ET.Element) -> None:
+    for para in row.iter():
+        if _is(para, PARA):
+            _replace(para, lambda m: "" if _marker(m.group(0)) else m.group(0))
+
+
+def _parse_blocks(items: List[ET.Element], markers, keep: bool) -> List[Any]:
+    """
+    형제 요소 목록을 블록 구조로 묶는다. 결과는 요소 또는 [종류, 이름, 본문, else본문] 목록의 목록
+
+    Args:
+        items: 문단 또는 표의 행 목록
+        markers: 요소의 블록 태그 목록을 리턴하는 함수
+        keep: 태그가 있는 요소도 남길지 여부(표의 행은 남기고, 태그만 있는 문단은 지운다.)
+    """
+    root: List[Any] = []
+    stack: List[list] = []
+
+    def target() -> List[Any]:
+        if not stack:
+            return root
+        return stack[-1][2] if stack[-1][3] is None else stack[-1][3]
+
+    for item in items:
+        found = markers(item)
+        placed = bool(found) and not keep
+        for kind, name in found:
+            if kind.startswith("#"):
+                block = [kind[1:], name, [], None]
+                target().append(block)
+                stack.append(block)
+            elif not stack:
+                raise ValueError(f"짝이 맞지 않는 태그입니다: {{{{{kind}}}}}")
+            elif kind == "else":
+                stack[-1][3] = []
+            else:
+                if not placed:
+                    target().append(item)
+                    placed = True
+                stack.pop()
+        if not placed:
+            target().append(item)
+    if stack:
+        raise ValueError(f"{{{{/{stack[-1][0]}}}}} 태그가 없습니다: {{{{#{stack[-1][0]} {stack[-1][1]}}}}}")
+    return root
+
+
+def _para_markers(item: ET.Element) -> List[Tuple[str, str]]:
+    if _is(item, PARA) and not any(_is(el, TABLE) for el in item.iter()):
+        marker = _marker(_para_text(item))
+        if marker:
+            return [marker]
+    return []
+
+
+def _expand(blocks: List[Any], ctx: _Context) -> Iterator[Tuple[ET.Element, _Context]]:
+    for block in blocks:
+        if not isinstance(block, list):
+            yield block, ctx
+            continue
+        kind, name, body, orelse = block
+        if kind == "each":
+            records = ctx.records(name)
+            for i, record in enumerate(records):
+                child = ctx.child(record).child({"@index": i, "@number": i + 1,
+                                                 "@first": i == 0, "@last": i == len(records) - 1})
+                for item, item_ctx in _expand(body, child):
+                    yield copy.deepcopy(item), item_ctx
+            if not records and orelse:
+                yield from _expand(orelse, ctx)
+        else:
+            truth = ctx.truthy(name)
+            if kind == "unless":
+                truth = not truth
+            yield from _expand(body if truth else (orelse or []), ctx)
+
+
+def _render_container(container: ET.Element, ctx: _Context) -> None:
+    children = list(container)
+    if not any(_is(child, PARA) for child in children):
+        for child in children:
+            _render_element(child, ctx)
+        return
+    blocks = _parse_blocks(children, _para_markers, keep=False)
+    for child in children:
+        container.remove(child)
+    for item, item_ctx in _expand(blocks, ctx):
+        container.append(item)
+        _render_element(item, item_ctx)
+
+
+def _render_table(table: ET.Element, ctx: _Context) -> None:
+    rows = [child for child in table if _is(child, ROW)]
+    if not rows:
+        return
+    first = list(table).index(rows[0])
+    blocks = _parse_blocks(rows, _row_markers, keep=True)
+    for row in rows:
+        table.remove(row)
+    hwpx = _local(table.tag) == "tbl"
+    new_rows = []
+    for k, (row, row_ctx) in enumerate(_expand(blocks, ctx)):
+        delta = k - _origin(row, hwpx)
+        _strip_markers(row)
+        for cell in row:
+            if _is(cell, CELL):
+                _shift_row(cell, delta, hwpx)
+        table.insert(first + k, row)
+        new_rows.append(row)
+        for cell in row:
+            _render_container_tree(cell, row_ctx)
+    if hwpx:
+        table.set("rowCnt", str(len(new_rows)))
+    else:
+        table.set("RowCount", str(len(new_rows)))
+
+
+def _origin(row: ET.Element, hwpx: bool) -> int:
+    # 반복된 행은 원래 행의 사본이므로 셀 주소에서 원래 행 번호를 읽는다.
+    for cell in row:
+        if _is(cell, CELL):
+            return _row_addr(cell, hwpx)
+    return 0
+
+
+def _row_addr(cell: ET.Element, hwpx: bool) -> int:
+    if hwpx:
+        for child in cell:
+            if _local(child.tag) == "cellAddr":
+                return int(child.get("rowAddr", 0))
+        return 0
+    return int(cell.get("RowAddr", 0))
+
+
+def _shift_row(cell: ET.Element, delta: int, hwpx: bool) -> None:
+    if not delta:
+        return
+    if hwpx:
+        for child in cell:
+            if _local(child.tag) == "cellAddr":
+                child.set("rowAddr", str(int(child.get("rowAddr", 0)) + delta))
+    else:
+        cell.set("RowAddr", str(int(cell.get("RowAddr", 0)) + delta))
+
+
+def _render_container_tree(el: ET.Element, ctx: _Context) -> None:
+    # 셀(CELL/PARALIST, tc/subList) 안의 문단 목록을 찾아서 렌더링한다.
+    if any(_is(child, PARA) for child in el):
+        _render_container(el, ctx)
+    else:
+        for child in el:
+            if isinstance(child.tag, str):
+                _render_container_tree(child, ctx)
+
+
+def _render_element(el: ET.Element, ctx: _Context) -> None:
+    if _is(el, PARA):
+        _replace(el, lambda m: m.group(0) if _marker(m.group(0)) else ctx.format(m.group(2), m.group(3)))
+        for run in el:
+            for child in run:
+                _render_element(child, ctx)
+    elif _is(el, TABLE):
+        _render_table(el, ctx)
+    elif isinstance(el.tag, str):
+        _render_container_tree(el, ctx)
+
+
+def _source_prefixes(data: bytes) -> dict:
+    # 원본 XML에 선언된 {uri: 접두어}. (ET.register_namespace는 전역 상태를 바꾸므로 사용하지 않는다.)
+    prefixes = {}
+    for _, (prefix, uri) in ET.iterparse(io.BytesIO(data), events=("start-ns",)):
+        if prefix:
+            prefixes.setdefault(uri, prefix)
+    return prefixes
+
+
+def _tostring(root: ET.Element, prefixes: Mapping[str, str]) -> bytes:
+    # ET.tostring과 같지만, 네임스페이스 접두어를 전역 등록표 대신 prefixes(원본의 접두어)에서 가져온다.
+    qnames = {None: None}
+    namespaces = {}
+    used = set(prefixes.values())
+
+    def add_qname(qname: str) -> None:
+        if qname[:1] != "{":
+            qnames[qname] = qname
+            return
+        uri, local = qname[1:].rsplit("}", 1)
+        prefix = namespaces.get(uri)
+        if prefix is None:
+            prefix = prefixes.get(uri) or ET._namespace_map.get(uri)  # xml 등 표준 접두어
+            if prefix is None:
+                i = len(namespaces)
+                while f"ns{i}" in used:
+                    i += 1
+                prefix = f"ns{i}"
+                used.add(prefix)
+            if prefix != "xml":
+                namespaces[uri] = prefix
+        qnames[qname] = f"{prefix}:{local}"
+
+    for el in root.iter():
+        tag = el.tag.text if isinstance(el.tag, ET.QName) else el.tag
+        if isinstance(tag, str) and tag not in qnames:
+            add_qname(tag)
+        for key in el.keys():
+            key = key.text if isinstance(key, ET.QName) else key
+            if key not in qnames:
+                add_qname(key)
+    chunks = []
+    ET._serialize_xml(chunks.append, root, qnames, namespaces, short_empty_elements=True)
+    return "".join(chunks).encode("utf-8")
+
+
+def render_xml(data: Union[str, bytes], context: Mapping[str, Any]) -> bytes:
+    """
+    HWPX의 section XML 또는 HWPML(.hml) 문자열 하나를 렌더링해서 바이트로 리턴한다.
+    태그 문법은 render_template 참고.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    prefixes = _source_prefixes(data)
+    root = ET.fromstring(data)
+    ctx = _Context([context])
+    if _local(root.tag) == "HWPML":
+        for section in [el for el in root.iter() if _local(el.tag) == "SECTION"]:
+            _render_container(section, ctx)
+    else:
+        _render_container(root, ctx)
+    declaration = b'<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+    return declaration + _tostring(root, prefixes)
+
+
+def render_template(
+        template: Union[str, bytes, os.PathLike],
+        context: Mapping[str, Any],
+        output: Optional[Union[str, os.PathLike]] = None,
+) -> Union[bytes, str]:
+    """
+    한/글 없이 HWPX(.hwpx) 또는 HWPML(.hml) 서식파일을 데이터로 채우는 템플릿 엔진.
+
+    put_field_text는 서식에 이미 있는 누름틀만 채울 수 있어서, 길이가 정해지지 않은 데이터는
+    TableAppendRow와 insert_text를 셀마다 반복해야 했다.
+    render_template은 파일 안의 XML을 메모리에서 직접 고치므로,
+    5천 행짜리 보고서라도 결과 파일을 한 번 열기만(hwp.render_template) 하면 된다.
+
+    본문에 아래의 태그를 입력해서 서식파일을 만든다.(태그 중간에 글자모양이 바뀌어도 된다.)
+
+        - `{{이름}}`: 값으로 바꾼다. `{{고객.주소}}`처럼 점으로 하위 항목을, `{{금액:,}}`처럼 콜론 뒤에 파이썬 서식을 지정할 수 있다.
+        - `{{#each 목록}}` ~ `{{/each}}`: 목록(DataFrame, 사전의 리스트 등)의 항목마다 반복한다.
+          반복 안에서는 항목의 키(DataFrame 열 이름)와 `{{@number}}`(1부터), `{{@index}}`(0부터)를 쓸 수 있다.
+            - 태그만 있는 문단 사이의 문단들을 반복하거나,
+            - 표의 행에 태그를 넣으면 해당 행(들)을 반복한다. 한 행에 `{{#each 목록}}`과 `{{/each}}`를 모두 넣으면 그 행만 반복한다.
+        - `{{#if 이름}}` ~ `{{else}}` ~ `{{/if}}`, `{{#unless 이름}}` ~ `{{/unless}}`: 값이 있을 때(없을 때)만 남긴다. 문단/표의 행 단위로 쓴다.
+
+    Args:
+        template: 서식파일 경로 또는 파일 내용(bytes)
+        context: 값 사전. 키가 태그의 이름이 된다.
+        output: 결과파일 경로. 생략하면 결과를 bytes로 리턴한다.
+
+    Returns:
+        output이 있으면 그 경로를, 없으면 결과파일의 내용(bytes)
+
+    Examples:
+        >>> import pandas as pd
+        >>> from pyhwpx import render_template
+        >>> # 서식: "{{부서}} 실적 보고" 문단과, 2행짜리 표(제목행 + "{{#each 실적}}{{@number}} | {{품목}} | {{금액:,}}{{/each}}" 행)
+        >>> df = pd.DataFrame({"품목": ["사과", "배"], "금액": [1500, 3000]})
+        >>> render_template("서식.hwpx", {"부서": "영업1팀", "실적": df}, "결과.hwpx")
+        '결과.hwpx'
+    """
+    if isinstance(template, (bytes, bytearray)):
+        data = bytes(template)
+    else:
+        with open(template, "rb") as f:
+            data = f.read()
+
+    if data[:2] == b"PK":
+        result = io.BytesIO()
+        with zipfile.ZipFile(io.BytesIO(data)) as src, zipfile.ZipFile(result, "w") as dst:
+            for info in src.infolist():  # mimetype이 맨 앞에 무압축으로 있어야 하므로 원래 순서와 압축방식을 유지
+                content = src.read(info)
+                if re.fullmatch(r"Contents/section\d+\.xml", info.filename):
+                    content = render_xml(content, context)
+                dst.writestr(info, content)
+        rendered = result.getvalue()
+    else:
+        rendered = render_xml(data, context)
+
+    if output is None:
+        return rendered
+    with open(output, "wb") as f:
+        f.write(rendered)
+    return os.fspath(output)
@@ -0,0 +1,113 @@
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+Position = Tuple[int, int, int]
+
+
+class TextIndex:
+    """
+    문서 텍스트의 위치 기반 역색인(inverted index).
+
+    `hwp.search` 메서드 내부에서 사용되며, 직접 사용할 일은 거의 없다.
+    문서를 한 번 스캔해서 얻은 (list, para, pos, text) 조각마다
+    n-gram과 토큰(공백 기준)을 색인해둔다.
+    n-gram 색인으로는 부분 문자열 검색의 후보 조각만 확인하고,
+    토큰 색인에는 토큰마다 실제 시작위치를 저장해두므로 단어 검색은 색인만으로 끝난다.
+
+    build 메서드는 매번 색인 전체를 새로 만든다.
+
+    Args:
+        ngram: n-gram의 길이. 기본값은 2(bigram)
+
+    Examples:
+        >>> from pyhwpx.text_index import TextIndex
+        >>> index = TextIndex()
+        >>> index.build([(0, 0, 0, "가나다라"), (0, 1, 0, "다라 마바")])
+        2
+        >>> index.search("다라")
+        [(0, 0, 2), (0, 1, 0)]
+        >>> index.search_token("마바")
+        [(0, 1, 3)]
+    """
+
+    def __init__(self, ngram: int = 2):
+        self.ngram = ngram
+        self.entries: List[Tuple[Position, str]] = []
+        self.grams: Dict[str, Set[int]] = {}
+        self.tokens: Dict[str, List[Position]] = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"<TextIndex: entries={len(self.entries)}, grams={len(self.grams)}, tokens={len(self.tokens)}>"
+
+    def build(self, chunks: Iterable[Tuple[int, int, int, str]]) -> int:
+        """
+        문서 스캔 결과로 색인을 새로 만든다.
+
+        Args:
+            chunks: (list, para, pos, text) 튜플의 이터러블(문서 순서)
+
+        Returns:
+            색인한 조각 수
+        """
+        n = self.ngram
+        self.entries = []
+        self.grams = {}
+        self.tokens = {}
+        for entry_id, (list_, para, pos, text) in enumerate(chunks):
+            self.entries.append(((list_, para, pos), text))
+            for i in range(len(text) - n + 1):
+                self.grams.setdefault(text[i: i + n], set()).add(entry_id)
+            for match in re.finditer(r"\S+", text):
+                self.tokens.setdefault(match.group(), []).append((list_, para, pos + match.start()))
+        return len(self.entries)
+
+    def candidates(self, query: str) -> Set[int]:
+        """
+        query를 포함할 수 있는 조각의 id 집합을 리턴한다.
+        """
+        if len(query) < self.ngram:
+            return set(range(len(self.entries)))
+        n = self.ngram
+        postings = []
+        for i in range(len(query) - n + 1):
+            ids = self.grams.get(query[i: i + n])
+            if not ids:
+                return set()
+            postings.append(ids)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def search_token(self, token: str) -> List[Position]:
+        """
+        공백으로 구분된 토큰과 정확히 일치하는 모든 위치(토큰의 시작위치)를 리턴한다.
+        """
+        return sorted(self.tokens.get(token, ()))
+
+    def search(self, query: str) -> List[Position]:
+        """
+        query가 나타나는 모든 위치를 (list, para, pos) 튜플의 리스트로 리턴한다.
+
+        Args:
+            query: 찾을 문자열(문단을 넘어가지 않는 문자열)
+
+        Returns:
+            (list, para, pos) 튜플의 리스트. 위치 순으로 정렬된다.
+        """
+        if not query:
+            return []
+        hits = []
+        for entry_id in self.candidates(query):
+            (list_, para, pos), text = self.entries[entry_id]
+            start = text.find(query)
+            while start != -1:
+                hits.append((list_, para, pos + start))
+                start = text.find(query, start + len(query))
+        return sorted(hits)
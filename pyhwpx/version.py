@@ -1 +1 @@
-__version__ = "1.7.2"
+__version__ = "1.8.0"
@@ -0,0 +1,81 @@
+import os
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyhwpx import DownloadCache
+
+BODY = b"HWP Document File" * 100
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        etag = '"v1"'
+        Handler.hits.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.hits = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_conditional_request_and_offline(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/files/form.hwp"
+    cache = DownloadCache(str(tmp_path / "cache"))
+    first = cache.fetch(url)
+    second = cache.fetch(url)
+    assert first == second and open(first, "rb").read() == BODY
+    assert first.endswith(".hwp")
+    assert Handler.hits == [("/files/form.hwp", None), ("/files/form.hwp", '"v1"')]
+
+    copy = cache.copy_to(url, directory=str(tmp_path))
+    assert os.path.basename(copy) == "form.hwp" and open(copy, "rb").read() == BODY
+
+    server.shutdown()
+    server.server_close()
+    assert cache.fetch(url, timeout=1) == first  # 오프라인이면 캐시 사용
+    with pytest.raises(urllib.error.URLError):
+        cache.fetch(f"http://127.0.0.1:{server.server_port}/other.hwp", timeout=1)
+
+
+def test_concurrent_index_updates(server, tmp_path):
+    base = f"http://127.0.0.1:{server.server_port}"
+    caches = [DownloadCache(str(tmp_path / "cache")) for _ in range(4)]  # 같은 폴더를 쓰는 별개의 캐시
+    urls = [f"{base}/{i}.hwp" for i in range(40)]
+    threads = [threading.Thread(target=lambda c=c, i=i: [c.fetch(u) for u in urls[i::4]])
+               for i, c in enumerate(caches)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert set(caches[0]._load()) == set(urls)
+
+
+def test_prune(server, tmp_path):
+    cache = DownloadCache(str(tmp_path / "cache"))
+    cache.fetch(f"http://127.0.0.1:{server.server_port}/a.hwp")
+    cache.clear()
+    assert cache._load() == {}
+    assert not [name for name in os.listdir(cache.directory) if name.endswith(".hwp")]
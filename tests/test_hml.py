@@ -0,0 +1,48 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from pyhwpx import hml
+
+
+def _cells(root):
+    return [(int(c.get("RowAddr")), int(c.get("ColAddr")), int(c.get("RowSpan")), int(c.get("ColSpan")))
+            for c in root.iter("CELL")]
+
+
+def test_to_string_structure():
+    doc = hml.Document(font="맑은 고딕", size=10)
+    title = doc.char_shape(size=16, bold=True)
+    doc.paragraph("월간 보고서", char_shape=title, align="center")
+    doc.paragraph("담당자: ").field("담당자", "홍길동")
+    doc.table([["구분", "금액"], ["1월", "1,000"]], col_widths=[40, 60])
+    root = ET.fromstring(doc.to_string())
+    assert root.tag == "HWPML"
+    assert root.find("HEAD") is not None and root.find("BODY") is not None
+    text = "".join(t.text or "" for t in root.iter("CHAR"))
+    assert "월간 보고서" in text and "1,000" in text
+    assert len(list(root.iter("TABLE"))) == 1
+    # 같은 설정의 글자모양은 한 번만 등록된다.
+    assert doc.char_shape(size=16, bold=True) == title
+
+
+def test_merge_and_remerge():
+    doc = hml.Document()
+    table = doc.table(rows=3, cols=3)
+    table.merge(0, 0, 2, 2).text = "A"
+    assert table.cell(1, 1).text == "A"
+    table.merge(0, 0, 1, 2)  # 같은 셀의 병합 범위 변경
+    assert table.cell(1, 0) is not table.cell(0, 0)
+    table.merge(1, 0, 2, 3)
+    root = ET.fromstring(doc.to_string())
+    assert _cells(root) == [(0, 0, 1, 2), (0, 2, 1, 1), (1, 0, 2, 3)]
+    with pytest.raises(ValueError):
+        table.merge(0, 1, 2, 1)
+
+
+@pytest.mark.parametrize("args", [(0, 0, 0, 1), (0, 0, 1, -1), (2, 0, 2, 1), (0, 2, 1, 2), (-1, 0, 1, 1)])
+def test_merge_rejects_invalid_span(args):
+    table = hml.Document().table(rows=3, cols=3)
+    with pytest.raises(ValueError):
+        table.merge(*args)
+    assert all(cell.row_span == cell.col_span == 1 for cell in table.cells.values())
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from pyhwpx import HwpPool
+
+
+class FakeHwp:
+    count = 0
+
+    def __init__(self):
+        FakeHwp.count += 1
+        self.id = FakeHwp.count
+        self.closed = False
+        self.healthy = True
+
+
+def make_pool(**kwargs):
+    closed = []
+
+    def close(hwp):
+        hwp.closed = True
+        closed.append(hwp.id)
+
+    pool = HwpPool(factory=FakeHwp, health_check=lambda hwp: hwp.healthy, close=close, **kwargs)
+    return pool, closed
+
+
+def test_recycle_after_max_jobs():
+    pool, closed = make_pool(size=1, max_jobs=2)
+    ids = []
+    for _ in range(5):
+        with pool.lease() as hwp:
+            ids.append(hwp.id)
+    assert ids[0] == ids[1] != ids[2] == ids[3] != ids[4]
+    assert closed == [ids[0], ids[2]]
+    m = pool.metrics()
+    assert (m["jobs"], m["recycled"], m["alive"], m["failures"]) == (5, 2, 1, 0)
+    pool.close()
+    assert pool.metrics()["alive"] == 0 and len(closed) == 3
+
+
+def test_failure_and_health_check_replace_instance():
+    pool, closed = make_pool(size=1, max_jobs=0)
+    with pytest.raises(RuntimeError):
+        with pool.lease() as hwp:
+            first = hwp.id
+            raise RuntimeError("boom")
+    with pool.lease() as hwp:
+        second = hwp.id
+        hwp.healthy = False
+    with pool.lease() as hwp:
+        third = hwp.id
+    assert len({first, second, third}) == 3
+    m = pool.metrics()
+    assert (m["failures"], m["recycled"]) == (1, 2)
+
+
+def test_acquire_timeout_and_waiting():
+    pool, _ = make_pool(size=1)
+    hwp = pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    got = []
+    t = threading.Thread(target=lambda: got.append(pool.acquire(timeout=5)))
+    t.start()
+    for _ in range(100):
+        if pool.metrics()["waiting"]:
+            break
+        time.sleep(0.01)
+    assert pool.metrics()["waiting"] == 1
+    pool.release(hwp)
+    t.join()
+    assert got == [hwp]
+    assert pool.metrics()["busy"] == 1
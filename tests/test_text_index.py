@@ -0,0 +1,20 @@
+from pyhwpx.text_index import TextIndex
+
+
+def test_search_and_token_positions():
+    index = TextIndex()
+    assert index.build([(0, 0, 0, "예산 집행 예산안"), (3, 1, 5, "총 예산")]) == 2
+    assert index.search("예산") == [(0, 0, 0), (0, 0, 6), (3, 1, 7)]
+    # 토큰 색인은 조각의 시작위치가 아니라 토큰의 실제 위치를 저장한다.
+    assert index.search_token("예산") == [(0, 0, 0), (3, 1, 7)]
+    assert index.search_token("집행") == [(0, 0, 3)]
+    assert index.search_token("예") == []
+
+
+def test_build_replaces_previous_index():
+    index = TextIndex()
+    index.build([(0, 0, 0, "가나다")])
+    index.build([(0, 0, 0, "라마바")])
+    assert index.search("가나") == []
+    assert index.search_token("가나다") == []
+    assert index.search("마바") == [(0, 0, 1)]
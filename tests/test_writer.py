@@ -0,0 +1,31 @@
+import pytest
+
+from pyhwpx.writer import HwpWriter
+
+
+class FakeHwp:
+    def __init__(self):
+        self.inserted = []
+
+    def set_text_file(self, data, format, option):
+        self.inserted.append((format, data))
+        return True
+
+
+def test_flush_on_exit():
+    hwp = FakeHwp()
+    with HwpWriter(hwp) as w:
+        w.write("가나다")
+        w.paragraph("라마")
+    assert hwp.inserted == [("UNICODE", "가나다라마\r\n")]
+    assert w.pending == 0
+
+
+def test_discard_on_exception():
+    hwp = FakeHwp()
+    with pytest.raises(KeyError):
+        with HwpWriter(hwp) as w:
+            w.write("버려질 문자열")
+            raise KeyError("중단")
+    assert hwp.inserted == []
+    assert w.pending == 0